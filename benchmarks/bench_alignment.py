@@ -0,0 +1,50 @@
+"""
+Throughput of the news -> trading-session alignment stage.
+
+Times ``align_to_sessions`` against per-stock calendars, then the daily
+aggregation and return join, on a synthetic analyst feed.
+
+    python -m benchmarks.bench_alignment --rows 2000000
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic import make_news_frame, make_ohlcv
+from src.analysis.news_alignment import (aggregate_daily_sentiment,
+                                         align_to_sessions, join_daily_returns,
+                                         trading_calendar)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--stocks', type=int, default=500)
+    args = parser.parse_args(argv)
+
+    news = make_news_frame(args.rows, n_stocks=args.stocks)
+    news['sentiment'] = np.random.default_rng(0).normal(size=args.rows)
+    prices = pd.concat([
+        make_ohlcv(2800, seed=i, start='2011-01-03').assign(ticker=ticker)
+        for i, ticker in enumerate(news['stock'].unique())])
+    calendar = trading_calendar(prices)
+
+    print(f"{args.rows} headlines, {args.stocks} stocks")
+    print(f"{'stage':<12}{'seconds':>10}{'rows/s':>14}")
+    start = time.perf_counter()
+    aligned = align_to_sessions(news, calendar)
+    elapsed = time.perf_counter() - start
+    print(f"{'align':<12}{elapsed:>10.2f}{args.rows / elapsed:>14,.0f}")
+
+    start = time.perf_counter()
+    daily = aggregate_daily_sentiment(aligned)
+    joined = join_daily_returns(daily, prices)
+    elapsed = time.perf_counter() - start
+    print(f"{'aggregate':<12}{elapsed:>10.2f}{args.rows / elapsed:>14,.0f}")
+    print(f"{len(daily)} stock-days with news, {len(joined)} with returns")
+
+
+if __name__ == '__main__':
+    main()
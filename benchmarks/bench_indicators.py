@@ -0,0 +1,64 @@
+"""
+Parity and speed of the indicator backends (TA-Lib, NumPy, ``ta``).
+
+Parity is the largest absolute difference from the NumPy backend, measured
+after a warm-up (``ta`` seeds its EMAs differently). Speed covers one call
+each of SMA, EMA, RSI and MACD.
+
+    python -m benchmarks.bench_indicators --days 5000 --tickers 200
+"""
+import argparse
+import time
+
+import numpy as np
+
+from benchmarks.synthetic import make_ohlcv
+from scripts.indicators import available_backends, get_backend
+
+PERIODS = {'sma': 20, 'ema': 20, 'rsi': 14}
+
+
+def run_all(backend, close):
+    out = {name: getattr(backend, name)(close, period)
+           for name, period in PERIODS.items()}
+    out['macd'], out['macd_signal'], out['macd_hist'] = backend.macd(close)
+    return out
+
+
+def timed(backend, close, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run_all(backend, close)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--days', type=int, default=5000)
+    parser.add_argument('--tickers', type=int, default=100)
+    parser.add_argument('--warmup', type=int, default=300)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    single = make_ohlcv(args.days)['Close'].to_numpy()
+    panel = np.column_stack([make_ohlcv(args.days, seed=i)['Close'].to_numpy()
+                             for i in range(args.tickers)])
+    reference = run_all(get_backend('numpy'), single)
+
+    print(f"{'backend':<8}{'1 ticker ms':>13}{f'{args.tickers} tickers ms':>18}"
+          f"{'max |diff|':>14}")
+    for name in available_backends():
+        backend = get_backend(name)
+        one = timed(backend, single, args.repeat) * 1e3
+        many = timed(backend, panel, max(1, args.repeat // 2)) * 1e3
+        result = run_all(backend, single)
+        diff = max(np.nanmax(np.abs(result[k][args.warmup:]
+                                    - reference[k][args.warmup:]))
+                   for k in reference)
+        print(f"{name:<8}{one:>13.2f}{many:>18.1f}{diff:>14.2e}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""
+Pickled DataFrames vs a shared memory-mapped store for universe workers.
+
+    python -m benchmarks.bench_mapped_prices --tickers 200 --days 5000
+
+Reports the bytes each task sends to a worker (a pickled OHLCV frame vs the
+pickled ``MappedPrices`` handle) and the time to run the indicators over the
+universe from CSV files and from the store.
+"""
+import argparse
+import os
+import pickle
+import tempfile
+import time
+
+from benchmarks.synthetic import write_ticker_csvs
+from scripts.universe import compute_universe_indicators
+from src.data.price_arrays import write_mapped_prices
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--tickers', type=int, default=200)
+    parser.add_argument('--days', type=int, default=5000)
+    parser.add_argument('--workers', type=int, default=2)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_dir = os.path.join(tmp, 'csv')
+        os.makedirs(csv_dir)
+        write_ticker_csvs(csv_dir, args.tickers, args.days)
+
+        start = time.perf_counter()
+        store = write_mapped_prices(csv_dir, os.path.join(tmp, 'mapped'))
+        build = time.perf_counter() - start
+
+        ticker = store.tickers[0]
+        frame_bytes = len(pickle.dumps(store.frame(ticker).copy()))
+        handle_bytes = len(pickle.dumps(store))
+        print(f"{args.tickers} tickers x {args.days} days, {args.workers} "
+              f"workers, {os.cpu_count()} CPUs; store {store.nbytes / 2**20:.1f}"
+              f" MiB built in {build:.2f}s")
+        print(f"bytes per task: DataFrame {frame_bytes:,}, "
+              f"store handle {handle_bytes:,}")
+
+        timings = {}
+        for label, sources in (('csv files', csv_dir), ('mapped store', store)):
+            start = time.perf_counter()
+            compute_universe_indicators(sources, max_workers=args.workers)
+            timings[label] = time.perf_counter() - start
+        for label, elapsed in timings.items():
+            print(f"{label:>14}: {elapsed:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
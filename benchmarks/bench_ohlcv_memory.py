@@ -0,0 +1,70 @@
+"""
+Memory of per-ticker OHLCV frames with indicators: float64 vs float32.
+
+Loads N synthetic tickers with the old untyped ``pd.read_csv`` path and
+with the typed OHLCV schema, adds the indicator columns to both, and
+reports the bytes held and the largest indicator deviation.
+
+    python -m benchmarks.bench_ohlcv_memory --tickers 500 --days 2500
+"""
+import argparse
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic import write_ticker_csvs
+from scripts.technical_analysis import calculate_technical_indicators
+from src.data.stock_loader import frame_nbytes, load_stock_data
+
+INDICATORS = ['SMA_20', 'RSI', 'MACD', 'MACD_Signal', 'MACD_Hist']
+
+
+def load_untyped(path):
+    # The loader before the typed schema: float64/int64, parsed afterwards.
+    df = pd.read_csv(path)
+    df['Date'] = pd.to_datetime(df['Date'])
+    return df.set_index('Date')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--tickers', type=int, default=200)
+    parser.add_argument('--days', type=int, default=2500)
+    parser.add_argument('--backend', default='numpy')
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = write_ticker_csvs(tmp, args.tickers, args.days)
+        results = {}
+        for name, loader in (('float64', load_untyped),
+                             ('float32', load_stock_data)):
+            start = time.perf_counter()
+            frames = [calculate_technical_indicators(loader(p), args.backend)
+                      for p in paths]
+            results[name] = (frames, time.perf_counter() - start)
+
+    wide, wide_time = results['float64']
+    narrow, narrow_time = results['float32']
+    wide_bytes = sum(frame_nbytes(df) for df in wide)
+    narrow_bytes = sum(frame_nbytes(df) for df in narrow)
+    print(f"{args.tickers} tickers x {args.days} days, "
+          f"{len(wide[0].columns)} columns")
+    print(f"{'schema':<10}{'MiB':>10}{'load+ind s':>12}")
+    print(f"{'float64':<10}{wide_bytes / 2**20:>10.1f}{wide_time:>12.2f}")
+    print(f"{'float32':<10}{narrow_bytes / 2**20:>10.1f}{narrow_time:>12.2f}")
+    print(f"saved {wide_bytes - narrow_bytes:,} bytes "
+          f"({1 - narrow_bytes / wide_bytes:.0%})")
+
+    print(f"\n{'indicator':<14}{'max abs diff':>14}{'max rel diff':>14}")
+    for column in INDICATORS:
+        a = np.concatenate([df[column].to_numpy(np.float64) for df in wide])
+        b = np.concatenate([df[column].to_numpy(np.float64) for df in narrow])
+        diff = np.nanmax(np.abs(a - b))
+        scale = np.nanmax(np.abs(a))
+        print(f"{column:<14}{diff:>14.2e}{diff / scale:>14.2e}")
+
+
+if __name__ == '__main__':
+    main()
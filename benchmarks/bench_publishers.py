@@ -0,0 +1,60 @@
+"""
+Publisher-domain extraction: regex per row vs. once per unique publisher.
+
+Runs on a synthetic feed by default, or on the real analyst-ratings CSV:
+
+    python -m benchmarks.bench_publishers --csv raw_analyst_ratings.csv
+"""
+import argparse
+import time
+
+import pandas as pd
+
+from benchmarks.synthetic import make_news_frame
+from src.analysis.publisher_analysis import (DOMAIN_PATTERN,
+                                             analyze_publishers,
+                                             top_domains_by_period)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=1_400_000)
+    parser.add_argument('--csv', help='analyst-ratings CSV to use instead')
+    args = parser.parse_args(argv)
+
+    if args.csv:
+        df = pd.read_csv(args.csv, usecols=['publisher', 'date'])
+    else:
+        df = make_news_frame(args.rows)[['publisher', 'date']]
+    # load_data parses the dates; keep that cost out of the comparison.
+    df['date'] = pd.to_datetime(df['date'], format='ISO8601', utc=True)
+    print(f"{len(df)} rows, {df['publisher'].nunique()} publishers")
+
+    start = time.perf_counter()
+    per_row = df['publisher'].str.extract(DOMAIN_PATTERN)[0].value_counts()
+    row_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    unique = analyze_publishers(df)
+    unique_time = time.perf_counter() - start
+
+    as_category = df.assign(publisher=df['publisher'].astype('category'))
+    start = time.perf_counter()
+    analyze_publishers(as_category)
+    category_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    top_domains_by_period(df, freq='M', n=10)
+    period_time = time.perf_counter() - start
+
+    same = per_row.sort_index().to_dict() == unique.sort_index().to_dict()
+    print(f"{'mode':<22}{'seconds':>10}")
+    print(f"{'regex per row':<22}{row_time:>10.3f}")
+    print(f"{'per unique (object)':<22}{unique_time:>10.3f}")
+    print(f"{'per unique (category)':<22}{category_time:>10.3f}")
+    print(f"{'top-10 per month':<22}{period_time:>10.3f}")
+    print(f"counts identical: {same}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""
+Per-ticker chart rendering: a new pyplot figure per chart vs. batch mode.
+
+Both paths write PNGs with the Agg backend; the baseline uses
+``plot_utils.plot_technical_indicators(show=False)``.
+
+    python -m benchmarks.bench_rendering --tickers 20 --days 5000
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.synthetic import write_ticker_csvs
+from visualization.batch import render_ticker_reports, use_headless_backend
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--tickers', type=int, default=10)
+    parser.add_argument('--days', type=int, default=5000)
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count())
+    args = parser.parse_args(argv)
+
+    use_headless_backend()
+    from scripts.technical_analysis import (calculate_technical_indicators,
+                                            load_stock_data)
+    from scripts.universe import ticker_files
+    from visualization.plot_utils import plot_technical_indicators
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data = os.path.join(tmp, 'data')
+        os.makedirs(data)
+        write_ticker_csvs(data, args.tickers, args.days)
+        print(f"{args.tickers} tickers x {args.days} days, "
+              f"{os.cpu_count()} CPUs")
+        print(f"{'mode':<24}{'seconds':>10}{'charts/s':>10}")
+
+        start = time.perf_counter()
+        for ticker, path in ticker_files(data).items():
+            df = calculate_technical_indicators(load_stock_data(path))
+            plot_technical_indicators(
+                df, save_path=os.path.join(tmp, f'{ticker}.png'), show=False)
+        elapsed = time.perf_counter() - start
+        print(f"{'figure per chart':<24}{elapsed:>10.2f}"
+              f"{args.tickers / elapsed:>10.1f}")
+
+        for workers in sorted({1, args.max_workers}):
+            start = time.perf_counter()
+            render_ticker_reports(data, os.path.join(tmp, f'batch{workers}'),
+                                  max_workers=workers)
+            elapsed = time.perf_counter() - start
+            label = f'batch, {workers} worker(s)'
+            print(f"{label:<24}{elapsed:>10.2f}"
+                  f"{args.tickers / elapsed:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+"""
+Throughput benchmark: per-row ``compute_sentiment_score`` vs. the batch
+``score_headlines`` engine, plus the largest polarity difference.
+
+    python -m benchmarks.bench_sentiment --rows 200000
+"""
+import argparse
+import time
+
+import numpy as np
+
+from benchmarks.synthetic import make_news_frame
+from scripts.quantitative_analysis import (compute_sentiment_score,
+                                           compute_sentiment_scores)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--stocks', type=int, default=500)
+    args = parser.parse_args(argv)
+
+    headlines = make_news_frame(args.rows, n_stocks=args.stocks)['headline']
+    print(f"{args.rows} headlines, {headlines.nunique()} unique")
+
+    start = time.perf_counter()
+    per_row = headlines.apply(compute_sentiment_score).to_numpy()
+    row_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = compute_sentiment_scores(headlines).to_numpy()
+    batch_time = time.perf_counter() - start
+
+    print(f"{'mode':<10}{'seconds':>10}{'rows/s':>14}")
+    print(f"{'per-row':<10}{row_time:>10.2f}{args.rows / row_time:>14,.0f}")
+    print(f"{'batch':<10}{batch_time:>10.2f}{args.rows / batch_time:>14,.0f}")
+    print(f"max |difference|: {np.max(np.abs(per_row - batch)):.2e}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""
+Per-bar latency of the streaming indicator engine across many tickers.
+
+    python -m benchmarks.bench_streaming --tickers 5000 --days 60
+
+Every simulated session delivers one bar per ticker through an
+``asyncio.Queue``, the way a live feed would, and the engine updates
+SMA/RSI/MACD and checks the alert thresholds for each bar.
+"""
+import argparse
+import asyncio
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic import make_tickers
+from scripts.streaming import Bar, StreamingEngine, queue_source
+
+
+async def stream(tickers, closes, dates):
+    queue = asyncio.Queue(maxsize=10_000)
+    engine = StreamingEngine()
+    consumer = asyncio.create_task(engine.run(queue_source(queue)))
+    for i, day in enumerate(dates):
+        for j, ticker in enumerate(tickers):
+            c = closes[i, j]
+            await queue.put(Bar(ticker, day, c, c, c, c, 1000.0))
+    await queue.put(None)
+    stats = await consumer
+    return engine, stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--tickers', type=int, default=5000)
+    parser.add_argument('--days', type=int, default=60)
+    args = parser.parse_args(argv)
+
+    tickers = make_tickers(args.tickers)
+    rng = np.random.default_rng(0)
+    closes = 50 * np.exp(np.cumsum(
+        rng.normal(0, 0.02, (args.days, args.tickers)), axis=0))
+    dates = pd.bdate_range('2024-01-01', periods=args.days)
+
+    start = time.perf_counter()
+    engine, stats = asyncio.run(stream(tickers, closes, dates))
+    elapsed = time.perf_counter() - start
+    print(f"{args.tickers} tickers x {args.days} bars: {stats['bars']} bars "
+          f"in {elapsed:.2f}s ({stats['bars'] / elapsed:,.0f} bars/s incl. "
+          f"feed), {engine.alerts} alerts")
+    print(f"per-bar latency: mean {stats['mean_us']:.1f}us, "
+          f"p50 {stats['p50_us']:.1f}us, p99 {stats['p99_us']:.1f}us, "
+          f"max {stats['max_us']:.1f}us")
+
+
+if __name__ == '__main__':
+    main()
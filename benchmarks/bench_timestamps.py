@@ -0,0 +1,68 @@
+"""
+Timestamp normalization: per-row ISO8601 parsing vs. convert_timestamp.
+
+The baseline is what the notebook does after a bare ``pd.to_datetime``
+fails on mixed offsets: parse every row with ``format='ISO8601'``, then
+derive the exchange-time hour and weekday with ``.dt``. The analyst feed
+has about 1.4M rows but only tens of thousands of distinct timestamps;
+``--unique`` controls that ratio (0 makes every row distinct).
+
+    python -m benchmarks.bench_timestamps --rows 2000000 --unique 40000
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic import make_news_frame
+from src.data_analyzer import EXCHANGE_TZ, convert_timestamp
+
+
+def baseline(dates: pd.Series) -> pd.DataFrame:
+    utc = pd.to_datetime(dates, format='ISO8601', utc=True)
+    local = utc.dt.tz_convert(EXCHANGE_TZ)
+    return pd.DataFrame({'date': utc, 'Hour': local.dt.hour,
+                         'Weekday': local.dt.weekday})
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=2_000_000)
+    parser.add_argument('--unique', type=int, default=40_000)
+    args = parser.parse_args(argv)
+
+    pool = args.unique or args.rows
+    distinct = make_news_frame(pool)['date']
+    rng = np.random.default_rng(0)
+    pick = rng.integers(0, pool, args.rows) if args.unique \
+        else np.arange(args.rows)
+    dates = distinct.take(pick).reset_index(drop=True)
+    print(f"{args.rows} rows, {dates.nunique()} distinct timestamps")
+
+    try:
+        start = time.perf_counter()
+        pd.to_datetime(dates)
+        print(f"bare pd.to_datetime: {time.perf_counter() - start:.2f}s")
+    except (ValueError, TypeError) as e:
+        print(f"bare pd.to_datetime fails: {str(e).splitlines()[0][:70]}")
+
+    start = time.perf_counter()
+    ref = baseline(dates)
+    base_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    out = convert_timestamp(pd.DataFrame({'date': dates}))
+    fast_time = time.perf_counter() - start
+
+    same = ((out['date'] == ref['date']).all()
+            and (out['Hour'].to_numpy() == ref['Hour'].to_numpy()).all()
+            and (out['Weekday'].to_numpy() == ref['Weekday'].to_numpy()).all())
+    print(f"{'per-row ISO8601 + .dt':<28}{base_time:>8.2f}s")
+    print(f"{'convert_timestamp':<28}{fast_time:>8.2f}s  "
+          f"x{base_time / fast_time:.1f}  (+ExchangeTime, Session)")
+    print(f"results match: {same}")
+
+
+if __name__ == '__main__':
+    main()
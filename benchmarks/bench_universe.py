@@ -0,0 +1,38 @@
+"""
+Scaling benchmark for ``compute_universe_indicators`` over 1..N workers.
+
+    python -m benchmarks.bench_universe --tickers 500 --days 5000
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.synthetic import write_ticker_csvs
+from scripts.universe import compute_universe_indicators
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--tickers', type=int, default=200)
+    parser.add_argument('--days', type=int, default=5000)
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count())
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        write_ticker_csvs(tmp, args.tickers, args.days)
+        print(f"{args.tickers} tickers x {args.days} days, "
+              f"{os.cpu_count()} CPUs")
+        print(f"{'workers':>8}{'seconds':>10}{'tickers/s':>12}{'speed-up':>10}")
+        baseline = None
+        for workers in range(1, args.max_workers + 1):
+            start = time.perf_counter()
+            compute_universe_indicators(tmp, max_workers=workers)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(f"{workers:>8}{elapsed:>10.2f}"
+                  f"{args.tickers / elapsed:>12.1f}{baseline / elapsed:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,223 @@
+"""
+Offline benchmark suite over load, indicators, sentiment, stats and plots.
+
+Every case runs on synthetic data from ``benchmarks.synthetic`` (N tickers
+x M days of OHLCV and a headline feed of R rows) generated with a fixed
+seed, so two runs on the same machine measure the same work. Results are
+written as JSON; ``--compare`` prints the ratio to an earlier result file
+and exits non-zero when a case got slower than ``--threshold``.
+
+    python -m benchmarks.run --output bench.json
+    python -m benchmarks.run --output new.json --compare bench.json
+    python -m benchmarks.run --only load_data_cold,sentiment --rows 20000
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+from benchmarks.synthetic import write_news_csv, write_ticker_csvs
+
+
+class Context:
+    """Synthetic inputs shared by the cases, written to a temporary dir."""
+
+    def __init__(self, root: str, tickers: int, days: int, rows: int):
+        self.root = root
+        self.tickers, self.days, self.rows = tickers, days, rows
+        self.price_dir = os.path.join(root, 'prices')
+        os.makedirs(self.price_dir)
+        self.price_files = write_ticker_csvs(self.price_dir, tickers, days)
+        self.news_csv = write_news_csv(os.path.join(root, 'news.csv'), rows)
+        self._news = None
+        self._prices = None
+
+    @property
+    def news(self):
+        if self._news is None:
+            from src.data_loader import NEWS_DTYPES, load_data
+            self._news = load_data(self.news_csv, dtype=NEWS_DTYPES,
+                                   date_column='date', use_cache=False)
+        return self._news
+
+    @property
+    def prices(self):
+        if self._prices is None:
+            from scripts.technical_analysis import load_stock_data
+            self._prices = [load_stock_data(p) for p in self.price_files]
+        return self._prices
+
+
+def case_load_data_cold(ctx):
+    from src.data_loader import NEWS_DTYPES, load_data
+    load_data(ctx.news_csv, dtype=NEWS_DTYPES, date_column='date',
+              use_cache=False)
+    return ctx.rows
+
+
+def case_load_data_warm(ctx):
+    from src.data_loader import NEWS_DTYPES, load_data
+    cache = os.path.join(ctx.root, 'cache')
+    load_data(ctx.news_csv, dtype=NEWS_DTYPES, date_column='date',
+              cache_dir=cache)
+    return ctx.rows
+
+
+def case_calculate_technical_indicators(ctx):
+    from scripts.technical_analysis import calculate_technical_indicators
+    for df in ctx.prices:
+        calculate_technical_indicators(df.copy())
+    return ctx.tickers * ctx.days
+
+
+def case_add_technical_indicators(ctx):
+    from scripts.quantitative_analysis import add_technical_indicators
+    for df in ctx.prices:
+        add_technical_indicators(df.copy())
+    return ctx.tickers * ctx.days
+
+
+def case_sentiment(ctx):
+    from scripts.quantitative_analysis import compute_sentiment_scores
+    compute_sentiment_scores(ctx.news['headline'])
+    return ctx.rows
+
+
+def case_descriptive_stats(ctx):
+    from src.analysis.descriptive_stats import compute_descriptive_stats
+    compute_descriptive_stats(ctx.news)
+    return ctx.rows
+
+
+def case_plot_indicators(ctx):
+    from scripts.technical_analysis import calculate_technical_indicators
+    from visualization.plot_utils import plot_technical_indicators
+    df = calculate_technical_indicators(ctx.prices[0].copy())
+    plot_technical_indicators(df, save_path=os.path.join(ctx.root, 'p.png'),
+                              show=False)
+    return 1
+
+
+def case_render_reports(ctx):
+    from visualization.batch import render_ticker_reports
+    render_ticker_reports(ctx.price_dir, os.path.join(ctx.root, 'charts'),
+                          max_workers=1)
+    return ctx.tickers
+
+
+CASES = {
+    'load_data_cold': case_load_data_cold,
+    'load_data_warm': case_load_data_warm,
+    'calculate_technical_indicators': case_calculate_technical_indicators,
+    'add_technical_indicators': case_add_technical_indicators,
+    'sentiment': case_sentiment,
+    'descriptive_stats': case_descriptive_stats,
+    'plot_indicators': case_plot_indicators,
+    'render_reports': case_render_reports,
+}
+
+
+def run_case(func, ctx, repeat: int) -> dict:
+    """Time ``repeat`` calls after one untimed warm-up call."""
+    items = func(ctx)
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(ctx)
+        times.append(time.perf_counter() - start)
+    best = min(times)
+    return {'min_s': best, 'median_s': statistics.median(times),
+            'repeat': repeat, 'items': items,
+            'items_per_s': items / best if best else None}
+
+
+def environment() -> dict:
+    import numpy
+    import pandas
+    return {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'numpy': numpy.__version__,
+        'pandas': pandas.__version__,
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """Print ratios to ``baseline`` and return the regressed case names."""
+    print(f"\n{'case':<32}{'before s':>10}{'after s':>10}{'ratio':>8}")
+    regressed = []
+    for name, result in results.items():
+        before = baseline.get('results', {}).get(name)
+        if before is None:
+            print(f"{name:<32}{'-':>10}{result['min_s']:>10.3f}{'new':>8}")
+            continue
+        ratio = result['min_s'] / before['min_s']
+        flag = '  SLOWER' if ratio > threshold else ''
+        print(f"{name:<32}{before['min_s']:>10.3f}{result['min_s']:>10.3f}"
+              f"{ratio:>8.2f}{flag}")
+        if ratio > threshold:
+            regressed.append(name)
+    return regressed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--tickers', type=int, default=20)
+    parser.add_argument('--days', type=int, default=2500)
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--only', help='comma-separated case names')
+    parser.add_argument('--output', help='write results to this JSON file')
+    parser.add_argument('--compare', help='earlier JSON results to compare')
+    parser.add_argument('--threshold', type=float, default=1.2,
+                        help='slow-down ratio reported as a regression')
+    args = parser.parse_args(argv)
+
+    names = args.only.split(',') if args.only else list(CASES)
+    unknown = set(names) - set(CASES)
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(sorted(unknown))}")
+
+    import matplotlib
+    matplotlib.use('Agg')
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        ctx = Context(tmp, args.tickers, args.days, args.rows)
+        print(f"{args.tickers} tickers x {args.days} days, {args.rows} "
+              f"headlines, best of {args.repeat}")
+        print(f"{'case':<32}{'min s':>10}{'median s':>10}{'items/s':>14}")
+        for name in names:
+            result = run_case(CASES[name], ctx, args.repeat)
+            results[name] = result
+            print(f"{name:<32}{result['min_s']:>10.3f}"
+                  f"{result['median_s']:>10.3f}{result['items_per_s']:>14,.0f}")
+
+    report = {'environment': environment(),
+              'parameters': {'tickers': args.tickers, 'days': args.days,
+                             'rows': args.rows, 'repeat': args.repeat},
+              'results': results}
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nWrote {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline.get('parameters') != report['parameters']:
+            print("warning: baseline was run with different parameters "
+                  f"{baseline.get('parameters')}")
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
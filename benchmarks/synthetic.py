@@ -0,0 +1,107 @@
+"""Synthetic, offline stand-ins for the project's input files."""
+import os
+
+import numpy as np
+import pandas as pd
+
+PUBLISHERS = [
+    'Benzinga Newsdesk', 'Lisa Levin', 'ETF Professor', 'Paul Quintaro',
+    'Benzinga Insights', 'Vick Meyer', 'vishwanath@benzinga.com',
+    'Hal Lindon', 'Eddie Staley', 'Monica Gerson', 'Charles Gross',
+    'Juan Lopez', 'webmaster@zacks.com', 'Shanthi Rexaline',
+]
+HEADLINE_TEMPLATES = [
+    '{s} hits record high',
+    'Concerns over future growth at {s}',
+    '{s} to unveil new product next month',
+    '{s} reports earnings that exceed forecasts',
+    'Market downturn effects on {s}',
+    '{s} invests in renewable energy',
+    'New CEO announced at {s}',
+    '{s} faces regulatory scrutiny',
+    '{s} rumored to acquire a tech startup',
+    'Stocks That Hit 52-Week Highs On {d}',
+]
+
+
+def make_tickers(n_tickers: int) -> list:
+    """Return ``n_tickers`` distinct upper-case ticker symbols."""
+    tickers = []
+    i = 0
+    while len(tickers) < n_tickers:
+        name, j = '', i
+        while True:
+            name = chr(ord('A') + j % 26) + name
+            j = j // 26 - 1
+            if j < 0:
+                break
+        tickers.append(name)
+        i += 1
+    return tickers
+
+
+def make_news_frame(n_rows: int, n_stocks: int = 500,
+                    seed: int = 0) -> pd.DataFrame:
+    """Build a frame shaped like ``raw_analyst_ratings.csv``."""
+    rng = np.random.default_rng(seed)
+    stocks = np.array(make_tickers(n_stocks))
+    stock = stocks[rng.integers(0, n_stocks, n_rows)]
+    template = rng.integers(0, len(HEADLINE_TEMPLATES), n_rows)
+
+    seconds = rng.integers(0, 10 * 365 * 86400, n_rows)
+    ts = pd.Timestamp('2011-01-01', tz='UTC') + pd.to_timedelta(seconds, 's')
+    local = ts.tz_convert('America/New_York')
+    dates = local.strftime('%Y-%m-%d %H:%M:%S%z')
+    dates = dates.str[:-2] + ':' + dates.str[-2:]
+
+    day = local.strftime('%B %d')
+    headlines = [HEADLINE_TEMPLATES[t].format(s=s, d=d)
+                 for t, s, d in zip(template, stock, day)]
+    return pd.DataFrame({
+        'headline': headlines,
+        'url': 'https://www.benzinga.com/news/' + pd.Series(
+            np.arange(n_rows)).astype(str),
+        'publisher': np.array(PUBLISHERS)[
+            rng.integers(0, len(PUBLISHERS), n_rows)],
+        'date': dates,
+        'stock': stock,
+    })
+
+
+def write_news_csv(path: str, n_rows: int, n_stocks: int = 500,
+                   seed: int = 0) -> str:
+    """Write a synthetic analyst-ratings CSV and return its path."""
+    make_news_frame(n_rows, n_stocks=n_stocks, seed=seed).to_csv(path)
+    return path
+
+
+def make_ohlcv(n_days: int, seed: int = 0,
+               start: str = '1990-01-02') -> pd.DataFrame:
+    """Build a geometric random walk shaped like ``*_historical_data.csv``."""
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(start, periods=n_days)
+    close = 20.0 * np.exp(np.cumsum(rng.normal(0.0003, 0.02, n_days)))
+    spread = np.abs(rng.normal(0, 0.01, n_days)) * close
+    open_ = close * (1 + rng.normal(0, 0.005, n_days))
+    return pd.DataFrame({
+        'Date': dates.strftime('%Y-%m-%d'),
+        'Open': open_,
+        'High': np.maximum(open_, close) + spread,
+        'Low': np.minimum(open_, close) - spread,
+        'Close': close,
+        'Adj Close': close,
+        'Volume': rng.integers(100_000, 50_000_000, n_days),
+        'Dividends': 0.0,
+        'Stock Splits': 0.0,
+    })
+
+
+def write_ticker_csvs(directory: str, n_tickers: int, n_days: int,
+                      seed: int = 0) -> list:
+    """Write ``<TICKER>_historical_data.csv`` files and return their paths."""
+    paths = []
+    for i, ticker in enumerate(make_tickers(n_tickers)):
+        path = os.path.join(directory, f"{ticker}_historical_data.csv")
+        make_ohlcv(n_days, seed=seed + i).to_csv(path, index=False)
+        paths.append(path)
+    return paths
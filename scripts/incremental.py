@@ -0,0 +1,215 @@
+"""
+Append-only SMA/EMA/RSI/MACD that update in O(1) per bar.
+
+The arithmetic follows TA-Lib step for step (seeding, operation order,
+output start index), so appending bars one at a time gives the same values
+as ``calculate_technical_indicators`` run over the full history. The state
+is plain JSON and can be saved by a nightly job and resumed the next day.
+"""
+import json
+import math
+from collections import deque
+from typing import Iterable, Optional
+
+import pandas as pd
+
+NAN = float('nan')
+# TA-Lib treats |x| < 1e-8 as zero (TA_IS_ZERO).
+_EPSILON = 1e-8
+
+
+class _RollingMean:
+    """Running-sum SMA; subtract the oldest value before adding the newest."""
+
+    def __init__(self, period, window=(), total=0.0):
+        self.period = period
+        self.window = deque(window, maxlen=period)
+        self.total = total
+
+    def update(self, x):
+        if len(self.window) == self.period:
+            self.total -= self.window[0]
+        self.window.append(x)
+        self.total += x
+        if len(self.window) < self.period:
+            return NAN
+        return self.total / self.period
+
+    def state(self):
+        return {'period': self.period, 'window': list(self.window),
+                'total': self.total}
+
+
+class _SeededEMA:
+    """EMA seeded with the SMA of its first ``period`` inputs, after ``skip``."""
+
+    def __init__(self, period, skip=0, seen=0, total=0.0, value=None):
+        self.period = period
+        self.skip = skip
+        self.k = 2.0 / (period + 1)
+        self.seen = seen
+        self.total = total
+        self.value = value
+
+    def update(self, x):
+        if self.value is not None:
+            self.value = ((x - self.value) * self.k) + self.value
+            return self.value
+        self.seen += 1
+        if self.seen <= self.skip:
+            return NAN
+        self.total += x
+        if self.seen - self.skip == self.period:
+            self.value = self.total / self.period
+            return self.value
+        return NAN
+
+    def state(self):
+        return {'period': self.period, 'skip': self.skip, 'seen': self.seen,
+                'total': self.total, 'value': self.value}
+
+
+class _WilderRSI:
+    """RSI with Wilder smoothing seeded by the mean of the first changes."""
+
+    def __init__(self, period, seen=0, prev=None, gain=0.0, loss=0.0):
+        self.period = period
+        self.seen = seen
+        self.prev = prev
+        self.gain = gain
+        self.loss = loss
+
+    def update(self, x):
+        if self.prev is None:
+            self.prev = x
+            return NAN
+        change = x - self.prev
+        self.prev = x
+        self.seen += 1
+        if self.seen > self.period:
+            self.loss *= (self.period - 1)
+            self.gain *= (self.period - 1)
+        if change < 0:
+            self.loss -= change
+        else:
+            self.gain += change
+        if self.seen < self.period:
+            return NAN
+        self.loss /= self.period
+        self.gain /= self.period
+        total = self.gain + self.loss
+        if -_EPSILON < total < _EPSILON:
+            return 0.0
+        return 100.0 * (self.gain / total)
+
+    def state(self):
+        return {'period': self.period, 'seen': self.seen, 'prev': self.prev,
+                'gain': self.gain, 'loss': self.loss}
+
+
+class IncrementalIndicators:
+    """
+    Stateful SMA_20, RSI_14 and MACD(12, 26, 9) (plus an optional EMA).
+
+    Feed closes in date order with ``update`` or ``extend``. Outputs use
+    the same column names as ``calculate_technical_indicators`` and are NaN
+    until TA-Lib would start emitting values.
+    """
+
+    def __init__(self, sma_period: int = 20, rsi_period: int = 14,
+                 fast_period: int = 12, slow_period: int = 26,
+                 signal_period: int = 9, ema_period: Optional[int] = None):
+        if fast_period > slow_period:
+            raise ValueError("fast_period must not exceed slow_period")
+        self.sma = _RollingMean(sma_period)
+        self.rsi = _WilderRSI(rsi_period)
+        # TA-Lib seeds the fast EMA on the last ``fast`` closes of the slow
+        # EMA's seed window so both start on the same bar.
+        self.fast = _SeededEMA(fast_period, skip=slow_period - fast_period)
+        self.slow = _SeededEMA(slow_period)
+        self.signal = _SeededEMA(signal_period)
+        self.ema = _SeededEMA(ema_period) if ema_period else None
+        self.bars = 0
+
+    def update(self, close: float) -> dict:
+        """
+        Append one close and return the indicator values for that bar.
+
+        Args:
+            close (float): Closing price of the new bar.
+
+        Returns:
+            dict: ``SMA_20``, ``RSI``, ``MACD``, ``MACD_Signal``,
+            ``MACD_Hist`` (and ``EMA`` when enabled).
+        """
+        close = float(close)
+        self.bars += 1
+        row = {f'SMA_{self.sma.period}': self.sma.update(close),
+               'RSI': self.rsi.update(close)}
+        if self.ema is not None:
+            row['EMA'] = self.ema.update(close)
+
+        fast = self.fast.update(close)
+        slow = self.slow.update(close)
+        macd = signal = NAN
+        if not math.isnan(slow):
+            line = fast - slow
+            signal = self.signal.update(line)
+            # TA-Lib only emits MACD once the signal line exists.
+            if not math.isnan(signal):
+                macd = line
+        row['MACD'] = macd
+        row['MACD_Signal'] = signal
+        row['MACD_Hist'] = macd - signal
+        return row
+
+    def extend(self, closes: Iterable[float]) -> pd.DataFrame:
+        """
+        Append several closes; returns one row of indicators per close.
+
+        Args:
+            closes (Iterable[float]): Closes in date order. When a Series is
+                passed its index is kept.
+
+        Returns:
+            pd.DataFrame: Indicator values for the appended bars.
+        """
+        index = closes.index if isinstance(closes, pd.Series) else None
+        rows = [self.update(c) for c in closes]
+        return pd.DataFrame(rows, index=index)
+
+    def to_dict(self) -> dict:
+        """Return the full state as JSON-serialisable primitives."""
+        return {
+            'bars': self.bars,
+            'sma': self.sma.state(),
+            'rsi': self.rsi.state(),
+            'fast': self.fast.state(),
+            'slow': self.slow.state(),
+            'signal': self.signal.state(),
+            'ema': self.ema.state() if self.ema is not None else None,
+        }
+
+    @classmethod
+    def from_dict(cls, state: dict) -> 'IncrementalIndicators':
+        """Rebuild an instance from ``to_dict`` output."""
+        obj = cls.__new__(cls)
+        obj.bars = state['bars']
+        obj.sma = _RollingMean(**state['sma'])
+        obj.rsi = _WilderRSI(**state['rsi'])
+        obj.fast = _SeededEMA(**state['fast'])
+        obj.slow = _SeededEMA(**state['slow'])
+        obj.signal = _SeededEMA(**state['signal'])
+        obj.ema = _SeededEMA(**state['ema']) if state['ema'] else None
+        return obj
+
+    def save(self, path: str) -> None:
+        """Write the state to a JSON file."""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path: str) -> 'IncrementalIndicators':
+        """Read a state written by ``save``."""
+        with open(path, encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
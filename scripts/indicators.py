@@ -0,0 +1,297 @@
+"""
+Pluggable indicator backends: TA-Lib, pure NumPy, and the ``ta`` package.
+
+Every backend exposes ``sma``, ``ema``, ``rsi`` and ``macd`` with the same
+signatures. ``get_backend()`` without a name picks TA-Lib when it can be
+imported and the NumPy backend otherwise.
+
+The NumPy backend reproduces TA-Lib's definitions, including the SMA-seeded
+EMAs and Wilder RSI, to float tolerance. It works on 1-D arrays and on 2-D
+``(dates, tickers)`` blocks column-wise, and each column may start with
+its own run of NaNs. The ``ta`` backend seeds its EMAs differently, so it
+only agrees with the other two once the warm-up has decayed.
+"""
+import logging
+from typing import Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ('talib', 'numpy', 'ta')
+# Treated as zero by TA-Lib's RSI (TA_IS_ZERO).
+_EPSILON = 1e-8
+# EMA blocks are sized so (1 - k) ** length stays above this; keeps the
+# rescaled cumulative sum well inside float64 precision.
+_MIN_DECAY = 1e-8
+
+
+class NumpyBackend:
+    """Vectorised TA-Lib-compatible indicators on NumPy arrays."""
+
+    name = 'numpy'
+
+    @staticmethod
+    def sma(close, period: int = 20) -> np.ndarray:
+        return _columnwise(close, lambda x: _sma(x, period))
+
+    @staticmethod
+    def ema(close, period: int = 20) -> np.ndarray:
+        return _columnwise(close, lambda x: _seeded_ema(x, period, 0,
+                                                        period - 1))
+
+    @staticmethod
+    def rsi(close, period: int = 14) -> np.ndarray:
+        return _columnwise(close, lambda x: _rsi(x, period))
+
+    @staticmethod
+    def macd(close, fast: int = 12, slow: int = 26,
+             signal: int = 9) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        x, first, squeeze = _prepare(close)
+        line, sig = _macd(x, fast, slow, signal)
+        out = [_restore(a, first, squeeze) for a in (line, sig, line - sig)]
+        return tuple(out)
+
+
+class TalibBackend:
+    """TA-Lib, one C call per column."""
+
+    name = 'talib'
+
+    @staticmethod
+    def sma(close, period: int = 20) -> np.ndarray:
+        import talib
+        return _per_column(close, lambda x: talib.SMA(x, timeperiod=period))
+
+    @staticmethod
+    def ema(close, period: int = 20) -> np.ndarray:
+        import talib
+        return _per_column(close, lambda x: talib.EMA(x, timeperiod=period))
+
+    @staticmethod
+    def rsi(close, period: int = 14) -> np.ndarray:
+        import talib
+        return _per_column(close, lambda x: talib.RSI(x, timeperiod=period))
+
+    @staticmethod
+    def macd(close, fast: int = 12, slow: int = 26,
+             signal: int = 9) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        import talib
+        parts = [_per_column(close, lambda x, i=i: talib.MACD(
+            x, fastperiod=fast, slowperiod=slow, signalperiod=signal)[i])
+            for i in range(3)]
+        return tuple(parts)
+
+
+class TaBackend:
+    """The pandas-based ``ta`` package, as used before this module."""
+
+    name = 'ta'
+
+    @staticmethod
+    def sma(close, period: int = 20) -> np.ndarray:
+        from ta.trend import SMAIndicator
+        return _per_series(close, lambda s: SMAIndicator(
+            close=s, window=period).sma_indicator())
+
+    @staticmethod
+    def ema(close, period: int = 20) -> np.ndarray:
+        from ta.trend import EMAIndicator
+        return _per_series(close, lambda s: EMAIndicator(
+            close=s, window=period).ema_indicator())
+
+    @staticmethod
+    def rsi(close, period: int = 14) -> np.ndarray:
+        from ta.momentum import RSIIndicator
+        return _per_series(close, lambda s: RSIIndicator(
+            close=s, window=period).rsi())
+
+    @staticmethod
+    def macd(close, fast: int = 12, slow: int = 26,
+             signal: int = 9) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        from ta.trend import MACD
+        parts = []
+        for method in ('macd', 'macd_signal', 'macd_diff'):
+            parts.append(_per_series(close, lambda s, m=method: getattr(
+                MACD(close=s, window_slow=slow, window_fast=fast,
+                     window_sign=signal), m)()))
+        return tuple(parts)
+
+
+_BACKEND_CLASSES = {'talib': TalibBackend, 'numpy': NumpyBackend,
+                    'ta': TaBackend}
+_MODULES = {'talib': 'talib', 'numpy': 'numpy', 'ta': 'ta'}
+
+
+def available_backends() -> list:
+    """Return the backend names whose dependencies can be imported."""
+    names = []
+    for name in BACKENDS:
+        try:
+            __import__(_MODULES[name])
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def output_dtype(close) -> np.dtype:
+    """
+    Dtype to store indicator columns in: float32 prices give float32
+    columns, anything else float64. The backends compute in float64 either
+    way.
+    """
+    return np.result_type(np.asarray(close).dtype, np.float32)
+
+
+def get_backend(name: Optional[str] = None):
+    """
+    Return an indicator backend.
+
+    Args:
+        name (str, optional): ``'talib'``, ``'numpy'`` or ``'ta'``. When
+            omitted, TA-Lib is used if installed, NumPy otherwise.
+
+    Returns:
+        A backend class exposing ``sma``, ``ema``, ``rsi`` and ``macd``.
+
+    Raises:
+        ValueError: If the name is unknown.
+        ImportError: If the named backend's package is missing.
+    """
+    if name is None:
+        name = 'talib' if 'talib' in available_backends() else 'numpy'
+    if name not in _BACKEND_CLASSES:
+        raise ValueError(f"Unknown indicator backend '{name}', expected one "
+                         f"of {BACKENDS}")
+    __import__(_MODULES[name])
+    return _BACKEND_CLASSES[name]
+
+
+# -- NumPy implementation ---------------------------------------------------
+
+def _columnwise(close, func):
+    x, first, squeeze = _prepare(close)
+    return _restore(func(x), first, squeeze)
+
+
+def _prepare(close):
+    """Return a float 2-D block with every column's first value in row 0."""
+    x = np.asarray(close, dtype=np.float64)
+    squeeze = x.ndim == 1
+    if squeeze:
+        x = x[:, None]
+    n = x.shape[0]
+    valid = ~np.isnan(x)
+    first = np.where(valid.any(axis=0), valid.argmax(axis=0), n)
+    if not first.any():
+        return x, None, squeeze
+    rows = np.arange(n)[:, None] + first[None, :]
+    shifted = np.take_along_axis(x, np.minimum(rows, n - 1), axis=0)
+    shifted[rows >= n] = np.nan
+    return shifted, first, squeeze
+
+
+def _restore(y, first, squeeze):
+    if first is not None:
+        n = y.shape[0]
+        rows = np.arange(n)[:, None] - first[None, :]
+        y = np.take_along_axis(y, np.maximum(rows, 0), axis=0)
+        y[rows < 0] = np.nan
+    return y[:, 0] if squeeze else y
+
+
+def _sma(x, period):
+    out = np.full_like(x, np.nan)
+    if x.shape[0] >= period:
+        windows = np.lib.stride_tricks.sliding_window_view(x, period, axis=0)
+        out[period - 1:] = windows.sum(axis=-1) / period
+    return out
+
+
+def _ema_recurrence(x, seed, k):
+    """y[t] = y[t-1] + k * (x[t] - y[t-1]) with y[-1] = seed, in blocks."""
+    out = np.empty_like(x)
+    decay = 1.0 - k
+    if decay <= 0.0:
+        out[:] = x
+        return out
+    block = max(1, min(x.shape[0],
+                       int(np.log(_MIN_DECAY) / np.log(decay))))
+    powers = decay ** np.arange(1, block + 1)[:, None]
+    prev = seed
+    for start in range(0, x.shape[0], block):
+        yb = out[start:start + block]
+        p = powers[:yb.shape[0]]
+        np.divide(x[start:start + block], p, out=yb)
+        np.cumsum(yb, axis=0, out=yb)
+        yb *= k
+        yb += prev
+        yb *= p
+        prev = yb[-1]
+    return out
+
+
+def _seeded_ema(x, period, skip, seed_row, k=None):
+    """EMA seeded at ``seed_row`` with the mean of x[skip:skip + period]."""
+    out = np.full_like(x, np.nan)
+    if x.shape[0] <= seed_row:
+        return out
+    k = 2.0 / (period + 1) if k is None else k
+    seed = x[skip:skip + period].sum(axis=0) / period
+    out[seed_row] = seed
+    out[seed_row + 1:] = _ema_recurrence(x[seed_row + 1:], seed, k)
+    return out
+
+
+def _rsi(x, period):
+    out = np.full_like(x, np.nan)
+    if x.shape[0] <= period:
+        return out
+    change = np.diff(x, axis=0)
+    gain = np.clip(change, 0.0, None)
+    loss = np.clip(-change, 0.0, None)
+    k = 1.0 / period
+    avg_gain = _seeded_ema(gain, period, 0, period - 1, k)
+    avg_loss = _seeded_ema(loss, period, 0, period - 1, k)
+    total = avg_gain + avg_loss
+    with np.errstate(invalid='ignore', divide='ignore'):
+        rsi = np.where(np.abs(total) < _EPSILON, 0.0,
+                       100.0 * (avg_gain / total))
+    out[1:] = rsi
+    return out
+
+
+def _macd(x, fast, slow, signal):
+    n = x.shape[0]
+    line = np.full_like(x, np.nan)
+    sig = np.full_like(x, np.nan)
+    start = slow - 1
+    if n <= start + signal - 1:
+        return line, sig
+    # Both EMAs are seeded on the same bar: the fast one on the last
+    # ``fast`` closes of the slow seed window (TA-Lib's convention).
+    fast_ema = _seeded_ema(x, fast, slow - fast, start)
+    slow_ema = _seeded_ema(x, slow, 0, start)
+    raw = fast_ema[start:] - slow_ema[start:]
+    sig[start:] = _seeded_ema(raw, signal, 0, signal - 1)
+    # TA-Lib only reports the MACD line once the signal line exists.
+    line[start + signal - 1:] = raw[signal - 1:]
+    return line, sig
+
+
+# -- Adapters for the column-at-a-time backends -------------------------------
+
+def _per_column(close, func):
+    x = np.asarray(close, dtype=np.float64)
+    if x.ndim == 1:
+        return np.asarray(func(np.ascontiguousarray(x)), dtype=np.float64)
+    out = np.empty_like(x)
+    for j in range(x.shape[1]):
+        out[:, j] = func(np.ascontiguousarray(x[:, j]))
+    return out
+
+
+def _per_series(close, func):
+    import pandas as pd
+    return _per_column(close, lambda x: func(pd.Series(x)).to_numpy())
@@ -0,0 +1,270 @@
+"""
+Return and risk metrics for a whole ticker panel in one vectorised pass.
+
+Replaces the PyNance calls in ``calculate_financial_metrics``. Every
+function takes a price (or return) Series, a dates x tickers DataFrame, or
+a ``PricePanel``, and works on the underlying 2-D array column-wise, so a
+universe of tickers costs one NumPy call per metric instead of one library
+call per ticker. NaNs (gaps, dates before a listing) are skipped the way
+pandas' ``skipna`` does.
+
+Volatility is the sample standard deviation (``ddof=1``) of daily returns
+scaled by ``sqrt(252)``, the figure the pipeline reports as annualized
+volatility.
+"""
+import logging
+import warnings
+from typing import Optional, Union
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+TRADING_DAYS = 252
+RETURN_KINDS = ('simple', 'log')
+
+PriceData = Union[pd.Series, pd.DataFrame]
+
+
+def returns(prices, kind: str = 'simple',
+            price_field: str = 'Close') -> PriceData:
+    """
+    Period-over-period returns.
+
+    Args:
+        prices: Series, dates x tickers DataFrame or ``PricePanel``.
+        kind (str): ``'simple'`` (``p_t / p_{t-1} - 1``) or ``'log'``.
+        price_field (str): Field used when ``prices`` is a panel.
+
+    Returns:
+        Series or DataFrame: Returns aligned with ``prices``; the first row
+        is NaN.
+    """
+    if kind not in RETURN_KINDS:
+        raise ValueError(f"Unknown return kind '{kind}', expected one of "
+                         f"{RETURN_KINDS}")
+    prices = _as_frame(prices, price_field)
+    x = _values(prices)
+    out = np.full_like(x, np.nan)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = x[1:] / x[:-1]
+        out[1:] = np.log(ratio) if kind == 'log' else ratio - 1.0
+    return _wrap(out, prices)
+
+
+def annualized_volatility(rets, periods: int = TRADING_DAYS,
+                          ddof: int = 1) -> Union[float, pd.Series]:
+    """
+    Standard deviation of returns scaled to a year.
+
+    Args:
+        rets: Returns as a Series or dates x tickers DataFrame.
+        periods (int): Return periods per year.
+        ddof (int): Delta degrees of freedom of the standard deviation.
+
+    Returns:
+        float or pd.Series: Volatility (per ticker for a DataFrame).
+    """
+    x = _values(rets)
+    return _reduce(_nanstd(x, ddof) * np.sqrt(periods), rets)
+
+
+def rolling_volatility(rets, window: int = 20, periods: int = TRADING_DAYS,
+                       min_periods: Optional[int] = None) -> PriceData:
+    """
+    Annualized volatility over a trailing window.
+
+    Uses running sums of ``r`` and ``r**2`` over all tickers at once, so
+    the cost does not grow with the window length.
+
+    Args:
+        rets: Returns as a Series or dates x tickers DataFrame.
+        window (int): Window length in periods.
+        periods (int): Return periods per year.
+        min_periods (int, optional): Valid returns needed in a window;
+            defaults to ``window``.
+
+    Returns:
+        Series or DataFrame: Rolling volatility aligned with ``rets``.
+    """
+    min_periods = window if min_periods is None else max(min_periods, 2)
+    x = _values(rets)
+    valid = ~np.isnan(x)
+    # Centre each column first so the sum-of-squares form stays accurate.
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        centred = np.where(valid, x - np.nanmean(x, axis=0), 0.0)
+    n = _window_sum(valid.astype(np.float64), window)
+    s1 = _window_sum(centred, window)
+    s2 = _window_sum(centred * centred, window)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        var = (s2 - s1 * s1 / n) / (n - 1)
+    vol = np.sqrt(np.maximum(var, 0.0)) * np.sqrt(periods)
+    vol[n < min_periods] = np.nan
+    return _wrap(vol, rets)
+
+
+def drawdown(prices, price_field: str = 'Close') -> PriceData:
+    """
+    Decline from the running peak, ``p_t / max(p_0..p_t) - 1``.
+
+    Args:
+        prices: Series, dates x tickers DataFrame or ``PricePanel``.
+        price_field (str): Field used when ``prices`` is a panel.
+
+    Returns:
+        Series or DataFrame: Drawdowns (0 at a new high, negative below).
+    """
+    prices = _as_frame(prices, price_field)
+    x = _values(prices)
+    # fmax skips NaN, so gaps do not reset the peak.
+    peak = np.fmax.accumulate(x, axis=0)
+    return _wrap(x / peak - 1.0, prices)
+
+
+def max_drawdown(prices, price_field: str = 'Close'
+                 ) -> Union[float, pd.Series]:
+    """Largest drawdown (most negative value of ``drawdown``)."""
+    dd = drawdown(prices, price_field)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        return _reduce(np.nanmin(_values(dd), axis=0), dd)
+
+
+def sharpe_ratio(rets, risk_free: float = 0.0,
+                 periods: int = TRADING_DAYS) -> Union[float, pd.Series]:
+    """
+    Annualized Sharpe ratio of periodic returns.
+
+    Args:
+        rets: Returns as a Series or dates x tickers DataFrame.
+        risk_free (float): Annual risk-free rate, spread evenly over
+            ``periods``.
+        periods (int): Return periods per year.
+
+    Returns:
+        float or pd.Series: Sharpe ratio (per ticker for a DataFrame).
+    """
+    x = _values(rets) - risk_free / periods
+    with warnings.catch_warnings(), np.errstate(divide='ignore',
+                                                invalid='ignore'):
+        warnings.simplefilter('ignore', RuntimeWarning)
+        ratio = np.nanmean(x, axis=0) / _nanstd(x, 1) * np.sqrt(periods)
+    return _reduce(ratio, rets)
+
+
+def beta(rets, benchmark) -> Union[float, pd.Series]:
+    """
+    Beta of each return column against a benchmark return series.
+
+    Each ticker uses only the dates where both it and the benchmark have a
+    return.
+
+    Args:
+        rets: Returns as a Series or dates x tickers DataFrame.
+        benchmark (pd.Series): Benchmark returns, aligned on the index.
+
+    Returns:
+        float or pd.Series: ``cov(r, b) / var(b)`` per ticker.
+    """
+    frame = _as_frame(rets)
+    b = pd.Series(benchmark).reindex(frame.index).to_numpy(dtype=np.float64)
+    x = _values(frame)
+    both = ~np.isnan(x) & ~np.isnan(b)[:, None]
+    n = both.sum(axis=0)
+    xv = np.where(both, x, 0.0)
+    bv = np.where(both, b[:, None], 0.0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mx, mb = xv.sum(axis=0) / n, bv.sum(axis=0) / n
+        cov = (np.where(both, (x - mx) * (b[:, None] - mb), 0.0)).sum(axis=0)
+        var = (np.where(both, (b[:, None] - mb) ** 2, 0.0)).sum(axis=0)
+        result = cov / var
+    result[n < 2] = np.nan
+    return _reduce(result, rets)
+
+
+def compute_metrics(prices, benchmark=None, kind: str = 'simple',
+                    risk_free: float = 0.0, periods: int = TRADING_DAYS,
+                    price_field: str = 'Close') -> pd.DataFrame:
+    """
+    Summary risk/return table for every ticker.
+
+    Args:
+        prices: Series, dates x tickers DataFrame or ``PricePanel``.
+        benchmark (pd.Series, optional): Benchmark *prices*; adds a ``beta``
+            column.
+        kind (str): Return kind used for the statistics.
+        risk_free (float): Annual risk-free rate for the Sharpe ratio.
+        periods (int): Return periods per year.
+        price_field (str): Field used when ``prices`` is a panel.
+
+    Returns:
+        pd.DataFrame: One row per ticker with ``total_return``,
+        ``annualized_volatility``, ``sharpe_ratio``, ``max_drawdown`` and
+        optionally ``beta``.
+    """
+    prices = _as_frame(prices, price_field)
+    if isinstance(prices, pd.Series):
+        prices = prices.to_frame()
+    rets = returns(prices, kind)
+    x = _values(prices)
+    first, last = _first_valid(x), _first_valid(x[::-1])
+    table = pd.DataFrame({
+        'total_return': last / first - 1.0,
+        'annualized_volatility': annualized_volatility(rets, periods),
+        'sharpe_ratio': sharpe_ratio(rets, risk_free, periods),
+        'max_drawdown': max_drawdown(prices),
+    }, index=prices.columns)
+    if benchmark is not None:
+        table['beta'] = beta(rets, returns(pd.Series(benchmark), kind))
+    logger.info(f"Computed metrics for {len(table)} tickers over "
+                f"{len(prices)} dates")
+    return table
+
+
+def _as_frame(data, price_field: str = 'Close'):
+    """Panels become a dates x tickers frame; Series/DataFrames pass through."""
+    if hasattr(data, 'present') and hasattr(data, 'field'):
+        frame = data.field(price_field)
+        return frame.where(data.present)
+    return data
+
+
+def _values(data) -> np.ndarray:
+    x = data.to_numpy(dtype=np.float64) if hasattr(data, 'to_numpy') \
+        else np.asarray(data, dtype=np.float64)
+    return x.reshape(len(x), -1)
+
+
+def _wrap(values: np.ndarray, like):
+    if isinstance(like, pd.Series):
+        return pd.Series(values[:, 0], index=like.index, name=like.name)
+    return pd.DataFrame(values, index=like.index, columns=like.columns)
+
+
+def _reduce(values: np.ndarray, like):
+    if isinstance(like, pd.DataFrame):
+        return pd.Series(values, index=like.columns)
+    return float(values[0])
+
+
+def _nanstd(x: np.ndarray, ddof: int) -> np.ndarray:
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        return np.nanstd(x, axis=0, ddof=ddof)
+
+
+def _window_sum(x: np.ndarray, window: int) -> np.ndarray:
+    c = np.cumsum(x, axis=0)
+    out = c.copy()
+    out[window:] -= c[:-window]
+    return out
+
+
+def _first_valid(x: np.ndarray) -> np.ndarray:
+    valid = ~np.isnan(x)
+    rows = valid.argmax(axis=0)
+    first = x[rows, np.arange(x.shape[1])]
+    first[~valid.any(axis=0)] = np.nan
+    return first
@@ -0,0 +1,210 @@
+"""
+Multi-ticker price panel: one contiguous float64 block of date x ticker x
+field.
+
+Replaces the ``df_aapl, df_amzn, ...`` argument lists: missing-value
+counts, ``describe()`` and the indicators run once over every ticker with
+vectorised NumPy, so adding a ticker is a data change, not a signature
+change. Dates are the union over all tickers. A boolean ``present`` mask
+records which dates each ticker actually traded, which keeps missing
+values apart from dates before a listing.
+"""
+import logging
+import warnings
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from scripts.indicators import get_backend
+
+logger = logging.getLogger(__name__)
+
+OHLCV_FIELDS = ('Open', 'High', 'Low', 'Close', 'Volume')
+INDICATOR_FIELDS = ('SMA_20', 'RSI', 'MACD', 'MACD_Signal', 'MACD_Hist')
+
+
+class PricePanel:
+    """
+    Prices for many tickers in a single ``(dates, tickers, fields)`` array.
+
+    Args:
+        values (np.ndarray): Float block of shape (dates, tickers, fields).
+        dates (pd.DatetimeIndex): Sorted union of trading dates.
+        tickers (list): Ticker symbols, one per column.
+        fields (list): Field names, e.g. ``Open ... Volume``.
+        present (np.ndarray, optional): Bool (dates, tickers) mask of rows
+            each ticker has. Defaults to "any field is not NaN".
+    """
+
+    def __init__(self, values: np.ndarray, dates, tickers, fields,
+                 present: Optional[np.ndarray] = None):
+        values = np.ascontiguousarray(values, dtype=np.float64)
+        if values.shape != (len(dates), len(tickers), len(fields)):
+            raise ValueError(f"values shape {values.shape} does not match "
+                             f"{len(dates)} dates x {len(tickers)} tickers x "
+                             f"{len(fields)} fields")
+        self.values = values
+        self.dates = pd.DatetimeIndex(dates)
+        self.tickers = list(tickers)
+        self.fields = list(fields)
+        if present is None:
+            present = ~np.isnan(values).all(axis=2)
+        self.present = present
+
+    @classmethod
+    def from_frames(cls, frames: Dict[str, pd.DataFrame],
+                    fields: Iterable[str] = OHLCV_FIELDS,
+                    date_column: str = 'Date') -> 'PricePanel':
+        """
+        Build a panel from per-ticker DataFrames.
+
+        Args:
+            frames (dict): Ticker -> DataFrame with a ``Date`` column or a
+                DatetimeIndex.
+            fields (Iterable[str]): Columns to keep; missing ones are NaN.
+            date_column (str): Name of the date column.
+
+        Returns:
+            PricePanel: The combined panel.
+        """
+        fields = list(fields)
+        dates = {t: _dates(df, date_column) for t, df in frames.items()}
+        union = np.unique(np.concatenate([d.to_numpy() for d in dates.values()]))
+        values = np.full((len(union), len(frames), len(fields)), np.nan)
+        present = np.zeros((len(union), len(frames)), dtype=bool)
+
+        for j, (ticker, df) in enumerate(frames.items()):
+            rows = np.searchsorted(union, dates[ticker].to_numpy())
+            present[rows, j] = True
+            for k, field in enumerate(fields):
+                if field in df.columns:
+                    values[rows, j, k] = df[field].to_numpy(dtype=np.float64)
+
+        logger.info(f"Built panel of {len(frames)} tickers x {len(union)} "
+                    f"dates x {len(fields)} fields")
+        return cls(values, pd.DatetimeIndex(union), list(frames), fields,
+                   present)
+
+    @classmethod
+    def from_files(cls, sources, fields: Iterable[str] = OHLCV_FIELDS
+                   ) -> 'PricePanel':
+        """
+        Build a panel from ``<TICKER>_historical_data.csv`` files.
+
+        Args:
+            sources: Directory, list of paths or ticker->path mapping.
+            fields (Iterable[str]): Columns to keep.
+
+        Returns:
+            PricePanel: The combined panel.
+        """
+        from scripts.universe import ticker_files
+
+        usecols = ['Date', *fields]
+        frames = {t: pd.read_csv(path, usecols=lambda c: c in usecols)
+                  for t, path in ticker_files(sources).items()}
+        return cls.from_frames(frames, fields=fields)
+
+    @property
+    def nbytes(self) -> int:
+        return self.values.nbytes + self.present.nbytes + self.dates.nbytes
+
+    def field(self, name: str) -> pd.DataFrame:
+        """Return one field as a dates x tickers DataFrame."""
+        k = self.fields.index(name)
+        return pd.DataFrame(self.values[:, :, k], index=self.dates,
+                            columns=self.tickers)
+
+    def ticker(self, name: str) -> pd.DataFrame:
+        """Return one ticker's rows as a dates x fields DataFrame."""
+        j = self.tickers.index(name)
+        rows = self.present[:, j]
+        return pd.DataFrame(self.values[rows, j, :], index=self.dates[rows],
+                            columns=self.fields)
+
+    def missing_counts(self) -> pd.DataFrame:
+        """
+        Count missing values per field and ticker.
+
+        Only dates a ticker has rows for are counted, so a late listing is
+        not reported as missing data.
+
+        Returns:
+            pd.DataFrame: Fields x tickers counts.
+        """
+        missing = np.isnan(self.values) & self.present[:, :, None]
+        return pd.DataFrame(missing.sum(axis=0).T, index=self.fields,
+                            columns=self.tickers)
+
+    def describe(self, field: str = 'Close') -> pd.DataFrame:
+        """
+        ``Series.describe()`` of one field for every ticker at once.
+
+        Returns:
+            pd.DataFrame: count/mean/std/min/25%/50%/75%/max x tickers.
+        """
+        x = np.where(self.present, self.values[:, :, self.fields.index(field)],
+                     np.nan)
+        count = (~np.isnan(x)).sum(axis=0)
+        # Tickers without rows yield NaN ("Mean of empty slice" warnings).
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            stats = [count, np.nanmean(x, axis=0), np.nanstd(x, axis=0, ddof=1),
+                     np.nanmin(x, axis=0),
+                     *np.nanpercentile(x, [25, 50, 75], axis=0),
+                     np.nanmax(x, axis=0)]
+        return pd.DataFrame(np.vstack(stats),
+                            index=['count', 'mean', 'std', 'min', '25%', '50%',
+                                   '75%', 'max'],
+                            columns=self.tickers)
+
+    def with_indicators(self, backend: Optional[str] = 'numpy',
+                        price_field: str = 'Close') -> 'PricePanel':
+        """
+        Return a new panel with SMA_20, RSI and MACD fields appended.
+
+        Each ticker's indicators run over its own trading dates only: its
+        present rows are compacted to the top of the block before the
+        backend call and scattered back afterwards, so a date another
+        ticker traded on is not a gap. With the NumPy backend each
+        indicator is still one vectorised call over all tickers. A missing
+        value inside a ticker's own rows propagates NaN forward, as it
+        does in TA-Lib.
+
+        Args:
+            backend (str, optional): Indicator backend name.
+            price_field (str): Field the indicators are computed from.
+
+        Returns:
+            PricePanel: Panel with ``INDICATOR_FIELDS`` added.
+        """
+        ind = get_backend(backend)
+        # Stable sort puts each column's present rows first, in date order;
+        # the padding below them is NaN and is dropped again on scatter.
+        order = np.argsort(~self.present, axis=0, kind='stable')
+        close = np.take_along_axis(
+            self.values[:, :, self.fields.index(price_field)], order, axis=0)
+        counts = self.present.sum(axis=0)
+        close[np.arange(len(self.dates))[:, None] >= counts[None, :]] = np.nan
+        macd, signal, hist = ind.macd(close, 12, 26, 9)
+        compact = np.stack([ind.sma(close, 20), ind.rsi(close, 14), macd,
+                            signal, hist], axis=2)
+        extra = np.empty_like(compact)
+        np.put_along_axis(extra, order[:, :, None], compact, axis=0)
+        extra[~self.present] = np.nan
+        fields = self.fields + list(INDICATOR_FIELDS)
+        return PricePanel(np.concatenate([self.values, extra], axis=2),
+                          self.dates, self.tickers, fields, self.present)
+
+    def __repr__(self):
+        return (f"PricePanel({len(self.dates)} dates x {len(self.tickers)} "
+                f"tickers x {len(self.fields)} fields, "
+                f"{self.nbytes / 2**20:.1f} MiB)")
+
+
+def _dates(df: pd.DataFrame, date_column: str) -> pd.DatetimeIndex:
+    if date_column in df.columns:
+        return pd.DatetimeIndex(pd.to_datetime(df[date_column]))
+    return pd.DatetimeIndex(df.index)
+
@@ -1,15 +1,25 @@
-import matplotlib.pyplot as plt
 import pandas as pd
-from textblob import TextBlob
-from ta.trend import SMAIndicator, EMAIndicator, MACD
-from ta.momentum import RSIIndicator
+from scripts.indicators import get_backend, output_dtype
+from scripts.sentiment import score_headlines
+from src.instrumentation import instrumented
+from src.lazy import lazy_import
+
+# Loaded on first use; importing this module stays cheap.
+plt = lazy_import('matplotlib.pyplot')
+textblob = lazy_import('textblob')
 
 
 def compute_sentiment_score(text):
-    analysis = TextBlob(text)
+    analysis = textblob.TextBlob(text)
     return analysis.sentiment.polarity
 
 
+def compute_sentiment_scores(headlines):
+    """Score a whole headline Series at once; same polarity as above."""
+    return score_headlines(headlines)
+
+
+@instrumented
 def plot_sentiment_distribution(news_df):
     sentiment_counts = news_df['sentiment_score_word'].value_counts(
     ).sort_index()
@@ -21,6 +31,7 @@ def plot_sentiment_distribution(news_df):
     plt.show()
 
 
+@instrumented
 def plot_publisher_sentiment(news_df, publisher):
     publisher_data = news_df[news_df['publisher'] == publisher]
     sentiment_counts = publisher_data['sentiment_score_word'].value_counts(
@@ -60,6 +71,7 @@ def compute_descriptive_statistics(df_aapl, df_amzn, df_goog, df_meta, df_msft,
     return stats
 
 
+@instrumented
 def plot_closing_prices(df_aapl, df_amzn, df_goog, df_meta, df_msft, df_nvda):
     fig, axs = plt.subplots(2, 3, figsize=(20, 10))
 
@@ -93,30 +105,33 @@ def plot_closing_prices(df_aapl, df_amzn, df_goog, df_meta, df_msft, df_nvda):
     plt.show()
 
 
-def add_technical_indicators(df):
-    # Ensure 'Close' column is float
-    df['Close'] = df['Close'].astype(float)
+@instrumented
+def add_technical_indicators(df, backend=None):
+    # TA-Lib if installed, else NumPy; pass backend='ta' for the old values.
+    # The backends read Close without copying it into the frame again and
+    # the new columns keep its precision (float32 prices, float32 columns).
+    ind = get_backend(backend)
+    close = df['Close'].to_numpy()
+    dtype = output_dtype(close)
 
     # Simple Moving Average (SMA)
-    sma_indicator = SMAIndicator(close=df['Close'], window=20)
-    df['SMA'] = sma_indicator.sma_indicator()
+    df['SMA'] = ind.sma(close, 20).astype(dtype, copy=False)
 
     # Exponential Moving Average (EMA)
-    ema_indicator = EMAIndicator(close=df['Close'], window=20)
-    df['EMA'] = ema_indicator.ema_indicator()
+    df['EMA'] = ind.ema(close, 20).astype(dtype, copy=False)
 
     # Relative Strength Index (RSI)
-    rsi_indicator = RSIIndicator(close=df['Close'], window=14)
-    df['RSI'] = rsi_indicator.rsi()
+    df['RSI'] = ind.rsi(close, 14).astype(dtype, copy=False)
 
     # MACD and Signal Line
-    macd_indicator = MACD(close=df['Close'])
-    df['MACD'] = macd_indicator.macd()
-    df['MACD_Signal'] = macd_indicator.macd_signal()
+    macd, signal, _ = ind.macd(close)
+    df['MACD'] = macd.astype(dtype, copy=False)
+    df['MACD_Signal'] = signal.astype(dtype, copy=False)
 
     return df
 
 
+@instrumented
 def plot_technical_vs_close(df_aapl, df_amzn, df_goog, df_meta, df_msft, df_nvda, indicator):
     fig, axs = plt.subplots(2, 3, figsize=(20, 10))
     tickers = {
@@ -137,6 +152,7 @@ def plot_technical_vs_close(df_aapl, df_amzn, df_goog, df_meta, df_msft, df_nvda
     plt.show()
 
 
+@instrumented
 def plot_rsi_comparison(df_aapl, df_amzn, df_goog, df_meta, df_msft, df_nvda):
     stocks = {
         "AAPL": df_aapl, "GOOG": df_goog, "AMZN": df_amzn,
@@ -159,6 +175,7 @@ def plot_rsi_comparison(df_aapl, df_amzn, df_goog, df_meta, df_msft, df_nvda):
     plt.show()
 
 
+@instrumented
 def plot_macd_comparison(df_aapl, df_amzn, df_goog, df_meta, df_msft, df_nvda):
     stocks = {
         "AAPL": df_aapl, "GOOG": df_goog, "AMZN": df_amzn,
@@ -181,3 +198,47 @@ def plot_macd_comparison(df_aapl, df_amzn, df_goog, df_meta, df_msft, df_nvda):
 
     plt.tight_layout()
     plt.show()
+
+
+@instrumented
+def plot_panel_closing_prices(panel, tickers=None, ncols=3):
+    """Closing prices for any number of tickers from a PricePanel."""
+    tickers = tickers or panel.tickers
+    close = panel.field('Close')
+    nrows = -(-len(tickers) // ncols)
+    fig, axs = plt.subplots(nrows, ncols, figsize=(20, 5 * nrows),
+                            squeeze=False)
+    for ax, ticker in zip(axs.flat, tickers):
+        series = close[ticker].dropna()
+        ax.plot(series.index, series.values, label=ticker)
+        ax.legend()
+        ax.set_xlabel('Date')
+        ax.set_ylabel('Close Price')
+    for ax in axs.flat[len(tickers):]:
+        ax.set_visible(False)
+    plt.tight_layout()
+    plt.show()
+
+
+@instrumented
+def plot_panel_rsi_comparison(panel, tickers=None):
+    """Close and RSI side by side for every ticker of an indicator panel."""
+    tickers = tickers or panel.tickers
+    close, rsi = panel.field('Close'), panel.field('RSI')
+    fig, axs = plt.subplots(len(tickers), 2, figsize=(16, 3.7 * len(tickers)),
+                            squeeze=False)
+    for i, name in enumerate(tickers):
+        rows = close[name].notna()
+        axs[i][0].plot(close.index[rows], close[name][rows], label="Close")
+        axs[i][0].set_title(f"{name} Stock Price")
+        axs[i][0].legend()
+
+        axs[i][1].plot(rsi.index[rows], rsi[name][rows], color='orange',
+                       label="RSI")
+        axs[i][1].axhline(70, color='red', linestyle='--')
+        axs[i][1].axhline(30, color='green', linestyle='--')
+        axs[i][1].set_title(f"{name} RSI")
+        axs[i][1].legend()
+
+    plt.tight_layout()
+    plt.show()
@@ -0,0 +1,298 @@
+"""
+Streaming indicators and threshold alerts for live bar feeds.
+
+An asyncio consumer reads OHLCV bars from an ``asyncio.Queue``, a
+newline-delimited JSON socket feed or a replay of ticker CSV files, updates
+SMA/RSI/MACD per bar with one ``IncrementalIndicators`` per ticker, and
+emits an ``Alert`` when
+
+* RSI crosses the 70/30 lines drawn in ``plot_rsi_comparison``
+  (``rsi_overbought``/``rsi_oversold`` going in, ``rsi_exit_overbought``/
+  ``rsi_exit_oversold`` coming back), or
+* MACD crosses its signal line (``macd_bullish``/``macd_bearish``).
+
+Per-ticker state is the indicators' fixed-size windows plus the previous
+RSI and MACD histogram, so memory grows with the number of tickers, not
+bars. Each bar costs O(1) work; the time from taking a bar off the feed to
+having its alerts is recorded in a fixed-size ring buffer and reported by
+``StreamingEngine.latency()``.
+
+    python -m scripts.streaming --replay data/
+    python -m scripts.streaming --connect localhost:9000
+"""
+import argparse
+import asyncio
+import heapq
+import json
+import logging
+import math
+import time
+from typing import (AsyncIterator, Callable, Dict, Iterable, Iterator, List,
+                    NamedTuple, Optional)
+
+import numpy as np
+
+from scripts.incremental import IncrementalIndicators
+
+logger = logging.getLogger(__name__)
+
+RSI_OVERBOUGHT = 70.0
+RSI_OVERSOLD = 30.0
+LATENCY_SAMPLES = 100_000
+# Replay sources yield to the event loop every this many bars.
+REPLAY_BATCH = 256
+
+
+class Bar(NamedTuple):
+    ticker: str
+    time: object
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+
+    @classmethod
+    def from_json(cls, line) -> 'Bar':
+        """Parse ``{"ticker": ..., "time": ..., "close": ...}``."""
+        d = json.loads(line)
+        close = float(d['close'])
+        return cls(d['ticker'], d.get('time'), float(d.get('open', close)),
+                   float(d.get('high', close)), float(d.get('low', close)),
+                   close, float(d.get('volume', 0.0)))
+
+    def to_json(self) -> str:
+        d = self._asdict()
+        d['time'] = str(self.time)
+        return json.dumps(d)
+
+
+class Alert(NamedTuple):
+    ticker: str
+    time: object
+    kind: str
+    value: float
+
+
+class _TickerState:
+    __slots__ = ('indicators', 'rsi', 'hist', 'last')
+
+    def __init__(self, indicator_options):
+        self.indicators = IncrementalIndicators(**indicator_options)
+        self.rsi = math.nan
+        self.hist = math.nan
+        self.last = None
+
+
+class StreamingEngine:
+    """
+    Per-ticker incremental indicators with RSI and MACD crossover alerts.
+
+    Args:
+        overbought (float): Upper RSI line.
+        oversold (float): Lower RSI line.
+        on_alert (callable, optional): Called with every ``Alert``.
+        latency_samples (int): Size of the latency ring buffer.
+        **indicator_options: Passed to ``IncrementalIndicators`` (periods).
+    """
+
+    def __init__(self, overbought: float = RSI_OVERBOUGHT,
+                 oversold: float = RSI_OVERSOLD,
+                 on_alert: Optional[Callable[[Alert], None]] = None,
+                 latency_samples: int = LATENCY_SAMPLES,
+                 **indicator_options):
+        self.overbought = overbought
+        self.oversold = oversold
+        self.on_alert = on_alert
+        self.indicator_options = indicator_options
+        self.tickers: Dict[str, _TickerState] = {}
+        self.bars = 0
+        self.alerts = 0
+        self._latency = np.zeros(latency_samples, dtype=np.int64)
+
+    def update(self, bar: Bar) -> List[Alert]:
+        """
+        Apply one bar and return the alerts it triggers.
+
+        Bars for a ticker must arrive in time order.
+        """
+        state = self.tickers.get(bar.ticker)
+        if state is None:
+            state = self.tickers[bar.ticker] = _TickerState(
+                self.indicator_options)
+        row = state.indicators.update(bar.close)
+        state.last = row
+        rsi, hist = row['RSI'], row['MACD_Hist']
+        alerts = []
+
+        prev = state.rsi
+        # NaN comparisons are False, so the warm-up emits nothing.
+        if prev <= self.overbought < rsi:
+            alerts.append(Alert(bar.ticker, bar.time, 'rsi_overbought', rsi))
+        elif prev > self.overbought >= rsi:
+            alerts.append(Alert(bar.ticker, bar.time, 'rsi_exit_overbought',
+                                rsi))
+        if prev >= self.oversold > rsi:
+            alerts.append(Alert(bar.ticker, bar.time, 'rsi_oversold', rsi))
+        elif prev < self.oversold <= rsi:
+            alerts.append(Alert(bar.ticker, bar.time, 'rsi_exit_oversold',
+                                rsi))
+
+        prev = state.hist
+        if prev <= 0.0 < hist:
+            alerts.append(Alert(bar.ticker, bar.time, 'macd_bullish', hist))
+        elif prev >= 0.0 > hist:
+            alerts.append(Alert(bar.ticker, bar.time, 'macd_bearish', hist))
+
+        state.rsi, state.hist = rsi, hist
+        return alerts
+
+    async def run(self, source: AsyncIterator[Bar],
+                  sink: Optional[asyncio.Queue] = None) -> dict:
+        """
+        Consume bars until ``source`` is exhausted.
+
+        Args:
+            source: Async iterator of ``Bar`` (see ``queue_source``,
+                ``socket_source`` and ``replay_source``).
+            sink (asyncio.Queue, optional): Receives every ``Alert``.
+
+        Returns:
+            dict: ``latency()`` for the run.
+        """
+        latency, size = self._latency, len(self._latency)
+        clock = time.perf_counter_ns
+        async for bar in source:
+            start = clock()
+            alerts = self.update(bar)
+            for alert in alerts:
+                if self.on_alert is not None:
+                    self.on_alert(alert)
+                if sink is not None:
+                    sink.put_nowait(alert)
+            latency[self.bars % size] = clock() - start
+            self.bars += 1
+            self.alerts += len(alerts)
+        stats = self.latency()
+        logger.info(f"Streamed {self.bars} bars for {len(self.tickers)} "
+                    f"tickers, {self.alerts} alerts, p99 latency "
+                    f"{stats['p99_us']:.1f}us")
+        return stats
+
+    def snapshot(self, ticker: str) -> Optional[dict]:
+        """Latest indicator values for ``ticker``."""
+        state = self.tickers.get(ticker)
+        return None if state is None else dict(state.last)
+
+    def latency(self) -> dict:
+        """
+        Per-bar processing time over the most recent bars.
+
+        Returns:
+            dict: ``bars``, ``mean_us``, ``p50_us``, ``p99_us`` and
+            ``max_us``.
+        """
+        n = min(self.bars, len(self._latency))
+        if n == 0:
+            return {'bars': 0, 'mean_us': math.nan, 'p50_us': math.nan,
+                    'p99_us': math.nan, 'max_us': math.nan}
+        us = self._latency[:n] / 1000.0
+        p50, p99 = np.percentile(us, [50, 99])
+        return {'bars': self.bars, 'mean_us': float(us.mean()),
+                'p50_us': float(p50), 'p99_us': float(p99),
+                'max_us': float(us.max())}
+
+
+async def queue_source(queue: asyncio.Queue) -> AsyncIterator[Bar]:
+    """Yield bars from a queue until a ``None`` sentinel arrives."""
+    while True:
+        bar = await queue.get()
+        if bar is None:
+            return
+        yield bar
+
+
+async def socket_source(host: str, port: int) -> AsyncIterator[Bar]:
+    """Yield bars from a TCP feed of newline-delimited JSON (``Bar.to_json``)."""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                return
+            if line.strip():
+                yield Bar.from_json(line)
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+async def replay_source(frames, delay: float = 0.0) -> AsyncIterator[Bar]:
+    """
+    Replay stored prices as a live feed, interleaved by date.
+
+    Args:
+        frames: Ticker -> OHLCV DataFrame indexed by date, or anything
+            ``scripts.universe.ticker_files`` accepts.
+        delay (float): Seconds to sleep between bars; ``0`` replays as
+            fast as the consumer keeps up.
+    """
+    for i, bar in enumerate(replay_bars(frames)):
+        yield bar
+        if delay:
+            await asyncio.sleep(delay)
+        elif i % REPLAY_BATCH == 0:
+            await asyncio.sleep(0)
+
+
+def replay_bars(frames) -> Iterator[Bar]:
+    """Bars from several tickers merged into one time-ordered stream."""
+    if not isinstance(frames, dict) or not all(
+            hasattr(df, 'columns') for df in frames.values()):
+        from scripts.universe import ticker_files
+        from src.data.stock_loader import load_stock_data
+
+        frames = {t: load_stock_data(path, price_dtype=None)
+                  for t, path in ticker_files(frames).items()}
+    return heapq.merge(*(_frame_bars(t, df) for t, df in frames.items()),
+                       key=lambda bar: bar.time)
+
+
+def _frame_bars(ticker, df) -> Iterable[Bar]:
+    n = len(df)
+    close = df['Close'].to_numpy(dtype=np.float64)
+    columns = [df[c].to_numpy(dtype=np.float64) if c in df.columns else close
+               for c in ('Open', 'High', 'Low')]
+    volume = df['Volume'].to_numpy(dtype=np.float64) if 'Volume' in df.columns \
+        else np.zeros(n)
+    for i, t in enumerate(df.index):
+        yield Bar(ticker, t, columns[0][i], columns[1][i], columns[2][i],
+                  close[i], volume[i])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--replay', help='directory of ticker CSVs')
+    source.add_argument('--connect', metavar='HOST:PORT',
+                        help='newline-delimited JSON bar feed')
+    parser.add_argument('--delay', type=float, default=0.0,
+                        help='seconds between replayed bars')
+    args = parser.parse_args(argv)
+
+    def show(alert):
+        print(f"{alert.time} {alert.ticker:<6} {alert.kind:<20} "
+              f"{alert.value:.2f}")
+
+    if args.replay:
+        feed = replay_source(args.replay, delay=args.delay)
+    else:
+        host, port = args.connect.rsplit(':', 1)
+        feed = socket_source(host, int(port))
+    stats = asyncio.run(StreamingEngine(on_alert=show).run(feed))
+    print(f"{stats['bars']} bars, p50 {stats['p50_us']:.1f}us, "
+          f"p99 {stats['p99_us']:.1f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,37 +1,41 @@
-import pandas as pd
-import talib
-import pynance as pn
-import matplotlib.pyplot as plt
+from scripts import metrics
+from scripts.indicators import get_backend, output_dtype
+# Typed OHLCV loader (float32 prices, int32 volume, DatetimeIndex).
+from src.data.stock_loader import load_stock_data  # noqa: F401
+from src.instrumentation import instrumented
+from src.lazy import lazy_import
 
-
-def load_stock_data(file_path):
-    """Load stock price data into a pandas DataFrame."""
-    df = pd.read_csv(file_path)
-    df['Date'] = pd.to_datetime(df['Date'])
-    df.set_index('Date', inplace=True)
-    return df
+# Loaded on first use; importing this module stays cheap.
+plt = lazy_import('matplotlib.pyplot')
 
 
-def calculate_technical_indicators(df):
-    """Calculate technical indicators using TA-Lib."""
+@instrumented
+def calculate_technical_indicators(df, backend=None):
+    """Calculate technical indicators (TA-Lib if installed, else NumPy)."""
+    ind = get_backend(backend)
+    close = df['Close'].to_numpy()
+    dtype = output_dtype(close)
     # Simple Moving Average (SMA)
-    df['SMA_20'] = talib.SMA(df['Close'], timeperiod=20)
+    df['SMA_20'] = ind.sma(close, 20).astype(dtype, copy=False)
     # Relative Strength Index (RSI)
-    df['RSI'] = talib.RSI(df['Close'], timeperiod=14)
+    df['RSI'] = ind.rsi(close, 14).astype(dtype, copy=False)
     # Moving Average Convergence Divergence (MACD)
-    df['MACD'], df['MACD_Signal'], df['MACD_Hist'] = talib.MACD(
-        df['Close'], fastperiod=12, slowperiod=26, signalperiod=9)
+    macd, signal, hist = ind.macd(close, fast=12, slow=26, signal=9)
+    df['MACD'] = macd.astype(dtype, copy=False)
+    df['MACD_Signal'] = signal.astype(dtype, copy=False)
+    df['MACD_Hist'] = hist.astype(dtype, copy=False)
     return df
 
 
 def calculate_financial_metrics(df):
-    """Calculate financial metrics using PyNance."""
-    returns = pn.data.returns(df['Close'])
-    volatility = pn.stats.volatility(df['Close'])
+    """Daily returns and annualized volatility (see ``scripts.metrics``)."""
+    returns = metrics.returns(df['Close'])
+    volatility = metrics.annualized_volatility(returns)
     print(f"Annualized Volatility: {volatility:.4f}")
-    return returns
+    return returns, volatility
 
 
+@instrumented
 def visualize_data(df):
     """Visualize stock price and technical indicators."""
     plt.figure(figsize=(12, 8))
@@ -69,5 +73,5 @@ if __name__ == "__main__":
     # Example usage
     df = load_stock_data('stock_data.csv')  # Replace with actual data path
     df = calculate_technical_indicators(df)
-    returns = calculate_financial_metrics(df)
+    returns, volatility = calculate_financial_metrics(df)
     visualize_data(df)
@@ -0,0 +1,130 @@
+"""
+Indicator computation over a whole ticker universe on a process pool.
+
+Workers receive file paths rather than DataFrames: each one loads its own
+ticker, computes the indicators and sends back only the indicator columns.
+At most ``max_in_flight`` tickers are pending at any time, so memory stays
+bounded however many files the universe has. A ``MappedPrices`` store
+can be passed instead of files; it pickles as its path, so workers read
+the shared memory-mapped arrays rather than re-parsing CSVs.
+"""
+import glob
+import logging
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Callable, Dict, Iterable, Optional, Union
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+TICKER_FILE_SUFFIX = '_historical_data.csv'
+INDICATOR_COLUMNS = ['Close', 'SMA', 'SMA_20', 'EMA', 'RSI', 'MACD',
+                     'MACD_Signal', 'MACD_Hist']
+
+
+def ticker_files(sources: Union[str, Iterable[str], Dict[str, str]]
+                 ) -> Dict[str, str]:
+    """
+    Resolve a directory, a list of paths or a ticker->path mapping.
+
+    Tickers are taken from ``<TICKER>_historical_data.csv`` file names, or
+    from the file stem for other names.
+
+    Args:
+        sources: Directory of ticker CSVs, iterable of paths, or mapping.
+
+    Returns:
+        dict: Ticker -> file path, in sorted ticker order.
+    """
+    if isinstance(sources, dict):
+        return dict(sorted(sources.items()))
+    if isinstance(sources, str):
+        if not os.path.isdir(sources):
+            raise NotADirectoryError(f"Not a directory: {sources}")
+        sources = glob.glob(os.path.join(sources, '*.csv'))
+
+    files = {}
+    for path in sources:
+        name = os.path.basename(path)
+        if name.endswith(TICKER_FILE_SUFFIX):
+            ticker = name[:-len(TICKER_FILE_SUFFIX)]
+        else:
+            ticker = os.path.splitext(name)[0]
+        files[ticker] = path
+    return dict(sorted(files.items()))
+
+
+def compute_universe_indicators(sources, indicator_func: Optional[Callable] = None,
+                                max_workers: Optional[int] = None,
+                                max_in_flight: Optional[int] = None
+                                ) -> pd.DataFrame:
+    """
+    Compute indicators for every ticker file on a process pool.
+
+    Args:
+        sources: Directory, list of paths, ticker->path mapping or a
+            ``src.data.price_arrays.MappedPrices`` store.
+        indicator_func (callable, optional): Function taking and returning a
+            price DataFrame, e.g. ``calculate_technical_indicators`` (the
+            default) or ``add_technical_indicators``. Must be picklable,
+            i.e. defined at module level.
+        max_workers (int, optional): Pool size; defaults to the CPU count.
+            ``1`` runs in-process without a pool.
+        max_in_flight (int, optional): Maximum tickers submitted but not yet
+            collected. Defaults to twice the pool size.
+
+    Returns:
+        pd.DataFrame: Long format with ``ticker``, ``Date`` and one column
+        per indicator, sorted by ticker and date.
+    """
+    if hasattr(sources, 'offsets') and hasattr(sources, 'frame'):
+        files = {ticker: sources for ticker in sources.tickers}
+    else:
+        files = ticker_files(sources)
+    if not files:
+        raise FileNotFoundError("No ticker files found")
+    if indicator_func is None:
+        from scripts.technical_analysis import calculate_technical_indicators
+        indicator_func = calculate_technical_indicators
+
+    workers = max_workers or os.cpu_count() or 1
+    frames = []
+    if workers == 1:
+        for ticker, path in files.items():
+            frames.append(_ticker_indicators(ticker, path, indicator_func))
+    else:
+        limit = max_in_flight or 2 * workers
+        pending = iter(files.items())
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            running = set()
+            for ticker, path in pending:
+                running.add(pool.submit(_ticker_indicators, ticker, path,
+                                        indicator_func))
+                if len(running) >= limit:
+                    done, running = wait(running, return_when=FIRST_COMPLETED)
+                    frames.extend(f.result() for f in done)
+            frames.extend(f.result() for f in running)
+
+    result = pd.concat(frames, ignore_index=True)
+    result['ticker'] = pd.Categorical(result['ticker'],
+                                      categories=list(files))
+    result = result.sort_values(['ticker', 'Date'], ignore_index=True)
+    logger.info(f"Computed indicators for {len(files)} tickers "
+                f"({len(result)} rows) with {workers} worker(s)")
+    return result
+
+
+def _ticker_indicators(ticker: str, source,
+                       indicator_func: Callable) -> pd.DataFrame:
+    from scripts.technical_analysis import load_stock_data
+
+    if isinstance(source, str):
+        df = load_stock_data(source)
+    else:
+        df = source.frame(ticker)
+    df = indicator_func(df)
+    columns = [c for c in INDICATOR_COLUMNS if c in df.columns]
+    out = df[columns].reset_index()
+    out.insert(0, 'ticker', ticker)
+    return out
@@ -1,8 +1,13 @@
 import logging
-import matplotlib.pyplot as plt
-import seaborn as sns
 import pandas as pd
 import numpy as np
+from visualization.decimation import axes_point_budget, decimate
+from visualization.plot_utils import finish_figure
+from src.instrumentation import instrumented
+from src.lazy import lazy_import
+
+plt = lazy_import('matplotlib.pyplot')
+sns = lazy_import('seaborn')
 
 logging.basicConfig(level=logging.INFO,
                     format='%(asctime)s - %(levelname)s - %(message)s')
@@ -12,7 +17,8 @@ class PlotGenerator:
     def __init__(self):
         logging.info("PlotGenerator initialized.")
 
-    def plot_histogram(self, df: pd.DataFrame, column: str, bins: int = 20, title: str | None = None, xlabel: str | None = None, ylabel: str = "Frequency") -> None:
+    @instrumented
+    def plot_histogram(self, df: pd.DataFrame, column: str, bins: int = 20, title: str | None = None, xlabel: str | None = None, ylabel: str = "Frequency", save_path: str | None = None, show: bool = True) -> None:
         """
         Displays a histogram of the specified column in the DataFrame.
 
@@ -23,6 +29,8 @@ class PlotGenerator:
             title (str): Plot title.
             xlabel (str): X-axis label.
             ylabel (str): Y-axis label.
+            save_path (str, optional): Write the figure to this file.
+            show (bool): Display the figure; ``False`` for headless runs.
         """
         try:
             if column not in df.columns:
@@ -36,13 +44,14 @@ class PlotGenerator:
             plt.ylabel(ylabel)
 
             logging.info(f"Displaying histogram for column '{column}'")
-            plt.show()
+            finish_figure(save_path, show)
 
         except Exception as e:
             logging.error(
                 f"Failed to display histogram for column '{column}': {e}")
 
-    def plot_ranked_bar_chart(self, df: pd.DataFrame, x_col: str, y_col: str, title: str, xlabel: str, ylabel: str, top_n: int = 20):
+    @instrumented
+    def plot_ranked_bar_chart(self, df: pd.DataFrame, x_col: str, y_col: str, title: str, xlabel: str, ylabel: str, top_n: int = 20, save_path: str | None = None, show: bool = True):
         """
         Plots a ranked bar chart.
 
@@ -54,6 +63,8 @@ class PlotGenerator:
             xlabel (str): Label for x-axis.
             ylabel (str): Label for y-axis.
             top_n (int): Number of top rows to display.
+            save_path (str, optional): Write the figure to this file.
+            show (bool): Display the figure; ``False`` for headless runs.
         """
         try:
             top_df = df.nlargest(top_n, y_col)
@@ -64,23 +75,33 @@ class PlotGenerator:
             plt.ylabel(ylabel)
             plt.xticks(rotation=45, ha='right')
             plt.tight_layout()
-            plt.show()
+            finish_figure(save_path, show)
             logging.info(
                 f"Plotted ranked bar chart for top {top_n} items by {y_col}")
         except Exception as e:
             logging.error(f"Error plotting ranked bar chart: {e}")
 
-    def plot_time_series(self, df: pd.DataFrame, date_column: str, value_column: str, title: str = "Time Series", xlabel: str = "Date", ylabel: str = "Count"):
+    @instrumented
+    def plot_time_series(self, df: pd.DataFrame, date_column: str, value_column: str, title: str = "Time Series", xlabel: str = "Date", ylabel: str = "Count", save_path: str | None = None, show: bool = True, full_fidelity: bool = False):
+        """
+        Line plot of one column over time.
+
+        Series longer than the axes' pixel width are min/max decimated and
+        drawn without markers; ``full_fidelity=True`` plots every point.
+        """
         try:
             plt.figure(figsize=(12, 6))
-            plt.plot(df[date_column], df[value_column],
-                     marker='o', linestyle='-')
+            x, y = df[date_column].to_numpy(), df[value_column].to_numpy()
+            n = len(y)
+            if not full_fidelity:
+                x, y = decimate(x, y, axes_point_budget())
+            plt.plot(x, y, marker='o' if len(y) == n else None, linestyle='-')
             plt.title(title)
             plt.xlabel(xlabel)
             plt.ylabel(ylabel)
             plt.grid(True)
             plt.tight_layout()
-            plt.show()
+            finish_figure(save_path, show)
             logging.info(
                 f"Time series plot generated for '{value_column}' over '{date_column}'")
         except Exception as e:
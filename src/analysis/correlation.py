@@ -0,0 +1,197 @@
+import pandas as pd
+import numpy as np
+import logging
+from typing import Iterable, Optional, Tuple
+
+# Configure logging
+logging.basicConfig(level=logging.INFO,
+                    format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+DEFAULT_LAGS = range(-5, 6)
+# Windows whose running-sum variance is below this fraction of the sum of
+# squares are constant up to rounding and get NaN.
+VARIANCE_RTOL = 1e-8
+
+
+def sentiment_return_panels(daily_sentiment: pd.DataFrame,
+                            prices: pd.DataFrame,
+                            stock_column: str = 'ticker',
+                            date_column: str = 'Date',
+                            price_column: str = 'Close',
+                            fill_value: Optional[float] = None
+                            ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Pivot daily sentiment and returns onto one dates x tickers grid.
+
+    The grid is every trading date in ``prices``, so a lag of one row is
+    one trading day even when a ticker had no news that day.
+
+    Args:
+        daily_sentiment (pd.DataFrame): Output of
+            ``aggregate_daily_sentiment`` (stock, Date, sentiment).
+        prices (pd.DataFrame): Long price data (ticker, Date, Close).
+        stock_column (str): Ticker column in ``prices``.
+        date_column (str): Date column in ``prices``.
+        price_column (str): Price the returns are computed from.
+        fill_value (float, optional): Sentiment for days without news.
+            NaN by default, which leaves those days out of the correlation.
+
+    Returns:
+        Tuple[pd.DataFrame, pd.DataFrame]: Sentiment and return frames with
+        the same index (dates) and columns (tickers).
+    """
+    close = pd.DataFrame({
+        'stock': prices[stock_column].astype(str).to_numpy(),
+        'Date': pd.to_datetime(prices[date_column]).to_numpy(),
+        'Close': prices[price_column].to_numpy(dtype=np.float64),
+    }).pivot_table(index='Date', columns='stock', values='Close',
+                   aggfunc='last')
+    returns = close.pct_change(fill_method=None)
+
+    sentiment = pd.DataFrame({
+        'stock': daily_sentiment['stock'].astype(str).to_numpy(),
+        'Date': pd.to_datetime(daily_sentiment['Date']).to_numpy(),
+        'sentiment': daily_sentiment['sentiment'].to_numpy(dtype=np.float64),
+    }).pivot_table(index='Date', columns='stock', values='sentiment',
+                   aggfunc='mean')
+    sentiment = sentiment.reindex(index=returns.index, columns=returns.columns)
+    if fill_value is not None:
+        sentiment = sentiment.fillna(fill_value)
+    return sentiment, returns
+
+
+def lagged_correlation(sentiment: pd.DataFrame, returns: pd.DataFrame,
+                       lags: Iterable[int] = DEFAULT_LAGS,
+                       min_periods: int = 10) -> pd.DataFrame:
+    """
+    Full-sample Pearson correlation of sentiment with lagged returns.
+
+    A positive lag pairs sentiment on day t with the return on day t + lag
+    (sentiment leading price); a negative lag pairs it with earlier returns.
+    Days where either side is missing are skipped pair by pair.
+
+    Args:
+        sentiment (pd.DataFrame): Dates x tickers sentiment.
+        returns (pd.DataFrame): Dates x tickers returns on the same grid.
+        lags (Iterable[int]): Lags in trading days.
+        min_periods (int): Fewer overlapping days than this gives NaN.
+
+    Returns:
+        pd.DataFrame: ``stock``, ``lag``, ``correlation`` and ``n``.
+    """
+    try:
+        lags = list(lags)
+        corr, n = _running_correlation(sentiment, returns, lags, window=None)
+        corr, n = corr[:, 0, :], n[:, 0, :]
+        corr[n < min_periods] = np.nan
+        result = pd.DataFrame({
+            'stock': np.tile(np.asarray(sentiment.columns, dtype=object),
+                             len(lags)),
+            'lag': np.repeat(lags, sentiment.shape[1]),
+            'correlation': corr.ravel(),
+            'n': n.ravel(),
+        })
+        logger.info(f"Computed lagged correlations for {sentiment.shape[1]} "
+                    f"tickers x {len(lags)} lags")
+        return result
+    except Exception as e:
+        logger.error(f"Error computing lagged correlation: {str(e)}")
+        raise
+
+
+def rolling_lagged_correlation(sentiment: pd.DataFrame, returns: pd.DataFrame,
+                               window: int = 60,
+                               lags: Iterable[int] = DEFAULT_LAGS,
+                               min_periods: Optional[int] = None
+                               ) -> pd.DataFrame:
+    """
+    Rolling-window correlation of sentiment with lagged returns.
+
+    Window sums come from differences of running sums, so each
+    (ticker, lag) series costs O(n) regardless of ``window``. The window
+    ends on the sentiment date.
+
+    Args:
+        sentiment (pd.DataFrame): Dates x tickers sentiment.
+        returns (pd.DataFrame): Dates x tickers returns on the same grid.
+        window (int): Window length in trading days.
+        lags (Iterable[int]): Lags in trading days.
+        min_periods (int, optional): Minimum overlapping days in a window.
+            Defaults to half the window.
+
+    Returns:
+        pd.DataFrame: Tidy ``stock``, ``Date``, ``lag``, ``correlation``
+        and ``n`` rows, one per window with enough data.
+    """
+    try:
+        lags = list(lags)
+        min_periods = window // 2 if min_periods is None else min_periods
+        corr, n = _running_correlation(sentiment, returns, lags, window=window)
+        keep = (n >= min_periods) & ~np.isnan(corr)
+        lag_idx, row_idx, col_idx = np.nonzero(keep)
+        result = pd.DataFrame({
+            'stock': np.asarray(sentiment.columns, dtype=object)[col_idx],
+            'Date': sentiment.index.to_numpy()[row_idx],
+            'lag': np.asarray(lags)[lag_idx],
+            'correlation': corr[keep],
+            'n': n[keep],
+        })
+        logger.info(f"Computed {len(result)} rolling correlations "
+                    f"(window={window}, {len(lags)} lags)")
+        return result
+    except Exception as e:
+        logger.error(f"Error computing rolling correlation: {str(e)}")
+        raise
+
+
+def _running_correlation(sentiment, returns, lags, window):
+    """
+    Return correlation and pair-count arrays shaped (lags, dates, tickers),
+    or (lags, 1, tickers) for the full sample (``window=None``).
+    """
+    x = sentiment.to_numpy(dtype=np.float64)
+    y = returns.reindex(index=sentiment.index,
+                        columns=sentiment.columns).to_numpy(dtype=np.float64)
+    # Correlation is shift invariant; centring keeps the running sums of
+    # squares from cancelling catastrophically on long histories.
+    with np.errstate(all='ignore'):
+        x = x - np.nan_to_num(np.nanmean(x, axis=0))
+        y = y - np.nan_to_num(np.nanmean(y, axis=0))
+    rows = x.shape[0]
+    shape = (len(lags), 1 if window is None else rows, x.shape[1])
+    corr = np.empty(shape)
+    count = np.empty(shape, dtype=np.int64)
+    shifted = np.empty_like(y)
+
+    for i, lag in enumerate(lags):
+        shifted.fill(np.nan)
+        if lag >= 0:
+            shifted[:rows - lag] = y[lag:]
+        else:
+            shifted[-lag:] = y[:rows + lag]
+        pair = ~np.isnan(x) & ~np.isnan(shifted)
+        xp = np.where(pair, x, 0.0)
+        yp = np.where(pair, shifted, 0.0)
+        n, sx, sy, sxx, syy, sxy = (
+            _window_sum(v, window)
+            for v in (pair.astype(np.float64), xp, yp, xp * xp, yp * yp,
+                      xp * yp))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            vx, vy = n * sxx - sx * sx, n * syy - sy * sy
+            varies = ((vx > VARIANCE_RTOL * n * sxx)
+                      & (vy > VARIANCE_RTOL * n * syy))
+            corr[i] = np.where(varies, (n * sxy - sx * sy) / np.sqrt(vx * vy),
+                               np.nan)
+        count[i] = np.rint(n)
+    return np.clip(corr, -1.0, 1.0, out=corr), count
+
+
+def _window_sum(values, window):
+    """Trailing ``window`` sums from one running sum (full sum if None)."""
+    if window is None:
+        return values.sum(axis=0, keepdims=True)
+    total = np.cumsum(values, axis=0)
+    if window < values.shape[0]:
+        total[window:] -= total[:-window].copy()
+    return total
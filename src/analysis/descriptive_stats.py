@@ -0,0 +1,193 @@
+import pandas as pd
+import numpy as np
+import logging
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Iterable, Optional, Union
+
+from src.data_analyzer import EXCHANGE_TZ
+
+# Configure logging
+logging.basicConfig(level=logging.INFO,
+                    format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+DESCRIBE_PERCENTILES = (0.25, 0.5, 0.75)
+
+
+class NewsStatsAccumulator:
+    """
+    Mergeable single-pass statistics for the news feed.
+
+    Holds a histogram of headline lengths (lengths are small integers, so
+    the histogram is an exact quantile sketch of a few KiB), publisher
+    counts and per-day counts. Memory depends on the number of distinct
+    publishers and days, not on the number of rows. Accumulators built on
+    different chunks or processes combine with ``merge``.
+
+    Args:
+        text_column (str): Headline column.
+        publisher_column (str): Publisher column.
+        date_column (str): Timestamp column. Time-zone aware timestamps
+            are counted on their New York (exchange) calendar day, so an
+            8 pm EDT headline stays on its publication day; naive ones are
+            taken as exchange time already.
+    """
+
+    def __init__(self, text_column: str = 'headline',
+                 publisher_column: str = 'publisher',
+                 date_column: str = 'date'):
+        self.text_column = text_column
+        self.publisher_column = publisher_column
+        self.date_column = date_column
+        self.rows = 0
+        self.lengths = np.zeros(0, dtype=np.int64)
+        self.publishers = pd.Series(dtype=np.int64)
+        self.days = pd.Series(dtype=np.int64)
+
+    def update(self, chunk: pd.DataFrame) -> 'NewsStatsAccumulator':
+        """Fold one chunk of rows into the statistics."""
+        self.rows += len(chunk)
+        lengths = chunk[self.text_column].str.len().dropna()
+        self._add_lengths(np.bincount(lengths.to_numpy(dtype=np.int64)))
+        self.publishers = _add_counts(
+            self.publishers, chunk[self.publisher_column].value_counts())
+        days = _calendar_days(chunk[self.date_column])
+        self.days = _add_counts(self.days, days.value_counts())
+        return self
+
+    def merge(self, other: 'NewsStatsAccumulator') -> 'NewsStatsAccumulator':
+        """Fold another accumulator's statistics into this one."""
+        self.rows += other.rows
+        self._add_lengths(other.lengths)
+        self.publishers = _add_counts(self.publishers, other.publishers)
+        self.days = _add_counts(self.days, other.days)
+        return self
+
+    def headline_stats(self) -> pd.Series:
+        """``str.len().describe()`` of the headlines, from the histogram."""
+        hist = self.lengths
+        count = int(hist.sum())
+        index = ['count', 'mean', 'std', 'min',
+                 *[f'{p:.0%}' for p in DESCRIBE_PERCENTILES], 'max']
+        if count == 0:
+            return pd.Series([0.0] + [np.nan] * (len(index) - 1), index=index,
+                             name='headline_length')
+        values = np.arange(len(hist), dtype=np.float64)
+        mean = (hist * values).sum() / count
+        var = (hist * (values - mean) ** 2).sum() / (count - 1) \
+            if count > 1 else np.nan
+        seen = np.nonzero(hist)[0]
+        stats = [count, mean, np.sqrt(var), seen[0],
+                 *[self._quantile(p, count) for p in DESCRIBE_PERCENTILES],
+                 seen[-1]]
+        return pd.Series(np.asarray(stats, dtype=np.float64), index=index,
+                         name='headline_length')
+
+    def publisher_counts(self) -> pd.Series:
+        """Articles per publisher, largest first (like ``value_counts``)."""
+        counts = self.publishers[self.publishers > 0]
+        order = np.lexsort((np.arange(len(counts)), -counts.to_numpy()))
+        return counts.iloc[order].rename('count').rename_axis(
+            self.publisher_column)
+
+    def daily_counts(self) -> pd.Series:
+        """Articles per calendar day, in date order."""
+        return self.days.sort_index().rename('count').rename_axis(
+            self.date_column)
+
+    def result(self) -> dict:
+        """Return the three ``compute_descriptive_stats`` outputs."""
+        return {'headline_stats': self.headline_stats(),
+                'publisher_counts': self.publisher_counts(),
+                'daily_counts': self.daily_counts()}
+
+    def _add_lengths(self, hist):
+        if len(hist) > len(self.lengths):
+            self.lengths = np.pad(self.lengths,
+                                  (0, len(hist) - len(self.lengths)))
+        self.lengths[:len(hist)] += hist
+
+    def _quantile(self, p, count):
+        """Linear-interpolated quantile, matching ``Series.quantile``."""
+        position = p * (count - 1)
+        cumulative = np.cumsum(self.lengths)
+        lower = np.searchsorted(cumulative, np.floor(position), side='right')
+        upper = np.searchsorted(cumulative, np.ceil(position), side='right')
+        return lower + (upper - lower) * (position - np.floor(position))
+
+
+def compute_descriptive_stats(data: Union[pd.DataFrame, Iterable[pd.DataFrame]],
+                              max_workers: Optional[int] = 1,
+                              max_in_flight: Optional[int] = None,
+                              **columns) -> dict:
+    """
+    Headline length statistics, publisher counts and daily counts.
+
+    Everything is computed in one pass. ``data`` can be a DataFrame or an
+    iterator of chunks such as ``iter_news_chunks``, in which case memory
+    stays constant regardless of the feed size.
+
+    Args:
+        data: News DataFrame or iterable of DataFrame chunks.
+        max_workers (int, optional): Processes folding chunks in parallel;
+            ``1`` (the default) stays in-process, ``None`` uses every CPU.
+        max_in_flight (int, optional): Chunks submitted but not yet merged.
+            Defaults to twice the pool size.
+        **columns: ``text_column``, ``publisher_column`` or ``date_column``
+            overrides passed to ``NewsStatsAccumulator``.
+
+    Returns:
+        dict: ``headline_stats`` (Series), ``publisher_counts`` (Series,
+        descending) and ``daily_counts`` (Series indexed by day).
+    """
+    try:
+        chunks = [data] if isinstance(data, pd.DataFrame) else data
+        total = NewsStatsAccumulator(**columns)
+        workers = max_workers or os.cpu_count() or 1
+        if workers == 1:
+            for chunk in chunks:
+                total.update(chunk)
+        else:
+            limit = max_in_flight or 2 * workers
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                running = set()
+                for chunk in chunks:
+                    running.add(pool.submit(_chunk_stats, chunk, columns))
+                    if len(running) >= limit:
+                        done, running = wait(running,
+                                             return_when=FIRST_COMPLETED)
+                        for future in done:
+                            total.merge(future.result())
+                for future in running:
+                    total.merge(future.result())
+
+        stats = total.result()
+        logger.info(f"Computed descriptive statistics for {total.rows} rows "
+                    f"({len(stats['publisher_counts'])} publishers, "
+                    f"{len(stats['daily_counts'])} days)")
+        return stats
+    except Exception as e:
+        logger.error(f"Error computing descriptive statistics: {str(e)}")
+        raise
+
+
+def _chunk_stats(chunk: pd.DataFrame, columns: dict) -> NewsStatsAccumulator:
+    return NewsStatsAccumulator(**columns).update(chunk)
+
+
+def _add_counts(total: pd.Series, counts: pd.Series) -> pd.Series:
+    counts = counts.astype(np.int64)
+    if isinstance(counts.index, pd.CategoricalIndex):
+        counts.index = counts.index.astype(object)
+    if total.empty:
+        return counts
+    return total.add(counts, fill_value=0).astype(np.int64)
+
+
+def _calendar_days(values: pd.Series) -> pd.Series:
+    if not pd.api.types.is_datetime64_any_dtype(values):
+        values = pd.to_datetime(values, format='ISO8601', utc=True)
+    if isinstance(values.dtype, pd.DatetimeTZDtype):
+        values = values.dt.tz_convert(EXCHANGE_TZ).dt.tz_localize(None)
+    return values.dt.normalize()
@@ -0,0 +1,184 @@
+import pandas as pd
+import numpy as np
+import logging
+from typing import Dict, Union
+from src.data_analyzer import localize_wall_clock, parse_timestamps
+
+# Configure logging
+logging.basicConfig(level=logging.INFO,
+                    format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+EXCHANGE_TZ = 'America/New_York'
+MARKET_CLOSE = '16:00'
+
+Calendar = Union[pd.DatetimeIndex, Dict[str, pd.DatetimeIndex], pd.DataFrame]
+
+
+def align_to_sessions(news: pd.DataFrame, calendar: Calendar,
+                      date_column: str = 'date', stock_column: str = 'stock',
+                      exchange_tz: str = EXCHANGE_TZ,
+                      market_close: str = MARKET_CLOSE,
+                      rollover: bool = True) -> pd.DataFrame:
+    """
+    Map every headline to the trading session it can first affect.
+
+    Timestamps are converted to exchange time. With ``rollover`` a headline
+    at or after ``market_close`` counts toward the next day. Weekends,
+    holidays and dates missing from a ticker's calendar roll forward to the
+    next trading day through an as-of join on (stock, timestamp).
+
+    Args:
+        news (pd.DataFrame): Headlines with ``date`` and ``stock`` columns.
+        calendar: Trading days. Either one DatetimeIndex shared by every
+            stock, a stock -> DatetimeIndex mapping, or a long DataFrame
+            with ``stock`` and ``Date`` columns (see ``trading_calendar``).
+        date_column (str): Timestamp column. Strings without an offset are
+            taken as exchange-local time.
+        stock_column (str): Ticker column.
+        exchange_tz (str): Exchange time zone.
+        market_close (str): Local time after which news rolls over.
+        rollover (bool): Apply the after-hours rollover.
+
+    Returns:
+        pd.DataFrame: ``news`` with a tz-naive ``session`` column (NaT when
+        no later trading day is known).
+    """
+    try:
+        local = _to_exchange_time(news[date_column], exchange_tz)
+        day = local.dt.tz_localize(None).dt.normalize()
+        if rollover:
+            after_close = (local.dt.tz_localize(None) - day
+                           >= pd.Timedelta(market_close + ':00'))
+            day = day + pd.to_timedelta(after_close.astype('int64'), unit='D')
+
+        if isinstance(calendar, pd.DatetimeIndex):
+            session = _next_session(day, calendar)
+        else:
+            session = _next_session_by_stock(day, news[stock_column], calendar)
+
+        aligned = news.assign(session=session)
+        logger.info(f"Aligned {len(news)} headlines to trading sessions "
+                    f"({int(session.isna().sum())} without a session)")
+        return aligned
+    except Exception as e:
+        logger.error(f"Error aligning news to sessions: {str(e)}")
+        raise
+
+
+def trading_calendar(prices: pd.DataFrame, stock_column: str = 'ticker',
+                     date_column: str = 'Date') -> pd.DataFrame:
+    """
+    Build a per-stock calendar from long price data.
+
+    Accepts the long output of ``compute_universe_indicators`` or any frame
+    with one row per (ticker, date), and a ``PricePanel``.
+
+    Returns:
+        pd.DataFrame: ``stock`` and ``Date`` columns, one row per session.
+    """
+    if hasattr(prices, 'present'):
+        rows, cols = np.nonzero(prices.present)
+        return pd.DataFrame({
+            'stock': np.asarray(prices.tickers, dtype=object)[cols],
+            'Date': prices.dates[rows],
+        })
+    return pd.DataFrame({
+        'stock': prices[stock_column].astype(str).to_numpy(),
+        'Date': pd.to_datetime(prices[date_column]).to_numpy(),
+    })
+
+
+def aggregate_daily_sentiment(aligned: pd.DataFrame,
+                              score_column: str = 'sentiment',
+                              stock_column: str = 'stock') -> pd.DataFrame:
+    """
+    Average headline sentiment per stock and session.
+
+    Returns:
+        pd.DataFrame: ``stock``, ``Date``, ``sentiment`` (mean) and
+        ``headlines`` (count) columns.
+    """
+    frame = pd.DataFrame({
+        'stock': aligned[stock_column].astype(str).to_numpy(),
+        'Date': aligned['session'].to_numpy(),
+        'score': aligned[score_column].to_numpy(dtype=np.float64),
+    }).dropna(subset=['Date'])
+    grouped = frame.groupby(['stock', 'Date'], sort=True)['score']
+    daily = grouped.agg(['mean', 'count']).reset_index()
+    return daily.rename(columns={'mean': 'sentiment', 'count': 'headlines'})
+
+
+def join_daily_returns(daily_sentiment: pd.DataFrame, prices: pd.DataFrame,
+                       stock_column: str = 'ticker', date_column: str = 'Date',
+                       price_column: str = 'Close') -> pd.DataFrame:
+    """
+    Attach each stock's daily close-to-close return to its daily sentiment.
+
+    Args:
+        daily_sentiment (pd.DataFrame): Output of
+            ``aggregate_daily_sentiment``.
+        prices (pd.DataFrame): Long price data (ticker, Date, Close).
+
+    Returns:
+        pd.DataFrame: ``stock``, ``Date``, ``sentiment``, ``headlines`` and
+        ``return`` for every day that has both news and a return.
+    """
+    px = pd.DataFrame({
+        'stock': prices[stock_column].astype(str).to_numpy(),
+        'Date': pd.to_datetime(prices[date_column]).to_numpy(),
+        'Close': prices[price_column].to_numpy(dtype=np.float64),
+    }).sort_values(['stock', 'Date'], ignore_index=True)
+    px['return'] = px.groupby('stock', sort=False)['Close'].pct_change()
+    merged = daily_sentiment.merge(px[['stock', 'Date', 'return']],
+                                   on=['stock', 'Date'], how='inner')
+    return merged.dropna(subset=['return']).reset_index(drop=True)
+
+
+def _to_exchange_time(values: pd.Series, exchange_tz: str) -> pd.Series:
+    if isinstance(values.dtype, pd.DatetimeTZDtype):
+        return values.dt.tz_convert(exchange_tz)
+    if pd.api.types.is_datetime64_dtype(values):
+        return localize_wall_clock(values, exchange_tz)
+
+    # Feed timestamps repeat a lot; parse each distinct string once.
+    return parse_timestamps(values, naive_tz=exchange_tz).dt.tz_convert(
+        exchange_tz)
+
+
+def _next_session(day: pd.Series, calendar: pd.DatetimeIndex) -> pd.Series:
+    sessions = pd.DatetimeIndex(calendar).tz_localize(None).normalize()
+    sessions = sessions.unique().sort_values()
+    pos = np.searchsorted(sessions.to_numpy(), day.to_numpy(), side='left')
+    known = (pos < len(sessions)) & day.notna().to_numpy()
+    out = np.full(len(day), np.datetime64('NaT'), dtype=sessions.dtype)
+    out[known] = sessions.to_numpy()[pos[known]]
+    return pd.Series(out, index=day.index)
+
+
+def _next_session_by_stock(day: pd.Series, stock: pd.Series,
+                           calendar) -> pd.Series:
+    if isinstance(calendar, dict):
+        calendar = pd.concat(
+            [pd.DataFrame({'stock': s, 'Date': pd.DatetimeIndex(d)})
+             for s, d in calendar.items()], ignore_index=True)
+    right = pd.DataFrame({
+        'stock': calendar['stock'].astype(str).to_numpy(),
+        'session': pd.DatetimeIndex(calendar['Date']).tz_localize(None)
+                     .normalize().to_numpy(),
+    })
+    right['key'] = right['session']
+    right = right.sort_values('key', ignore_index=True)
+
+    left = pd.DataFrame({
+        'row': np.arange(len(day)),
+        'stock': stock.astype(str).to_numpy(),
+        'key': day.to_numpy().astype(right['key'].dtype),
+    })
+    left = left[left['key'].notna()].sort_values('key', ignore_index=True)
+    merged = pd.merge_asof(left, right, on='key', by='stock',
+                           direction='forward')
+
+    out = np.full(len(day), np.datetime64('NaT'), dtype=right['session'].dtype)
+    out[merged['row'].to_numpy()] = merged['session'].to_numpy()
+    return pd.Series(out, index=day.index)
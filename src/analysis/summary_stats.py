@@ -0,0 +1,374 @@
+import pandas as pd
+import numpy as np
+import logging
+import math
+import os
+import warnings
+from concurrent.futures import (FIRST_COMPLETED, ProcessPoolExecutor,
+                                ThreadPoolExecutor, wait)
+from typing import Iterable, Iterator, List, Optional, Sequence, Union
+
+# Configure logging
+logging.basicConfig(level=logging.INFO,
+                    format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+DESCRIBE_PERCENTILES = (0.25, 0.5, 0.75)
+DEFAULT_RELATIVE_ACCURACY = 0.01
+DEFAULT_CHUNKSIZE = 100_000
+EXECUTORS = ('thread', 'process')
+PARQUET_EXTENSIONS = ('.parquet', '.pq')
+FEATHER_EXTENSIONS = ('.feather', '.arrow', '.ipc')
+
+Source = Union[pd.DataFrame, str, Iterable[pd.DataFrame]]
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch with a relative error guarantee (DDSketch).
+
+    Values are counted in logarithmic buckets ``(gamma**(i-1), gamma**i]``
+    with ``gamma = (1 + a) / (1 - a)``; every bucket is reported as the
+    value within relative error ``a`` of both its ends. Negative values use
+    a mirrored set of buckets. Memory depends on the range of magnitudes
+    (about 115 buckets per decade at ``a = 0.01``), not on the row count,
+    and two sketches merge by adding bucket counts.
+
+    Args:
+        relative_accuracy (float): ``a``, the relative error bound.
+    """
+
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.positive = _BucketStore()
+        self.negative = _BucketStore()
+        self.zeros = 0
+
+    @property
+    def count(self) -> int:
+        return self.positive.total + self.negative.total + self.zeros
+
+    def update(self, values) -> 'QuantileSketch':
+        """Add an array of values; NaNs are ignored."""
+        x = np.asarray(values, dtype=np.float64)
+        x = x[~np.isnan(x)]
+        tiny = np.finfo(np.float64).tiny
+        self.positive.add(self._index(x[x > tiny]))
+        self.negative.add(self._index(-x[x < -tiny]))
+        self.zeros += int(np.count_nonzero(np.abs(x) <= tiny))
+        return self
+
+    def merge(self, other: 'QuantileSketch') -> 'QuantileSketch':
+        if other.gamma != self.gamma:
+            raise ValueError("Cannot merge sketches with different accuracy")
+        self.positive.merge(other.positive)
+        self.negative.merge(other.negative)
+        self.zeros += other.zeros
+        return self
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate the ``q`` quantile with ``describe()``'s linear
+        interpolation between the order statistics around ``q * (n - 1)``.
+
+        Each of the two order statistics is estimated within relative error
+        ``a``, so the result is within ``a`` (relative) of the exact
+        percentile when both have the same sign, and within ``a`` times the
+        larger magnitude otherwise.
+        """
+        n = self.count
+        if n == 0:
+            return np.nan
+        rank = q * (n - 1)
+        lo, hi = math.floor(rank), math.ceil(rank)
+        low = self._value_at(lo)
+        if hi == lo:
+            return low
+        return low + (self._value_at(hi) - low) * (rank - lo)
+
+    def _index(self, x: np.ndarray) -> np.ndarray:
+        return np.ceil(np.log(x) / self._log_gamma).astype(np.int64)
+
+    def _value(self, index: int) -> float:
+        return 2.0 * self.gamma ** index / (self.gamma + 1.0)
+
+    def _value_at(self, rank: int) -> float:
+        negative = self.negative.counts[::-1]
+        if rank < self.negative.total:
+            pos = int(np.searchsorted(np.cumsum(negative), rank, side='right'))
+            return -self._value(self.negative.offset + len(negative) - 1 - pos)
+        rank -= self.negative.total
+        if rank < self.zeros:
+            return 0.0
+        rank -= self.zeros
+        pos = int(np.searchsorted(np.cumsum(self.positive.counts), rank,
+                                  side='right'))
+        return self._value(self.positive.offset + pos)
+
+
+class _BucketStore:
+    """Dense bucket counts for a contiguous range of bucket indices."""
+
+    def __init__(self):
+        self.offset = 0
+        self.counts = np.zeros(0, dtype=np.int64)
+
+    @property
+    def total(self) -> int:
+        return int(self.counts.sum())
+
+    def add(self, index: np.ndarray) -> None:
+        if len(index) == 0:
+            return
+        self._extend(int(index.min()), int(index.max()))
+        self.counts += np.bincount(index - self.offset,
+                                   minlength=len(self.counts))
+
+    def merge(self, other: '_BucketStore') -> None:
+        if not len(other.counts):
+            return
+        self._extend(other.offset, other.offset + len(other.counts) - 1)
+        start = other.offset - self.offset
+        self.counts[start:start + len(other.counts)] += other.counts
+
+    def _extend(self, lo: int, hi: int) -> None:
+        if not len(self.counts):
+            self.offset, self.counts = lo, np.zeros(hi - lo + 1, np.int64)
+            return
+        new_lo = min(lo, self.offset)
+        new_hi = max(hi, self.offset + len(self.counts) - 1)
+        if new_lo == self.offset and new_hi - new_lo + 1 == len(self.counts):
+            return
+        counts = np.zeros(new_hi - new_lo + 1, dtype=np.int64)
+        start = self.offset - new_lo
+        counts[start:start + len(self.counts)] = self.counts
+        self.offset, self.counts = new_lo, counts
+
+
+class SummaryAccumulator:
+    """
+    Mergeable ``describe()`` for numeric columns.
+
+    Count, mean and the sum of squared deviations are kept per column and
+    combined with Chan et al.'s parallel form of Welford's update, so the
+    result equals a single pass over all rows up to floating-point
+    rounding. Min and max are exact; percentiles come from a
+    ``QuantileSketch`` per column.
+
+    Args:
+        columns (sequence, optional): Columns to summarize. Defaults to the
+            numeric columns of the first chunk.
+        relative_accuracy (float): Error bound of the percentile sketches.
+    """
+
+    def __init__(self, columns: Optional[Sequence[str]] = None,
+                 relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY):
+        self.columns = list(columns) if columns is not None else None
+        self.relative_accuracy = relative_accuracy
+        self.count = self.mean = self.m2 = None
+        self.min = self.max = None
+        self.sketches: List[QuantileSketch] = []
+
+    def update(self, chunk: pd.DataFrame) -> 'SummaryAccumulator':
+        """Fold one chunk of rows into the statistics."""
+        if self.columns is None:
+            self.columns = list(chunk.select_dtypes('number').columns)
+        if len(chunk) == 0:
+            return self
+        x = chunk[self.columns].to_numpy(dtype=np.float64)
+        valid = ~np.isnan(x)
+        count = valid.sum(axis=0)
+        with warnings.catch_warnings(), np.errstate(invalid='ignore',
+                                                    divide='ignore'):
+            warnings.simplefilter('ignore', RuntimeWarning)
+            mean = np.where(count > 0, np.nansum(x, axis=0) / count, 0.0)
+            m2 = np.nansum((x - mean) ** 2, axis=0)
+            low, high = np.nanmin(x, axis=0), np.nanmax(x, axis=0)
+        part = SummaryAccumulator(self.columns, self.relative_accuracy)
+        part.count, part.mean, part.m2 = count, mean, m2
+        part.min, part.max = low, high
+        part.sketches = [QuantileSketch(self.relative_accuracy).update(x[:, j])
+                         for j in range(x.shape[1])]
+        return self.merge(part)
+
+    def merge(self, other: 'SummaryAccumulator') -> 'SummaryAccumulator':
+        """Combine with an accumulator built on other rows."""
+        if other.count is None:
+            return self
+        if self.count is None:
+            self.columns = other.columns
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.min, self.max = other.min, other.max
+            self.sketches = other.sketches
+            return self
+        if other.columns != self.columns:
+            raise ValueError("Cannot merge summaries of different columns")
+        n = self.count + other.count
+        delta = other.mean - self.mean
+        with np.errstate(invalid='ignore', divide='ignore'):
+            weight = np.where(n > 0, other.count / np.maximum(n, 1), 0.0)
+        self.mean = self.mean + delta * weight
+        self.m2 = self.m2 + other.m2 + delta ** 2 * self.count * weight
+        self.count = n
+        self.min = np.fmin(self.min, other.min)
+        self.max = np.fmax(self.max, other.max)
+        for mine, theirs in zip(self.sketches, other.sketches):
+            mine.merge(theirs)
+        return self
+
+    def result(self, percentiles: Sequence[float] = DESCRIBE_PERCENTILES
+               ) -> pd.DataFrame:
+        """
+        Statistics shaped like ``DataFrame.describe()``.
+
+        The relative accuracy of the percentile rows is stored in
+        ``attrs['relative_accuracy']``.
+        """
+        columns = self.columns or []
+        if self.count is None:
+            empty = np.full(len(columns), np.nan)
+            count, mean, std, low, high = (np.zeros(len(columns)), empty,
+                                           empty, empty, empty)
+        else:
+            count = self.count.astype(np.float64)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                mean = np.where(count > 0, self.mean, np.nan)
+                std = np.sqrt(self.m2 / (count - 1))
+            std[count < 2] = np.nan
+            low, high = self.min, self.max
+        rows = {'count': count, 'mean': mean, 'std': std, 'min': low}
+        for q in percentiles:
+            estimates = np.array([s.quantile(q) for s in self.sketches]) \
+                if self.sketches else np.full(len(columns), np.nan)
+            # Clamping to the exact range can only reduce the error.
+            rows[_percentile_label(q)] = np.clip(estimates, low, high)
+        rows['max'] = high
+        table = pd.DataFrame(rows, index=columns).T
+        table.attrs['relative_accuracy'] = self.relative_accuracy
+        return table
+
+
+def summarize(source: Source, columns: Optional[Sequence[str]] = None,
+              chunksize: int = DEFAULT_CHUNKSIZE,
+              max_workers: Optional[int] = 1, executor: str = 'thread',
+              max_in_flight: Optional[int] = None,
+              relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+              percentiles: Sequence[float] = DESCRIBE_PERCENTILES
+              ) -> pd.DataFrame:
+    """
+    Out-of-core ``describe()`` over chunks of rows.
+
+    Count, mean, std, min and max match ``describe()`` up to rounding.
+    Percentiles are estimated by ``QuantileSketch`` and are within
+    ``relative_accuracy`` of the exact values (see
+    ``QuantileSketch.quantile``). Memory is bounded by ``chunksize`` times
+    the in-flight chunks, whatever the size of the source.
+
+    Args:
+        source: DataFrame, iterable of DataFrame chunks, or a path to a
+            Parquet, Feather/Arrow IPC or CSV file.
+        columns (sequence, optional): Columns to summarize (and read, for
+            files). Defaults to every numeric column.
+        chunksize (int): Rows per chunk when ``source`` is split here.
+        max_workers (int, optional): Pool size; ``1`` (the default) stays
+            in the calling thread, ``None`` uses every CPU.
+        executor (str): ``'thread'`` or ``'process'``. NumPy releases the
+            GIL in the reductions, so threads avoid pickling chunks.
+        max_in_flight (int, optional): Chunks submitted but not yet merged.
+            Defaults to twice the pool size.
+        relative_accuracy (float): Percentile error bound.
+        percentiles (sequence): Percentiles to report, as fractions.
+
+    Returns:
+        pd.DataFrame: Statistics x columns, like ``describe()``.
+    """
+    if executor not in EXECUTORS:
+        raise ValueError(f"Unknown executor '{executor}', expected one of "
+                         f"{EXECUTORS}")
+    try:
+        chunks = iter_source(source, columns, chunksize)
+        total = SummaryAccumulator(columns, relative_accuracy)
+        workers = max_workers or os.cpu_count() or 1
+        if workers == 1:
+            for chunk in chunks:
+                total.update(chunk)
+        else:
+            pool_type = (ThreadPoolExecutor if executor == 'thread'
+                         else ProcessPoolExecutor)
+            limit = max_in_flight or 2 * workers
+            with pool_type(max_workers=workers) as pool:
+                running = set()
+                for chunk in chunks:
+                    # Fix the columns on the first chunk so that every
+                    # partial summary covers the same ones.
+                    if columns is None:
+                        columns = list(chunk.select_dtypes('number').columns)
+                    running.add(pool.submit(_chunk_summary, chunk, columns,
+                                            relative_accuracy))
+                    if len(running) >= limit:
+                        done, running = wait(running,
+                                             return_when=FIRST_COMPLETED)
+                        for future in done:
+                            total.merge(future.result())
+                for future in running:
+                    total.merge(future.result())
+
+        table = total.result(percentiles)
+        rows = int(table.loc['count'].max()) if len(table.columns) else 0
+        logger.info(f"Summarized {len(table.columns)} columns over up to "
+                    f"{rows} rows; percentiles within "
+                    f"{relative_accuracy:.2%} relative error")
+        return table
+    except Exception as e:
+        logger.error(f"Error computing summary statistics: {str(e)}")
+        raise
+
+
+def iter_source(source: Source, columns: Optional[Sequence[str]] = None,
+                chunksize: int = DEFAULT_CHUNKSIZE) -> Iterator[pd.DataFrame]:
+    """
+    Yield DataFrame chunks from a frame, an iterable of frames or a file.
+
+    Parquet files are read row group by row group in batches and Feather /
+    Arrow IPC files are memory-mapped, so neither is loaded whole. Other
+    paths are streamed as CSV.
+    """
+    if isinstance(source, pd.DataFrame):
+        for start in range(0, max(len(source), 1), chunksize):
+            yield source.iloc[start:start + chunksize]
+    elif isinstance(source, (str, os.PathLike)):
+        path = os.fspath(source)
+        ext = os.path.splitext(path)[1].lower()
+        if ext in PARQUET_EXTENSIONS:
+            import pyarrow.parquet as pq
+            with pq.ParquetFile(path) as parquet:
+                for batch in parquet.iter_batches(
+                        batch_size=chunksize,
+                        columns=None if columns is None else list(columns)):
+                    yield batch.to_pandas()
+        elif ext in FEATHER_EXTENSIONS:
+            import pyarrow.feather as feather
+            table = feather.read_table(
+                path, columns=None if columns is None else list(columns),
+                memory_map=True)
+            for batch in table.to_batches(max_chunksize=chunksize):
+                yield batch.to_pandas()
+        else:
+            from src.data_loader import iter_chunks
+            for chunk in iter_chunks(path, chunksize=chunksize):
+                yield chunk if columns is None else chunk[list(columns)]
+    else:
+        yield from source
+
+
+def _chunk_summary(chunk: pd.DataFrame, columns, relative_accuracy
+                   ) -> SummaryAccumulator:
+    return SummaryAccumulator(columns, relative_accuracy).update(chunk)
+
+
+def _percentile_label(q: float) -> str:
+    return f"{q * 100:g}%"
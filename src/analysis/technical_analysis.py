@@ -0,0 +1,59 @@
+import pandas as pd
+import logging
+from typing import Optional, Tuple
+from scripts import metrics
+from scripts.indicators import get_backend, output_dtype
+from src.instrumentation import instrumented
+
+# Configure logging
+logging.basicConfig(level=logging.INFO,
+                    format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+@instrumented
+def calculate_technical_indicators(df: pd.DataFrame,
+                                   backend: Optional[str] = None,
+                                   rsi_window: int = 14,
+                                   macd_fast: int = 12, macd_slow: int = 26,
+                                   macd_signal: int = 9) -> pd.DataFrame:
+    """
+    Add SMA_20, RSI and MACD columns to a price DataFrame.
+
+    Args:
+        df (pd.DataFrame): Prices with a ``Close`` column.
+        backend (str, optional): ``'talib'``, ``'numpy'`` or ``'ta'``;
+            TA-Lib is used when installed.
+        rsi_window (int): RSI look-back in days.
+        macd_fast (int): Fast EMA span of the MACD.
+        macd_slow (int): Slow EMA span of the MACD.
+        macd_signal (int): Signal line EMA span.
+
+    Returns:
+        pd.DataFrame: ``df`` with the indicator columns added.
+    """
+    ind = get_backend(backend)
+    # Read without a float64 copy; results keep the price precision.
+    close = df['Close'].to_numpy()
+    dtype = output_dtype(close)
+    df['SMA_20'] = ind.sma(close, 20).astype(dtype, copy=False)
+    df['RSI'] = ind.rsi(close, rsi_window).astype(dtype, copy=False)
+    macd, signal, hist = ind.macd(close, fast=macd_fast, slow=macd_slow,
+                                  signal=macd_signal)
+    df['MACD'] = macd.astype(dtype, copy=False)
+    df['MACD_Signal'] = signal.astype(dtype, copy=False)
+    df['MACD_Hist'] = hist.astype(dtype, copy=False)
+    return df
+
+
+def calculate_financial_metrics(df: pd.DataFrame) -> Tuple[pd.Series, float]:
+    """
+    Daily simple returns and their annualized volatility.
+
+    Args:
+        df (pd.DataFrame): Prices with a ``Close`` column.
+
+    Returns:
+        Tuple[pd.Series, float]: Returns and annualized volatility.
+    """
+    returns = metrics.returns(df['Close'])
+    return returns, metrics.annualized_volatility(returns)
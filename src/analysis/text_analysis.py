@@ -0,0 +1,273 @@
+import pandas as pd
+import numpy as np
+import json
+import logging
+import os
+from functools import lru_cache
+from typing import List, Optional
+
+# Configure logging
+logging.basicConfig(level=logging.INFO,
+                    format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Same location rules as the CSV cache in data_loader.
+CACHE_DIR_ENV = 'KAIM_CACHE_DIR'
+CACHE_DIR_NAME = '.cache'
+TOPIC_CACHE_NAME = 'topics'
+
+TOKEN_PATTERN = r"[a-z][a-z0-9]+"
+DEFAULT_TOP_K = 3
+
+# Used when the NLTK stopwords corpus is not downloaded.
+_FALLBACK_STOPWORDS = frozenset("""
+a about above after again against all am an and any are as at be because
+been before being below between both but by can could did do does doing
+down during each few for from further had has have having he her here hers
+him his how i if in into is it its itself just me more most my no nor not
+now of off on once only or other our ours out over own same she should so
+some such than that the their theirs them then there these they this those
+through to too under until up very was we were what when where which while
+who whom why will with would you your yours
+""".split())
+
+
+class TopicIndex:
+    """
+    Persistent TF-IDF state for a growing headline corpus.
+
+    Keeps the vocabulary, a token -> lemma cache and a sparse document x
+    term count matrix. Headlines are keyed by a 64-bit hash of their text,
+    so a headline is tokenized and lemmatized once across all runs; IDF is
+    recomputed from the counts whenever scores are needed.
+    """
+
+    def __init__(self, lemmatizer: Optional[str] = None):
+        self.lemmatizer = _lemmatizer_name() if lemmatizer is None else lemmatizer
+        self.terms: List[str] = []
+        self.lemmas = {}
+        self.keys = np.empty(0, dtype=np.uint64)
+        self.counts = _sparse().csr_matrix((0, 0), dtype=np.float64)
+        self._term_index = pd.Index([], dtype=object)
+
+    @property
+    def n_docs(self) -> int:
+        return self.counts.shape[0]
+
+    def update(self, headlines: pd.Series) -> np.ndarray:
+        """
+        Add unseen headlines and return the row of every headline.
+
+        Args:
+            headlines (pd.Series): Headline text; duplicates are fine.
+
+        Returns:
+            np.ndarray: Row in ``counts`` for each input headline.
+        """
+        text = headlines.fillna('').astype(str)
+        keys = pd.util.hash_pandas_object(text, index=False).to_numpy()
+        rows = self._lookup(keys)
+        new = rows < 0
+        if new.any():
+            new_keys, first = np.unique(keys[new], return_index=True)
+            self._add(text[new].iloc[first], new_keys)
+            rows = self._lookup(keys)
+        return rows
+
+    def top_terms(self, rows: np.ndarray, k: int = DEFAULT_TOP_K) -> List[list]:
+        """
+        Return the ``k`` highest TF-IDF terms of each requested row.
+
+        Works on the sparse rows only: entries are ordered by (row, -score)
+        with one lexsort and each row keeps its first ``k``.
+        """
+        if not len(rows):
+            return []
+        sub = self.counts[rows]
+        scores = sub.data * self.idf()[sub.indices]
+        lengths = np.diff(sub.indptr)
+        row_of = np.repeat(np.arange(len(rows)), lengths)
+        order = np.lexsort((sub.indices, -scores, row_of))
+        rank = np.arange(len(order)) - sub.indptr[row_of]
+        keep = order[rank < k]
+        terms = np.asarray(self.terms, dtype=object)[sub.indices[keep]].tolist()
+        bounds = np.concatenate([[0], np.cumsum(np.minimum(lengths, k))]).tolist()
+        return [terms[a:b] for a, b in zip(bounds[:-1], bounds[1:])]
+
+    def idf(self) -> np.ndarray:
+        """Smoothed inverse document frequency, ``ln((1+N)/(1+df)) + 1``."""
+        df = np.bincount(self.counts.indices, minlength=len(self.terms))
+        return np.log((1.0 + self.n_docs) / (1.0 + df)) + 1.0
+
+    def tfidf(self):
+        """Return the L2-normalised TF-IDF matrix (CSR)."""
+        matrix = self.counts.multiply(self.idf()[None, :]).tocsr()
+        norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+        norms[norms == 0] = 1.0
+        return _sparse().diags(1.0 / norms) @ matrix
+
+    def save(self, directory: str) -> None:
+        """Write the vocabulary, keys and count matrix to ``directory``."""
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, 'vocabulary.json'), 'w',
+                  encoding='utf-8') as f:
+            json.dump({'lemmatizer': self.lemmatizer, 'terms': self.terms,
+                       'lemmas': self.lemmas}, f)
+        np.save(os.path.join(directory, 'keys.npy'), self.keys)
+        _sparse().save_npz(os.path.join(directory, 'counts.npz'), self.counts,
+                           compressed=False)
+
+    @classmethod
+    def load(cls, directory: str) -> 'TopicIndex':
+        """Read an index written by ``save``."""
+        with open(os.path.join(directory, 'vocabulary.json'),
+                  encoding='utf-8') as f:
+            vocabulary = json.load(f)
+        index = cls(lemmatizer=vocabulary['lemmatizer'])
+        index.terms = vocabulary['terms']
+        index.lemmas = vocabulary['lemmas']
+        index._term_index = pd.Index(index.terms, dtype=object)
+        index.keys = np.load(os.path.join(directory, 'keys.npy'))
+        index.counts = _sparse().load_npz(
+            os.path.join(directory, 'counts.npz')).tocsr()
+        return index
+
+    def _lookup(self, keys: np.ndarray) -> np.ndarray:
+        if not len(self.keys):
+            return np.full(len(keys), -1)
+        order = np.argsort(self.keys)
+        sorted_keys = self.keys[order]
+        pos = np.minimum(np.searchsorted(sorted_keys, keys), len(order) - 1)
+        return np.where(sorted_keys[pos] == keys, order[pos], -1)
+
+    def _add(self, text: pd.Series, keys: np.ndarray) -> None:
+        lower = text.str.lower()
+        doc = np.repeat(np.arange(len(text)),
+                        lower.str.count(TOKEN_PATTERN).to_numpy())
+        tokens = lower.str.findall(TOKEN_PATTERN).explode().dropna()
+        codes, uniques = pd.factorize(tokens)
+
+        # Lemmatize and filter each distinct token once.
+        stop = _stopwords()
+        unseen = [t for t in uniques if t not in self.lemmas]
+        lemmatize = _lemmatize_func(self.lemmatizer)
+        for token in unseen:
+            self.lemmas[token] = None if token in stop else lemmatize(token)
+        lemmas = pd.Series([self.lemmas[t] for t in uniques], dtype=object)
+
+        known = self._term_index.get_indexer(lemmas.dropna().unique())
+        fresh = lemmas.dropna().unique()[known < 0]
+        self.terms.extend(fresh)
+        self._term_index = pd.Index(self.terms, dtype=object)
+        term_of_unique = self._term_index.get_indexer(lemmas)
+        term = term_of_unique[codes]
+        valid = term >= 0
+
+        sparse = _sparse()
+        counts = sparse.csr_matrix(
+            (np.ones(valid.sum()), (doc[valid], term[valid])),
+            shape=(len(text), len(self.terms)))
+        counts.sum_duplicates()
+        old = self.counts
+        old.resize((old.shape[0], len(self.terms)))
+        self.counts = sparse.vstack([old, counts], format='csr')
+        self.keys = np.concatenate([self.keys, keys])
+        logger.info(f"Indexed {len(text)} new headlines "
+                    f"({len(unseen)} new tokens, {len(fresh)} new terms)")
+
+
+def extract_topics(df: pd.DataFrame, text_column: str = 'headline',
+                   top_k: int = DEFAULT_TOP_K, use_cache: bool = True,
+                   cache_dir: Optional[str] = None) -> pd.DataFrame:
+    """
+    Attach the top TF-IDF terms of every headline as ``top_terms``.
+
+    Headlines already in the persisted index are not re-tokenized or
+    re-lemmatized; only new ones are added before scoring. Lemmatization
+    uses NLTK's WordNet when its data is installed and is skipped
+    otherwise.
+
+    Args:
+        df (pd.DataFrame): News data with a headline column.
+        text_column (str): Column holding the text.
+        top_k (int): Terms kept per headline.
+        use_cache (bool): Load and save the index between runs.
+        cache_dir (str, optional): Index location. Defaults to
+            ``$KAIM_CACHE_DIR/topics`` or ``.cache/topics``.
+
+    Returns:
+        pd.DataFrame: Copy of ``df`` with a ``top_terms`` list column.
+    """
+    try:
+        directory = _index_dir(cache_dir)
+        index = _load_index(directory) if use_cache else None
+        index = index or TopicIndex()
+
+        codes, uniques = pd.factorize(df[text_column].fillna(''))
+        indexed = index.n_docs
+        rows = index.update(pd.Series(uniques, dtype=object))
+        terms = index.top_terms(rows, k=top_k)
+        if use_cache and index.n_docs != indexed:
+            index.save(directory)
+
+        out = df.copy()
+        out['top_terms'] = pd.Series(terms, dtype=object).take(
+            np.maximum(codes, 0)).to_numpy()
+        logger.info(f"Extracted top {top_k} terms for {len(df)} headlines "
+                    f"({index.n_docs} indexed, {len(index.terms)} terms)")
+        return out
+    except Exception as e:
+        logger.error(f"Error extracting topics: {str(e)}")
+        raise
+
+
+def _index_dir(cache_dir):
+    if cache_dir is not None:
+        return cache_dir
+    base = os.environ.get(CACHE_DIR_ENV) or CACHE_DIR_NAME
+    return os.path.join(base, TOPIC_CACHE_NAME)
+
+
+def _load_index(directory):
+    if not os.path.exists(os.path.join(directory, 'vocabulary.json')):
+        return None
+    try:
+        index = TopicIndex.load(directory)
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable topic index {directory}: {str(e)}")
+        return None
+    if index.lemmatizer != _lemmatizer_name():
+        logger.info("Lemmatizer changed; rebuilding the topic index")
+        return None
+    return index
+
+
+def _sparse():
+    import scipy.sparse
+    return scipy.sparse
+
+
+@lru_cache(maxsize=None)
+def _stopwords():
+    try:
+        from nltk.corpus import stopwords
+        return frozenset(stopwords.words('english'))
+    except (ImportError, LookupError):
+        return _FALLBACK_STOPWORDS
+
+
+@lru_cache(maxsize=None)
+def _lemmatizer_name():
+    try:
+        from nltk.stem import WordNetLemmatizer
+        WordNetLemmatizer().lemmatize('tests')
+        return 'wordnet'
+    except (ImportError, LookupError):
+        return 'none'
+
+
+def _lemmatize_func(name):
+    if name == 'wordnet':
+        from nltk.stem import WordNetLemmatizer
+        return WordNetLemmatizer().lemmatize
+    return lambda token: token
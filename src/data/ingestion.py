@@ -0,0 +1,473 @@
+import pandas as pd
+import asyncio
+import json
+import logging
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from src.data.stock_loader import (DATE_COLUMN, apply_ohlcv_schema,
+                                   load_stock_data)
+
+# Configure logging
+logging.basicConfig(level=logging.INFO,
+                    format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Price store: one file per ticker and calendar year under
+# <root>/<TICKER>/<year>.feather (.csv without pyarrow), plus a
+# _coverage.json listing the [start, end) date ranges already fetched. The
+# ranges are what was *requested*, not the dates that came back, so
+# weekends, holidays and days before a listing are not asked for again.
+# Empty answers from sources that also return empty frames on failure
+# (yfinance) are not recorded, so such ranges are retried on the next run.
+# Override the location with KAIM_PRICE_STORE.
+PRICE_STORE_ENV = 'KAIM_PRICE_STORE'
+PRICE_STORE_DIR = os.path.join('.cache', 'prices')
+COVERAGE_FILE = '_coverage.json'
+COLUMN_ORDER = ('Open', 'High', 'Low', 'Close', 'Adj Close', 'Volume',
+                'Dividends', 'Stock Splits')
+
+# yfinance errors that only mean the range has no rows (before a listing,
+# holidays, delisted symbols) rather than that the request failed.
+_YF_NO_DATA = re.compile(r'no (?:price )?data found|possibly delisted|'
+                         r'PricesMissing', re.IGNORECASE)
+
+DateLike = Union[str, pd.Timestamp]
+DateRange = Tuple[pd.Timestamp, pd.Timestamp]
+
+
+class PriceSource:
+    """
+    Where daily OHLCV prices come from.
+
+    Subclasses implement either the blocking ``download`` (run on a worker
+    thread) or the coroutine ``fetch``. Both return prices for dates in
+    ``[start, end)`` with a ``DatetimeIndex``; an empty frame means the
+    source has no rows in that range. Sources that cannot tell that apart
+    from a failure set ``empty_is_covered = False`` so an empty answer is
+    not recorded as fetched.
+    """
+
+    name = 'source'
+    empty_is_covered = True
+
+    async def fetch(self, ticker: str, start: pd.Timestamp,
+                    end: pd.Timestamp) -> pd.DataFrame:
+        return await asyncio.to_thread(self.download, ticker, start, end)
+
+    def download(self, ticker: str, start: pd.Timestamp,
+                 end: pd.Timestamp) -> pd.DataFrame:
+        raise NotImplementedError
+
+
+class YFinanceSource(PriceSource):
+    """
+    Yahoo Finance through ``yfinance``, imported on first use.
+
+    ``yf.download`` logs network and rate-limit errors and returns an empty
+    frame; those are raised here so ``ingest_async`` retries them.
+
+    Args:
+        auto_adjust (bool): Passed to ``yf.download``; ``False`` keeps both
+            ``Close`` and ``Adj Close``.
+    """
+
+    name = 'yfinance'
+    empty_is_covered = False
+
+    def __init__(self, auto_adjust: bool = False):
+        self.auto_adjust = auto_adjust
+
+    def download(self, ticker, start, end):
+        import yfinance as yf
+
+        df = yf.download(ticker, start=start.strftime('%Y-%m-%d'),
+                         end=end.strftime('%Y-%m-%d'),
+                         auto_adjust=self.auto_adjust, progress=False,
+                         threads=False)
+        # Keyed by ticker; another thread's download may reset it, in which
+        # case the empty frame is still not recorded as covered.
+        error = getattr(yf.shared, '_ERRORS', {}).get(ticker.upper())
+        if error and not _YF_NO_DATA.search(str(error)):
+            raise RuntimeError(f"yfinance failed for {ticker}: {error}")
+        if isinstance(df.columns, pd.MultiIndex):
+            # Newer releases return (field, ticker) columns even for one
+            # ticker.
+            df.columns = df.columns.get_level_values(0)
+        df.index.name = DATE_COLUMN
+        return df
+
+
+class CSVDirectorySource(PriceSource):
+    """
+    Serves ``<TICKER>_historical_data.csv`` files, e.g. the course data set
+    or test fixtures, as if they were a remote source.
+
+    Each file is read once and then sliced per request.
+
+    Args:
+        sources: Directory of ticker CSVs, iterable of paths or a
+            ticker -> path mapping (see ``scripts.universe.ticker_files``).
+    """
+
+    name = 'csv'
+
+    def __init__(self, sources):
+        from scripts.universe import ticker_files
+
+        self.files = ticker_files(sources)
+        self._frames: Dict[str, pd.DataFrame] = {}
+
+    def download(self, ticker, start, end):
+        if ticker not in self.files:
+            raise KeyError(f"No price file for ticker '{ticker}'")
+        if ticker not in self._frames:
+            self._frames[ticker] = load_stock_data(self.files[ticker],
+                                                   price_dtype=None)
+        df = self._frames[ticker]
+        return df[(df.index >= start) & (df.index < end)]
+
+
+class RateLimiter:
+    """
+    Spaces out calls so that at most ``rate`` start per ``period`` seconds.
+
+    Args:
+        rate (float): Calls allowed per period.
+        period (float): Period length in seconds.
+    """
+
+    def __init__(self, rate: float, period: float = 1.0):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.interval = period / rate
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class PriceStore:
+    """
+    Local price store partitioned by ticker and year.
+
+    Args:
+        root (str, optional): Store directory. Defaults to
+            ``$KAIM_PRICE_STORE`` or ``.cache/prices``.
+        price_dtype (str, optional): Dtype of the stored price columns (see
+            ``apply_ohlcv_schema``); ``None`` keeps float64.
+    """
+
+    def __init__(self, root: Optional[str] = None,
+                 price_dtype: Optional[str] = None):
+        self.root = root or os.environ.get(PRICE_STORE_ENV) or PRICE_STORE_DIR
+        self.price_dtype = price_dtype
+
+    def tickers(self) -> List[str]:
+        """Tickers with at least one stored range."""
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(name for name in os.listdir(self.root)
+                      if os.path.exists(os.path.join(self.root, name,
+                                                     COVERAGE_FILE)))
+
+    def coverage(self, ticker: str) -> List[DateRange]:
+        """Merged ``[start, end)`` ranges already fetched for ``ticker``."""
+        path = os.path.join(self.root, ticker, COVERAGE_FILE)
+        if not os.path.exists(path):
+            return []
+        with open(path) as f:
+            ranges = json.load(f)
+        return [(pd.Timestamp(s), pd.Timestamp(e)) for s, e in ranges]
+
+    def missing(self, ticker: str, start: DateLike,
+                end: DateLike) -> List[DateRange]:
+        """Parts of ``[start, end)`` not covered by earlier fetches."""
+        start, end = _day(start), _day(end)
+        gaps, cursor = [], start
+        for s, e in self.coverage(ticker):
+            if e <= cursor:
+                continue
+            if s >= end:
+                break
+            if s > cursor:
+                gaps.append((cursor, s))
+            cursor = max(cursor, e)
+        if cursor < end:
+            gaps.append((cursor, end))
+        return gaps
+
+    def write(self, ticker: str, df: pd.DataFrame,
+              covered: Optional[DateRange] = None) -> int:
+        """
+        Merge prices into the ticker's year partitions.
+
+        Rows for dates already stored are replaced. ``covered`` is recorded
+        as fetched even where ``df`` has no rows.
+
+        Returns:
+            int: Number of rows written.
+        """
+        directory = os.path.join(self.root, ticker)
+        os.makedirs(directory, exist_ok=True)
+        if len(df):
+            df = _normalize(df, self.price_dtype)
+            for year, part in df.groupby(df.index.year):
+                existing = self._read_partition(ticker, year)
+                if existing is not None:
+                    part = pd.concat([existing, part])
+                    part = part[~part.index.duplicated(keep='last')]
+                    part = part.sort_index()
+                self._write_partition(ticker, year, part)
+        if covered is not None:
+            self._add_coverage(ticker, covered)
+        return len(df)
+
+    def read(self, ticker: str, start: Optional[DateLike] = None,
+             end: Optional[DateLike] = None) -> pd.DataFrame:
+        """Stored prices for ``[start, end)`` (everything by default)."""
+        years = self._years(ticker)
+        if start is not None:
+            start = _day(start)
+            years = [y for y in years if y >= start.year]
+        if end is not None:
+            end = _day(end)
+            years = [y for y in years if y <= end.year]
+        parts = [self._read_partition(ticker, year) for year in years]
+        parts = [p for p in parts if p is not None]
+        if not parts:
+            return pd.DataFrame(columns=list(COLUMN_ORDER[:6]),
+                                index=pd.DatetimeIndex([], name=DATE_COLUMN))
+        df = pd.concat(parts) if len(parts) > 1 else parts[0]
+        if start is not None:
+            df = df[df.index >= start]
+        if end is not None:
+            df = df[df.index < end]
+        return df
+
+    def read_field(self, tickers: Iterable[str], field: str = 'Close',
+                   start: Optional[DateLike] = None,
+                   end: Optional[DateLike] = None) -> pd.DataFrame:
+        """One field for several tickers as a dates x tickers frame."""
+        columns = {}
+        for ticker in tickers:
+            df = self.read(ticker, start, end)
+            if len(df) and field in df.columns:
+                columns[ticker] = df[field]
+        return pd.DataFrame(columns).sort_index()
+
+    def _years(self, ticker) -> List[int]:
+        directory = os.path.join(self.root, ticker)
+        if not os.path.isdir(directory):
+            return []
+        return sorted({int(name.split('.')[0]) for name in os.listdir(directory)
+                       if name.split('.')[0].isdigit()})
+
+    def _partition_path(self, ticker, year, ext) -> str:
+        return os.path.join(self.root, ticker, f"{year}.{ext}")
+
+    def _read_partition(self, ticker, year) -> Optional[pd.DataFrame]:
+        path = self._partition_path(ticker, year, 'feather')
+        if os.path.exists(path):
+            return pd.read_feather(path).set_index(DATE_COLUMN)
+        path = self._partition_path(ticker, year, 'csv')
+        if os.path.exists(path):
+            return load_stock_data(path, price_dtype=self.price_dtype)
+        return None
+
+    def _write_partition(self, ticker, year, df) -> None:
+        ext = 'feather' if _has_pyarrow() else 'csv'
+        path = self._partition_path(ticker, year, ext)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            if ext == 'feather':
+                df.reset_index().to_feather(tmp_path)
+            else:
+                df.to_csv(tmp_path)
+            os.replace(tmp_path, path)
+        except Exception:
+            _remove(tmp_path)
+            raise
+        # A partition written in the other format is now stale.
+        _remove(self._partition_path(ticker, year,
+                                     'csv' if ext == 'feather' else 'feather'))
+
+    def _add_coverage(self, ticker, covered) -> None:
+        ranges = self.coverage(ticker) + [(_day(covered[0]), _day(covered[1]))]
+        merged = []
+        for s, e in sorted(ranges):
+            if merged and s <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], e))
+            else:
+                merged.append((s, e))
+        path = os.path.join(self.root, ticker, COVERAGE_FILE)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump([[s.strftime('%Y-%m-%d'), e.strftime('%Y-%m-%d')]
+                       for s, e in merged], f)
+        os.replace(tmp_path, path)
+
+
+async def ingest_async(tickers: Iterable[str], start: DateLike, end: DateLike,
+                       source: PriceSource, store: PriceStore,
+                       max_concurrency: int = 4, retries: int = 3,
+                       backoff: float = 0.5,
+                       rate_limit: Optional[float] = None) -> Dict[str, int]:
+    """
+    Fetch the missing parts of ``[start, end)`` for every ticker.
+
+    At most ``max_concurrency`` requests are in flight, failed requests are
+    retried with exponential backoff, and ``rate_limit`` caps the number of
+    requests started per second. Ranges ending after today are only
+    recorded as covered up to today, so today's partial bar is fetched
+    again on the next run.
+
+    Args:
+        tickers (iterable): Ticker symbols.
+        start, end: Date range, end exclusive (as in ``yf.download``).
+        source (PriceSource): Where prices come from.
+        store (PriceStore): Where they are kept.
+        max_concurrency (int): Requests in flight at once.
+        retries (int): Extra attempts per request after a failure.
+        backoff (float): Delay before the first retry, doubled each time.
+        rate_limit (float, optional): Requests started per second.
+
+    Returns:
+        dict: Ticker -> rows written by this run (0 when already stored).
+
+    Raises:
+        RuntimeError: If some tickers still failed after all retries. The
+            others are stored before it is raised.
+    """
+    tickers = list(dict.fromkeys(tickers))
+    start, end = _day(start), _day(end)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    limiter = RateLimiter(rate_limit) if rate_limit else None
+    today = pd.Timestamp.today().normalize()
+
+    async def fetch(ticker, s, e):
+        for attempt in range(retries + 1):
+            async with semaphore:
+                if limiter is not None:
+                    await limiter.acquire()
+                try:
+                    return await source.fetch(ticker, s, e)
+                except Exception as exc:
+                    if attempt == retries:
+                        raise
+                    delay = backoff * 2 ** attempt
+                    logger.warning(f"Fetching {ticker} {s.date()}..{e.date()} "
+                                   f"from {source.name} failed ({exc}); "
+                                   f"retrying in {delay:.2f}s")
+            await asyncio.sleep(delay)
+
+    async def ingest_ticker(ticker):
+        written = 0
+        for s, e in store.missing(ticker, start, end):
+            df = await fetch(ticker, s, e)
+            covered = (s, min(e, max(s, today)))
+            if covered[1] <= covered[0] or (
+                    not len(df) and not source.empty_is_covered):
+                covered = None
+            written += await asyncio.to_thread(store.write, ticker, df,
+                                               covered)
+        return written
+
+    begin = time.perf_counter()
+    results = await asyncio.gather(*(ingest_ticker(t) for t in tickers),
+                                   return_exceptions=True)
+    counts, failed = {}, {}
+    for ticker, result in zip(tickers, results):
+        if isinstance(result, BaseException):
+            failed[ticker] = result
+        else:
+            counts[ticker] = result
+    logger.info(f"Ingested {sum(counts.values())} rows for {len(counts)} "
+                f"tickers from {source.name} in "
+                f"{time.perf_counter() - begin:.3f}s")
+    if failed:
+        for ticker, exc in failed.items():
+            logger.error(f"Error ingesting {ticker}: {str(exc)}")
+        raise RuntimeError(f"Ingestion failed for {sorted(failed)}")
+    return counts
+
+
+def ingest(tickers: Iterable[str], start: DateLike, end: DateLike,
+           source: Optional[PriceSource] = None,
+           store: Optional[PriceStore] = None, **options) -> Dict[str, int]:
+    """
+    Blocking wrapper around ``ingest_async``.
+
+    ``source`` defaults to ``YFinanceSource`` and ``store`` to a
+    ``PriceStore`` at the default location. Safe to call where an event
+    loop is already running (Jupyter/ipykernel): the ingestion then runs
+    on its own loop in a worker thread.
+    """
+    coro = ingest_async(tickers, start, end, source or YFinanceSource(),
+                        store or PriceStore(), **options)
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
+
+
+def load_prices(tickers: Sequence[str], start: DateLike, end: DateLike,
+                source: Optional[PriceSource] = None,
+                store: Optional[PriceStore] = None,
+                **options) -> Dict[str, pd.DataFrame]:
+    """
+    Prices for several tickers, fetched only where the store lacks them.
+
+    Args:
+        tickers (sequence): Ticker symbols.
+        start, end: Date range, end exclusive.
+        source (PriceSource, optional): Defaults to ``YFinanceSource``.
+        store (PriceStore, optional): Defaults to the default store.
+        **options: Passed to ``ingest_async``.
+
+    Returns:
+        dict: Ticker -> prices indexed by date.
+    """
+    store = store or PriceStore()
+    ingest(tickers, start, end, source, store, **options)
+    return {ticker: store.read(ticker, start, end) for ticker in tickers}
+
+
+def _normalize(df: pd.DataFrame, price_dtype) -> pd.DataFrame:
+    df = apply_ohlcv_schema(df, price_dtype=price_dtype)
+    df.index.name = DATE_COLUMN
+    if df.index.tz is not None:
+        df.index = df.index.tz_localize(None)
+    known = [c for c in COLUMN_ORDER if c in df.columns]
+    df = df[known + [c for c in df.columns if c not in known]]
+    return df.sort_index()
+
+
+def _day(value: DateLike) -> pd.Timestamp:
+    return pd.Timestamp(value).normalize()
+
+
+def _has_pyarrow() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
@@ -0,0 +1,24 @@
+import pandas as pd
+import logging
+from src.data_loader import NEWS_DATE_COLUMN, NEWS_DTYPES, load_data
+
+# Configure logging
+logging.basicConfig(level=logging.INFO,
+                    format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def load_news_data(file_path: str, use_cache: bool = True) -> pd.DataFrame:
+    """
+    Load the analyst-ratings news feed with its typed schema.
+
+    Args:
+        file_path (str): Path to the news CSV file.
+        use_cache (bool): Read/write the columnar cache.
+
+    Returns:
+        pd.DataFrame: Headlines with categorical publisher/stock columns and
+        ``date`` parsed as UTC datetimes.
+    """
+    return load_data(file_path, dtype=NEWS_DTYPES,
+                     date_column=NEWS_DATE_COLUMN, use_cache=use_cache)
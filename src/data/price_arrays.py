@@ -0,0 +1,215 @@
+import pandas as pd
+import numpy as np
+import json
+import logging
+import os
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.data.stock_loader import DATE_COLUMN, load_stock_data
+
+# Configure logging
+logging.basicConfig(level=logging.INFO,
+                    format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Memory-mapped price store: a directory holding
+#   values.npy  (fields, rows) block, each ticker's rows contiguous,
+#   dates.npy   datetime64[ns] per row,
+#   index.json  field names and each ticker's [start, stop) row offsets.
+# Every (ticker, field) series is therefore one contiguous slice that NumPy,
+# TA-Lib and pandas can use without copying, and all processes that open the
+# store share the same page-cache copy of it.
+VALUES_FILE = 'values.npy'
+DATES_FILE = 'dates.npy'
+INDEX_FILE = 'index.json'
+MAPPED_FIELDS = ('Open', 'High', 'Low', 'Close', 'Volume')
+
+# Stores already opened by this process, keyed by (path, mode, index
+# version), so unpickling a MappedPrices in a worker costs a dict lookup.
+_OPEN_STORES: Dict[Tuple[str, str, int], 'MappedPrices'] = {}
+
+
+class MappedPrices:
+    """
+    Read-only view of a price store written by ``write_mapped_prices``.
+
+    Instances pickle as their path, so passing one to a process pool sends
+    a few bytes; each worker maps the same files instead of receiving a
+    copy of the data.
+
+    Args:
+        path (str): Store directory.
+        mmap_mode (str): ``np.load`` memory-map mode; ``'r'`` (default)
+            gives read-only views.
+    """
+
+    def __init__(self, path: str, mmap_mode: str = 'r'):
+        self.path = os.path.abspath(path)
+        self.mmap_mode = mmap_mode
+        with open(os.path.join(self.path, INDEX_FILE)) as f:
+            index = json.load(f)
+        self.fields: List[str] = index['fields']
+        self.offsets: Dict[str, Tuple[int, int]] = {
+            ticker: tuple(span) for ticker, span in index['tickers'].items()}
+        self.values = np.load(os.path.join(self.path, VALUES_FILE),
+                              mmap_mode=mmap_mode)
+        self.dates = np.load(os.path.join(self.path, DATES_FILE),
+                             mmap_mode=mmap_mode)
+
+    @property
+    def tickers(self) -> List[str]:
+        return list(self.offsets)
+
+    @property
+    def nbytes(self) -> int:
+        return self.values.nbytes + self.dates.nbytes
+
+    def array(self, ticker: str, field: str = 'Close') -> np.ndarray:
+        """One field of one ticker as a contiguous view into the map."""
+        start, stop = self.offsets[ticker]
+        return self.values[self.fields.index(field), start:stop]
+
+    def dates_of(self, ticker: str) -> pd.DatetimeIndex:
+        start, stop = self.offsets[ticker]
+        return pd.DatetimeIndex(self.dates[start:stop], name=DATE_COLUMN)
+
+    def series(self, ticker: str, field: str = 'Close') -> pd.Series:
+        """One field of one ticker as a Series backed by the map."""
+        return pd.Series(self.array(ticker, field), index=self.dates_of(ticker),
+                         name=field, copy=False)
+
+    def frame(self, ticker: str,
+              fields: Optional[Iterable[str]] = None) -> pd.DataFrame:
+        """
+        One ticker's rows as a dates x fields DataFrame backed by the map.
+
+        Columns added to the frame (e.g. by
+        ``calculate_technical_indicators``) live in process memory; the
+        mapped price columns are never written.
+        """
+        start, stop = self.offsets[ticker]
+        fields = list(fields) if fields is not None else self.fields
+        rows = [self.fields.index(f) for f in fields]
+        if rows == list(range(rows[0], rows[0] + len(rows))):
+            block = self.values[rows[0]:rows[-1] + 1, start:stop]
+        else:
+            block = self.values[rows, start:stop]
+        return pd.DataFrame(block.T, index=self.dates_of(ticker),
+                            columns=fields, copy=False)
+
+    def field(self, name: str = 'Close',
+              tickers: Optional[Iterable[str]] = None) -> pd.DataFrame:
+        """One field for several tickers as a dates x tickers frame (a copy)."""
+        tickers = self.tickers if tickers is None else list(tickers)
+        return pd.DataFrame({t: self.series(t, name) for t in tickers})
+
+    def __reduce__(self):
+        return (open_mapped_prices, (self.path, self.mmap_mode))
+
+    def __repr__(self):
+        return (f"MappedPrices({self.path!r}, {len(self.offsets)} tickers, "
+                f"{self.values.shape[1]} rows, {self.nbytes / 2**20:.1f} MiB)")
+
+
+def open_mapped_prices(path: str, mmap_mode: str = 'r') -> MappedPrices:
+    """Open a store, reusing this process's mapping when it is unchanged."""
+    path = os.path.abspath(path)
+    version = os.stat(os.path.join(path, INDEX_FILE)).st_mtime_ns
+    key = (path, mmap_mode, version)
+    if key not in _OPEN_STORES:
+        for stale in [k for k in _OPEN_STORES if k[:2] == key[:2]]:
+            del _OPEN_STORES[stale]
+        _OPEN_STORES[key] = MappedPrices(path, mmap_mode)
+    return _OPEN_STORES[key]
+
+
+def write_mapped_prices(sources, path: str,
+                        fields: Iterable[str] = MAPPED_FIELDS,
+                        dtype: str = 'float64') -> MappedPrices:
+    """
+    Materialize a ticker universe into a memory-mapped store.
+
+    Tickers are loaded one at a time and copied into the map, so peak
+    memory is one ticker plus whatever pages the OS keeps cached. Fields
+    a ticker lacks are NaN.
+
+    Args:
+        sources: Directory of ticker CSVs, iterable of paths, ticker ->
+            path mapping (see ``scripts.universe.ticker_files``) or ticker
+            -> DataFrame mapping (e.g. from ``PriceStore.read``).
+        path (str): Store directory; an existing store is replaced.
+        fields (Iterable[str]): Columns to keep.
+        dtype (str): Dtype of the value block.
+
+    Returns:
+        MappedPrices: The new store, opened read-only.
+    """
+    try:
+        fields = list(fields)
+        tickers = _ticker_sources(sources)
+        if not tickers:
+            raise FileNotFoundError("No tickers to store")
+        lengths = {t: _row_count(src) for t, src in tickers.items()}
+        total = sum(lengths.values())
+
+        os.makedirs(path, exist_ok=True)
+        suffix = f".{os.getpid()}.tmp"
+        values_path = os.path.join(path, VALUES_FILE)
+        dates_path = os.path.join(path, DATES_FILE)
+        values = np.lib.format.open_memmap(values_path + suffix, mode='w+',
+                                           dtype=dtype,
+                                           shape=(len(fields), total))
+        dates = np.lib.format.open_memmap(dates_path + suffix, mode='w+',
+                                          dtype='datetime64[ns]',
+                                          shape=(total,))
+        offsets, start = {}, 0
+        for ticker, src in tickers.items():
+            df = src if isinstance(src, pd.DataFrame) \
+                else load_stock_data(src, price_dtype=None)
+            if DATE_COLUMN in df.columns:
+                df = df.set_index(DATE_COLUMN)
+            stop = start + lengths[ticker]
+            if len(df) != lengths[ticker]:
+                raise ValueError(f"{ticker}: expected {lengths[ticker]} rows, "
+                                 f"loaded {len(df)}")
+            dates[start:stop] = pd.DatetimeIndex(df.index).as_unit('ns') \
+                .to_numpy()
+            for k, field in enumerate(fields):
+                values[k, start:stop] = df[field].to_numpy(dtype=np.float64) \
+                    if field in df.columns else np.nan
+            offsets[ticker] = [start, stop]
+            start = stop
+        values.flush()
+        dates.flush()
+        del values, dates
+        os.replace(values_path + suffix, values_path)
+        os.replace(dates_path + suffix, dates_path)
+
+        # The index goes last: a reader that finds it finds complete arrays.
+        index_path = os.path.join(path, INDEX_FILE)
+        with open(index_path + suffix, 'w') as f:
+            json.dump({'fields': fields, 'dtype': dtype, 'rows': total,
+                       'tickers': offsets}, f)
+        os.replace(index_path + suffix, index_path)
+        store = open_mapped_prices(path)
+        logger.info(f"Wrote {store!r}")
+        return store
+    except Exception as e:
+        logger.error(f"Error writing mapped prices: {str(e)}")
+        raise
+
+
+def _ticker_sources(sources) -> dict:
+    if isinstance(sources, dict) and all(isinstance(v, pd.DataFrame)
+                                         for v in sources.values()):
+        return dict(sources)
+    from scripts.universe import ticker_files
+    return ticker_files(sources)
+
+
+def _row_count(src) -> int:
+    if isinstance(src, pd.DataFrame):
+        return len(src)
+    # Data rows of a CSV: non-blank lines after the header.
+    with open(src, 'rb') as f:
+        return sum(1 for line in f if line.strip()) - 1
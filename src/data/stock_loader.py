@@ -0,0 +1,112 @@
+import pandas as pd
+import numpy as np
+import logging
+from typing import Optional
+
+# Configure logging
+logging.basicConfig(level=logging.INFO,
+                    format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Typed OHLCV schema. Prices are read straight into PRICE_DTYPE (float32
+# keeps about 7 significant digits, under half a cent for prices below
+# 100,000), Volume becomes int32 when it fits and dates become a
+# DatetimeIndex. Pass price_dtype=None for float64.
+DATE_COLUMN = 'Date'
+PRICE_COLUMNS = ('Open', 'High', 'Low', 'Close', 'Adj Close', 'Dividends',
+                 'Stock Splits')
+VOLUME_COLUMN = 'Volume'
+PRICE_DTYPE = 'float32'
+
+
+def load_stock_data(file_path: str,
+                    price_dtype: Optional[str] = PRICE_DTYPE) -> pd.DataFrame:
+    """
+    Load daily OHLCV prices indexed by date, using the typed OHLCV schema.
+
+    Args:
+        file_path (str): Path to a ``Date,Open,High,Low,Close,...`` CSV.
+        price_dtype (str, optional): Dtype of the price columns; ``None``
+            keeps float64.
+
+    Returns:
+        pd.DataFrame: Prices with a ``DatetimeIndex`` named ``Date``.
+    """
+    try:
+        dtype = {c: price_dtype for c in PRICE_COLUMNS} if price_dtype else None
+        df = pd.read_csv(file_path, dtype=dtype, parse_dates=[DATE_COLUMN],
+                         index_col=DATE_COLUMN)
+        if VOLUME_COLUMN in df.columns:
+            df[VOLUME_COLUMN] = compact_volume(df[VOLUME_COLUMN])
+        logger.info(f"Loaded {len(df)} price rows from {file_path} "
+                    f"({frame_nbytes(df) / 2**10:.1f} KiB)")
+        return df
+    except Exception as e:
+        logger.error(f"Error loading stock data: {str(e)}")
+        raise
+
+
+def apply_ohlcv_schema(df: pd.DataFrame,
+                       price_dtype: Optional[str] = PRICE_DTYPE
+                       ) -> pd.DataFrame:
+    """
+    Convert an already loaded price frame to the typed OHLCV schema.
+
+    A ``Date`` column (or a string index) becomes a ``DatetimeIndex``,
+    price columns become ``price_dtype`` and Volume is downcast. The
+    memory saved is logged.
+
+    Args:
+        df (pd.DataFrame): Raw prices, e.g. from ``pd.read_csv``.
+        price_dtype (str, optional): Dtype of the price columns; ``None``
+            keeps float64.
+
+    Returns:
+        pd.DataFrame: The converted frame (``df`` is not modified).
+    """
+    before = frame_nbytes(df)
+    if DATE_COLUMN in df.columns:
+        df = df.set_index(pd.DatetimeIndex(pd.to_datetime(df[DATE_COLUMN]),
+                                           name=DATE_COLUMN))
+        df = df.drop(columns=DATE_COLUMN)
+    elif not isinstance(df.index, pd.DatetimeIndex):
+        df = df.set_axis(pd.DatetimeIndex(pd.to_datetime(df.index),
+                                          name=df.index.name), axis=0)
+    else:
+        df = df.copy(deep=False)
+
+    dtypes = {c: price_dtype or 'float64' for c in PRICE_COLUMNS
+              if c in df.columns}
+    df = df.astype(dtypes)
+    if VOLUME_COLUMN in df.columns:
+        df[VOLUME_COLUMN] = compact_volume(df[VOLUME_COLUMN])
+
+    after = frame_nbytes(df)
+    logger.info(f"OHLCV schema: {before / 2**10:.1f} KiB -> "
+                f"{after / 2**10:.1f} KiB (saved {before - after} bytes)")
+    return df
+
+
+def compact_volume(volume: pd.Series) -> pd.Series:
+    """
+    Store share volumes as ``int32`` when they fit.
+
+    A signed type keeps day-over-day volume differences from wrapping.
+    Volumes with gaps, fractions or values beyond ``int32`` (about 2.1
+    billion shares) are left as they are.
+    """
+    values = volume.to_numpy()
+    if len(values) == 0 or volume.isna().any():
+        return volume
+    if not np.issubdtype(values.dtype, np.integer) \
+            and not np.array_equal(values, np.floor(values)):
+        return volume
+    limits = np.iinfo(np.int32)
+    if values.min() < limits.min or values.max() > limits.max:
+        return volume
+    return volume.astype(np.int32)
+
+
+def frame_nbytes(df: pd.DataFrame) -> int:
+    """Bytes held by a frame's columns and index, strings included."""
+    return int(df.memory_usage(deep=True, index=True).sum())
@@ -2,24 +2,53 @@ import pandas as pd
 import numpy as np
 import logging
 
+from src.instrumentation import instrumented
+
 # Configure logging
 logging.basicConfig(level=logging.INFO,
                     format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Timestamps are stored in UTC; features use the exchange's wall clock.
+# Strings without an offset are taken to be exchange time; in the repeated
+# fall-back hour they are read as the first (daylight-time) occurrence.
+EXCHANGE_TZ = 'America/New_York'
+# US equity sessions in minutes after local midnight: pre-market from
+# 04:00, regular 09:30-16:00, after-hours until 20:00. Weekends are
+# 'closed'; exchange holidays are not modelled.
+SESSIONS = ('closed', 'pre_market', 'regular', 'after_hours')
+_SESSION_EDGES = np.array([4 * 60, 9 * 60 + 30, 16 * 60, 20 * 60])
+_SESSION_CODES = np.array([0, 1, 2, 3, 0], dtype=np.int8)
+_HAS_OFFSET = r'(?:[+-]\d{2}:?\d{2}|Z)$'
+
 
-def get_summary_statistics(df: pd.DataFrame) -> pd.DataFrame:
+@instrumented
+def get_summary_statistics(df, **options) -> pd.DataFrame:
     """
     Compute summary statistics for the DataFrame.
 
+    An in-memory DataFrame gets the exact ``df.describe()``. A chunk
+    iterator or a path to a Parquet, Feather or CSV file is summarized out
+    of core by ``src.analysis.summary_stats.summarize``: exact count, mean,
+    std, min and max, and percentiles within ``relative_accuracy`` (1% by
+    default) of the exact values.
+
     Args:
-        df (pd.DataFrame): Input DataFrame.
+        df: Input DataFrame, iterable of DataFrame chunks, or file path.
+        **options: ``summarize`` options (``columns``, ``chunksize``,
+            ``max_workers``, ``executor``, ``relative_accuracy``,
+            ``percentiles``). Passing any with a DataFrame also selects the
+            out-of-core path.
 
     Returns:
         pd.DataFrame: Summary statistics.
     """
     try:
-        stats = df.describe()
+        if isinstance(df, pd.DataFrame) and not options:
+            stats = df.describe()
+        else:
+            from src.analysis.summary_stats import summarize
+            stats = summarize(df, **options)
         logger.info("Computed summary statistics")
         return stats
     except Exception as e:
@@ -27,20 +56,201 @@ def get_summary_statistics(df: pd.DataFrame) -> pd.DataFrame:
         raise
 
 
-def convert_timestamp(df: pd.DataFrame) -> pd.DataFrame:
+@instrumented
+def convert_timestamp(df: pd.DataFrame, column: str = 'date',
+                      exchange_tz: str = EXCHANGE_TZ,
+                      features: bool = True) -> pd.DataFrame:
     """
-    Convert Timestamp column to datetime and extract hour.
+    Normalize a timestamp column to UTC and add exchange-time features.
+
+    Each distinct value is parsed once (feeds repeat timestamps heavily)
+    and the results are mapped back by integer code. Mixed UTC offsets are
+    handled; values without an offset are read as exchange time.
 
     Args:
-        df (pd.DataFrame): Input DataFrame with Timestamp column.
+        df (pd.DataFrame): Input DataFrame with a timestamp column.
+        column (str): Column holding ISO8601 strings or datetimes.
+        exchange_tz (str): Time zone of the exchange-local view.
+        features (bool): Add the derived columns below.
 
     Returns:
-        pd.DataFrame: DataFrame with converted Timestamp and new Hour column.
+        pd.DataFrame: ``df`` with ``column`` as UTC datetimes and, when
+        ``features`` is set, ``ExchangeTime`` (tz-aware, exchange zone),
+        ``Hour`` and ``Weekday`` (0 = Monday, exchange time; nullable
+        ``Int8`` only if some timestamps are missing) and ``Session``
+        (categorical, see ``SESSIONS``).
     """
     try:
-        df['date'] = pd.to_datetime(df['date'])
-        logger.info("Converted Timestamp to datetime ")
+        codes, uniques = _factorize_timestamps(df[column], exchange_tz)
+        df[column] = _take(uniques, codes, df.index)
+        if features:
+            local = uniques.tz_convert(exchange_tz)
+            minutes = local.hour * 60 + local.minute
+            weekday = local.weekday
+            session = _SESSION_CODES[np.searchsorted(_SESSION_EDGES, minutes,
+                                                     side='right')]
+            session[weekday >= 5] = 0
+            df['ExchangeTime'] = _take(local, codes, df.index)
+            df['Hour'] = _take(local.hour.to_numpy(np.int8), codes, df.index)
+            df['Weekday'] = _take(weekday.to_numpy(np.int8), codes, df.index)
+            # Code -1 (missing) picks the appended -1, i.e. no category.
+            df['Session'] = pd.Categorical.from_codes(
+                np.append(session, np.int8(-1))[codes],
+                categories=list(SESSIONS))
+        logger.info(f"Converted {len(df)} timestamps "
+                    f"({len(uniques)} distinct) to UTC")
         return df
     except Exception as e:
         logger.error(f"Error converting timestamp: {str(e)}")
         raise
+
+
+def parse_timestamps(values: pd.Series,
+                     naive_tz: str = EXCHANGE_TZ) -> pd.Series:
+    """
+    Parse ISO8601 strings (or datetimes) to a UTC datetime Series.
+
+    Args:
+        values (pd.Series): Strings with or without UTC offsets, or
+            datetimes.
+        naive_tz (str): Zone assumed for values without an offset.
+
+    Returns:
+        pd.Series: ``datetime64[ns, UTC]`` values on the same index.
+    """
+    codes, uniques = _factorize_timestamps(values, naive_tz)
+    return _take(uniques, codes, values.index)
+
+
+def _factorize_timestamps(values: pd.Series, naive_tz: str):
+    """Integer codes and the distinct values as a UTC DatetimeIndex."""
+    codes, uniques = pd.factorize(values)
+    if isinstance(uniques, pd.DatetimeIndex):
+        if uniques.tz is None:
+            uniques = localize_wall_clock(uniques, naive_tz)
+        return codes, uniques.tz_convert('UTC')
+
+    text = pd.Series(uniques, dtype=object).astype(str)
+    utc = np.full(len(text), np.datetime64('NaT'), dtype='datetime64[ns]')
+    ok, seconds, aware = _parse_fixed_layout(text)
+    stamps = seconds.astype('datetime64[s]')
+    utc[ok & aware] = stamps[ok & aware]
+    naive = ok & ~aware
+    if naive.any():
+        utc[naive] = _localized_utc(pd.DatetimeIndex(stamps[naive]), naive_tz)
+
+    # Anything else (fractional seconds, other layouts) goes through pandas.
+    rest = ~ok & text.str.contains(_HAS_OFFSET).to_numpy()
+    if rest.any():
+        utc[rest] = pd.DatetimeIndex(pd.to_datetime(
+            text[rest], format='ISO8601', utc=True)).tz_localize(None)
+    rest = ~ok & ~rest
+    if rest.any():
+        utc[rest] = _localized_utc(pd.DatetimeIndex(pd.to_datetime(
+            text[rest], format='ISO8601')), naive_tz)
+    return codes, pd.DatetimeIndex(utc).tz_localize('UTC')
+
+
+def localize_wall_clock(wall, tz: str):
+    """
+    Attach ``tz`` to naive wall-clock times without losing any of them.
+
+    Times in the repeated fall-back hour are taken as the first (daylight
+    time) occurrence and times skipped by the spring-forward jump are
+    shifted to the end of the gap.
+
+    Args:
+        wall: Naive ``DatetimeIndex`` or datetime Series.
+        tz (str): Time zone name.
+
+    Returns:
+        The same type, tz-aware.
+    """
+    return wall.tz_localize(tz, ambiguous=np.ones(len(wall), dtype=bool),
+                            nonexistent='shift_forward')
+
+
+def _localized_utc(wall: pd.DatetimeIndex, tz: str) -> np.ndarray:
+    """Naive UTC datetimes for wall-clock times in ``tz``."""
+    return localize_wall_clock(wall, tz).tz_convert('UTC').tz_localize(
+        None).to_numpy()
+
+
+def _parse_fixed_layout(text: pd.Series):
+    """
+    Parse ``YYYY-MM-DD HH:MM:SS`` (or ``T``), optionally followed by ``Z`` or
+    ``+HH:MM``, with array arithmetic on the raw bytes.
+
+    Returns:
+        tuple: ``ok`` mask of rows in that layout, epoch seconds (UTC when
+        ``aware``, wall clock otherwise) and the ``aware`` mask.
+    """
+    n = len(text)
+    lengths = text.str.len().to_numpy()
+    ok = np.isin(lengths, (19, 20, 25))
+    seconds = np.zeros(n, dtype=np.int64)
+    aware = lengths > 19
+    if not ok.any():
+        return ok, seconds, aware
+    try:
+        raw = np.asarray(text.to_numpy(), dtype='S25')
+    except UnicodeEncodeError:
+        return np.zeros(n, dtype=bool), seconds, aware
+    c = raw.view(np.uint8).reshape(n, 25).astype(np.int64)
+    d = c - ord('0')
+
+    def number(*cols, rows=None):
+        # Digits are only validated on ``rows`` (default: all); the other
+        # rows' values are meaningless and must not be used.
+        value = np.zeros(n, dtype=np.int64)
+        for col in cols:
+            digit = (d[:, col] >= 0) & (d[:, col] <= 9)
+            if rows is None:
+                ok[:] &= digit
+            else:
+                ok[rows] &= digit[rows]
+            value = value * 10 + d[:, col]
+        return value
+
+    year, month, day = number(0, 1, 2, 3), number(5, 6), number(8, 9)
+    hour, minute, second = number(11, 12), number(14, 15), number(17, 18)
+    ok &= (c[:, 4] == ord('-')) & (c[:, 7] == ord('-'))
+    ok &= (c[:, 10] == ord(' ')) | (c[:, 10] == ord('T'))
+    ok &= (c[:, 13] == ord(':')) & (c[:, 16] == ord(':'))
+    ok &= (month >= 1) & (month <= 12) & (day >= 1)
+    ok &= (hour < 24) & (minute < 60) & (second < 60)
+
+    months = np.where(ok, (year - 1970) * 12 + month - 1, 0)
+    first = months.astype('datetime64[M]').astype('datetime64[D]')
+    following = (months + 1).astype('datetime64[M]').astype('datetime64[D]')
+    ok &= day <= (following - first).astype(np.int64)
+    seconds = ((first.astype(np.int64) + day - 1) * 86400
+               + hour * 3600 + minute * 60 + second)
+
+    zulu = lengths == 20
+    ok[zulu] &= c[zulu, 19] == ord('Z')
+    offset = lengths == 25
+    if offset.any():
+        sign = np.where(c[:, 19] == ord('-'), -1, 1)
+        ok[offset] &= np.isin(c[offset, 19], (ord('+'), ord('-')))
+        ok[offset] &= c[offset, 22] == ord(':')
+        shift = sign * (number(20, 21, rows=offset) * 3600
+                        + number(23, 24, rows=offset) * 60)
+        seconds = np.where(offset, seconds - shift, seconds)
+    return ok, seconds, aware
+
+
+def _take(uniques, codes: np.ndarray, index) -> pd.Series:
+    """Map per-distinct values back to rows; code -1 (missing) gives NA."""
+    missing = codes < 0
+    if len(uniques) == 0:
+        # Every row is missing; there is nothing to take from.
+        if pd.api.types.is_integer_dtype(uniques.dtype):
+            return pd.Series(pd.NA, index=index, dtype='Int8')
+        return pd.Series(pd.NaT, index=index, dtype=uniques.dtype)
+    values = pd.Series(uniques).take(np.maximum(codes, 0)).set_axis(index)
+    if missing.any():
+        if pd.api.types.is_integer_dtype(values.dtype):
+            values = values.astype('Int8')
+        values[missing] = pd.NA if values.dtype == 'Int8' else pd.NaT
+    return values
@@ -1,32 +1,94 @@
 import pandas as pd
+import hashlib
+import json
 import logging
 import os
+import time
+from typing import Iterator, List, Optional, Union
+
+from src.instrumentation import instrumented
 
 # Configure logging
 logging.basicConfig(level=logging.INFO,
                     format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Explicit dtypes for the analyst-ratings feed. Publisher and stock have a
+# tiny cardinality compared with the row count, so categoricals keep them as
+# integer codes instead of one Python string object per row.
+NEWS_DTYPES = {
+    'publisher': 'category',
+    'stock': 'category',
+}
+NEWS_DATE_COLUMN = 'date'
+NEWS_DATE_FORMAT = 'ISO8601'
+DEFAULT_CHUNKSIZE = 100_000
+
+# Columnar cache: typed Feather copies of the CSVs, keyed by source path,
+# mtime, size and the load options. Override the location with KAIM_CACHE_DIR.
+CACHE_DIR_ENV = 'KAIM_CACHE_DIR'
+CACHE_DIR_NAME = '.cache'
 
-def load_data(file_path: str) -> pd.DataFrame:
+
+@instrumented
+def load_data(file_path: str, chunksize: Optional[int] = None,
+              dtype: Optional[dict] = None,
+              date_column: Optional[str] = None,
+              date_format: str = NEWS_DATE_FORMAT,
+              columns: Optional[List[str]] = None,
+              use_cache: bool = True,
+              cache_dir: Optional[str] = None
+              ) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
     """
     Load CSV data from the specified file path.
 
+    Without ``chunksize`` the whole file is read eagerly, as before. With a
+    ``chunksize`` the file is streamed and an iterator of DataFrames is
+    returned instead (see ``iter_chunks``).
+
+    Eager loads go through a columnar cache when ``pyarrow`` is installed:
+    the first load writes a typed Feather copy of the CSV, later loads
+    memory-map it and read only ``columns``. A stale or unreadable cache
+    file is rebuilt from the CSV.
+
     Args:
         file_path (str): Path to the CSV file.
+        chunksize (int, optional): Rows per chunk for streaming mode.
+        dtype (dict, optional): Column dtypes passed to ``pd.read_csv``.
+        date_column (str, optional): Column to parse as UTC datetimes.
+        date_format (str): Format used to parse ``date_column``.
+        columns (list, optional): Subset of columns to return.
+        use_cache (bool): Read/write the columnar cache.
+        cache_dir (str, optional): Cache directory. Defaults to
+            ``$KAIM_CACHE_DIR`` or a ``.cache`` folder next to the CSV.
 
     Returns:
-        pd.DataFrame: Loaded DataFrame.
+        pd.DataFrame or Iterator[pd.DataFrame]: Loaded DataFrame, or an
+        iterator of chunks in streaming mode.
 
     Raises:
         FileNotFoundError: If the file does not exist.
         pd.errors.EmptyDataError: If the file is empty.
     """
+    if chunksize is not None:
+        return iter_chunks(file_path, chunksize=chunksize, dtype=dtype,
+                           date_column=date_column, date_format=date_format)
+
     try:
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        df = pd.read_csv(file_path, encoding='utf-8')
+        cache_path = None
+        if use_cache and _feather() is not None:
+            cache_path = _cache_path(file_path, cache_dir, dtype, date_column,
+                                     date_format)
+            df = _read_cache(cache_path, columns)
+            if df is not None:
+                return df
+
+        start = time.perf_counter()
+        df = pd.read_csv(file_path, encoding='utf-8', dtype=dtype,
+                         usecols=None if cache_path else columns)
         logger.info(
             f"Successfully loaded data from {file_path} with {len(df)} rows")
 
@@ -34,6 +96,16 @@ def load_data(file_path: str) -> pd.DataFrame:
         if df.empty:
             raise pd.errors.EmptyDataError("The CSV file is empty")
 
+        if date_column is not None and date_column in df.columns:
+            df[date_column] = _parse_dates(df[date_column], date_format)
+
+        if cache_path is not None:
+            logger.info(f"Cold load of {file_path} took "
+                        f"{time.perf_counter() - start:.3f}s")
+            _write_cache(df, cache_path)
+            if columns is not None:
+                df = df[list(columns)]
+
         return df
 
     except FileNotFoundError as e:
@@ -45,3 +117,164 @@ def load_data(file_path: str) -> pd.DataFrame:
     except Exception as e:
         logger.error(f"Error loading data: {str(e)}")
         raise
+
+
+def iter_chunks(file_path: str, chunksize: int = DEFAULT_CHUNKSIZE,
+                dtype: Optional[dict] = None,
+                date_column: Optional[str] = None,
+                date_format: str = NEWS_DATE_FORMAT) -> Iterator[pd.DataFrame]:
+    """
+    Stream a CSV file as an iterator of typed DataFrame chunks.
+
+    Only one chunk is held in memory at a time, so downstream statistics
+    can fold over the chunks (e.g. summing per-chunk ``value_counts``).
+
+    Args:
+        file_path (str): Path to the CSV file.
+        chunksize (int): Rows per chunk.
+        dtype (dict, optional): Column dtypes passed to ``pd.read_csv``.
+        date_column (str, optional): Column to parse as UTC datetimes.
+        date_format (str): Format used to parse ``date_column``.
+
+    Returns:
+        Iterator[pd.DataFrame]: Chunks of at most ``chunksize`` rows.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        pd.errors.EmptyDataError: If the file is empty.
+    """
+    # Validate eagerly so callers see the error at call time rather than on
+    # the first ``next()``.
+    if not os.path.exists(file_path):
+        logger.error(f"File not found: {file_path}")
+        raise FileNotFoundError(f"File not found: {file_path}")
+    if chunksize <= 0:
+        raise ValueError("chunksize must be a positive integer")
+
+    return _iter_chunks(file_path, chunksize, dtype, date_column, date_format)
+
+
+def iter_news_chunks(file_path: str,
+                     chunksize: int = DEFAULT_CHUNKSIZE) -> Iterator[pd.DataFrame]:
+    """
+    Stream the analyst-ratings CSV with its pinned dtypes.
+
+    ``publisher`` and ``stock`` are read as categoricals and ``date`` is
+    parsed once per chunk with the fixed ISO8601 format into UTC.
+
+    Args:
+        file_path (str): Path to ``raw_analyst_ratings.csv`` or similar.
+        chunksize (int): Rows per chunk.
+
+    Returns:
+        Iterator[pd.DataFrame]: Typed chunks of the news feed.
+    """
+    return iter_chunks(file_path, chunksize=chunksize, dtype=NEWS_DTYPES,
+                       date_column=NEWS_DATE_COLUMN,
+                       date_format=NEWS_DATE_FORMAT)
+
+
+def _iter_chunks(file_path, chunksize, dtype, date_column, date_format):
+    rows = 0
+    try:
+        with pd.read_csv(file_path, encoding='utf-8', dtype=dtype,
+                         chunksize=chunksize) as reader:
+            for chunk in reader:
+                if date_column is not None and date_column in chunk.columns:
+                    chunk[date_column] = _parse_dates(chunk[date_column],
+                                                      date_format)
+                rows += len(chunk)
+                yield chunk
+    except pd.errors.EmptyDataError:
+        logger.error("The CSV file is empty")
+        raise
+    except Exception as e:
+        logger.error(f"Error streaming data: {str(e)}")
+        raise
+
+    if rows == 0:
+        logger.error("The CSV file is empty")
+        raise pd.errors.EmptyDataError("The CSV file is empty")
+    logger.info(f"Streamed {rows} rows from {file_path}")
+
+
+def _parse_dates(values: pd.Series, date_format: str) -> pd.Series:
+    # The analyst feed mixes UTC offsets (-04:00/-05:00), so everything is
+    # normalised to UTC to get a single datetime64 dtype.
+    return pd.to_datetime(values, format=date_format, utc=True)
+
+
+def _feather():
+    try:
+        import pyarrow.feather as feather
+    except ImportError:
+        return None
+    return feather
+
+
+def _cache_path(file_path, cache_dir, dtype, date_column, date_format):
+    source = os.path.abspath(file_path)
+    stat = os.stat(source)
+    if cache_dir is None:
+        cache_dir = os.environ.get(CACHE_DIR_ENV) or os.path.join(
+            os.path.dirname(source), CACHE_DIR_NAME)
+
+    # The first hash names the source, the second its version. Files that
+    # share the first part but not the second are stale copies.
+    source_key = hashlib.sha1(source.encode('utf-8')).hexdigest()[:12]
+    version = json.dumps([stat.st_mtime_ns, stat.st_size, dtype, date_column,
+                          date_format], sort_keys=True, default=str)
+    version_key = hashlib.sha1(version.encode('utf-8')).hexdigest()[:12]
+    name = os.path.basename(source)
+    return os.path.join(cache_dir, f"{name}.{source_key}.{version_key}.feather")
+
+
+def _read_cache(cache_path, columns):
+    if not os.path.exists(cache_path):
+        return None
+    start = time.perf_counter()
+    try:
+        table = _feather().read_table(
+            cache_path, columns=None if columns is None else list(columns),
+            memory_map=True)
+        df = table.to_pandas()
+    except Exception as e:
+        # Corrupt or truncated cache files are rebuilt from the CSV.
+        logger.debug(f"Discarding unreadable cache {cache_path}: {str(e)}")
+        _remove(cache_path)
+        return None
+    logger.info(f"Warm load of {cache_path} took "
+                f"{time.perf_counter() - start:.3f}s")
+    return df
+
+
+def _write_cache(df, cache_path):
+    start = time.perf_counter()
+    cache_dir = os.path.dirname(cache_path)
+    prefix = os.path.basename(cache_path).rsplit('.', 2)[0] + '.'
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Uncompressed so that later reads can memory-map the file.
+        _feather().write_feather(df, tmp_path, compression='uncompressed')
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        # The cache is an optimisation only; a read-only data directory must
+        # not break loading.
+        logger.warning(f"Could not write cache {cache_path}: {str(e)}")
+        _remove(tmp_path)
+        return
+
+    for entry in os.listdir(cache_dir):
+        if entry.startswith(prefix) and entry.endswith('.feather') \
+                and os.path.join(cache_dir, entry) != cache_path:
+            _remove(os.path.join(cache_dir, entry))
+    logger.info(f"Wrote cache {cache_path} in "
+                f"{time.perf_counter() - start:.3f}s")
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
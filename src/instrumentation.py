@@ -0,0 +1,223 @@
+import cProfile
+import functools
+import json
+import logging
+import os
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional
+
+# Configure logging
+logging.basicConfig(level=logging.INFO,
+                    format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# KAIM_INSTRUMENT turns instrumentation on for the whole process. It takes
+# a comma-separated list: "timing" (or "1"), "memory" (tracemalloc peak per
+# stage) and "profile" (cProfile dump per stage, plus a tracemalloc
+# snapshot when memory is on). Dumps go to KAIM_PROFILE_DIR and every
+# record is appended as a JSON line to KAIM_METRICS_FILE when set.
+INSTRUMENT_ENV = 'KAIM_INSTRUMENT'
+PROFILE_DIR_ENV = 'KAIM_PROFILE_DIR'
+METRICS_FILE_ENV = 'KAIM_METRICS_FILE'
+DEFAULT_PROFILE_DIR = 'profiles'
+MAX_RECORDS = 10_000
+
+
+class _Settings:
+    enabled = False
+    memory = False
+    profile = False
+    profile_dir = DEFAULT_PROFILE_DIR
+    metrics_file: Optional[str] = None
+
+
+_settings = _Settings()
+_records = deque(maxlen=MAX_RECORDS)
+# Open stages, innermost last; used to carry memory peaks outward and to
+# keep nested stages from starting a second profiler.
+_stack: List[dict] = []
+
+
+def enable(memory: bool = False, profile: bool = False,
+           profile_dir: Optional[str] = None,
+           metrics_file: Optional[str] = None) -> None:
+    """
+    Turn instrumentation on.
+
+    Args:
+        memory (bool): Record the tracemalloc peak of each stage. Tracing
+            slows allocation-heavy code down noticeably.
+        profile (bool): Write a cProfile ``.prof`` file per stage.
+        profile_dir (str, optional): Directory for profile dumps.
+        metrics_file (str, optional): Append records as JSON lines here.
+    """
+    _settings.enabled = True
+    _settings.memory = memory
+    _settings.profile = profile
+    _settings.profile_dir = profile_dir or DEFAULT_PROFILE_DIR
+    _settings.metrics_file = metrics_file
+
+
+def disable() -> None:
+    """Turn instrumentation off; decorated functions run unwrapped."""
+    _settings.enabled = False
+
+
+def is_enabled() -> bool:
+    return _settings.enabled
+
+
+def get_metrics() -> List[dict]:
+    """Return the records collected so far (oldest first)."""
+    return list(_records)
+
+
+def reset_metrics() -> None:
+    _records.clear()
+
+
+@contextmanager
+def stage(name: str, rows: Optional[int] = None) -> Iterator[dict]:
+    """
+    Measure a block of code as one named stage.
+
+    The yielded dict is the record being built; set ``record['rows']``
+    inside the block when the row count is only known there. When
+    instrumentation is disabled the record is discarded.
+
+    Args:
+        name (str): Stage name, e.g. ``'load_data'``.
+        rows (int, optional): Rows processed, if known up front.
+
+    Yields:
+        dict: The stage record.
+    """
+    record = {'stage': name, 'rows': rows}
+    if not _settings.enabled:
+        yield record
+        return
+
+    frame = {'peak': 0}
+    profiler = None
+    started_tracing = False
+    if _settings.memory:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            started_tracing = True
+        else:
+            # The outer stage's peak so far must survive our reset.
+            if _stack:
+                _stack[-1]['peak'] = max(_stack[-1]['peak'],
+                                         tracemalloc.get_traced_memory()[1])
+        frame['base'] = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+    if _settings.profile and not any('profiler' in f for f in _stack):
+        profiler = cProfile.Profile()
+        frame['profiler'] = profiler
+    _stack.append(frame)
+
+    start = time.perf_counter()
+    if profiler is not None:
+        profiler.enable()
+    try:
+        yield record
+    finally:
+        if profiler is not None:
+            profiler.disable()
+        record['seconds'] = time.perf_counter() - start
+        _stack.pop()
+        if _settings.memory:
+            peak = max(tracemalloc.get_traced_memory()[1], frame['peak'])
+            record['peak_bytes'] = peak - frame['base']
+            if _stack:
+                _stack[-1]['peak'] = max(_stack[-1]['peak'], peak)
+        if profiler is not None:
+            record['profile'] = _dump_profile(name, profiler)
+        if started_tracing:
+            tracemalloc.stop()
+        _emit(record)
+
+
+def instrumented(func: Optional[Callable] = None, *,
+                 name: Optional[str] = None) -> Callable:
+    """
+    Decorator running ``func`` inside a ``stage``.
+
+    The row count is that of the first DataFrame argument, i.e. the rows
+    the function processed; functions without one (loaders) report the
+    rows of their result. While instrumentation is disabled the wrapper
+    only checks one flag before calling ``func``.
+
+    A function that returns a lazy iterator, such as ``load_data`` with a
+    ``chunksize``, is only timed while it builds the iterator: the record
+    covers setup, not the chunks consumed later, and has no row count.
+    Wrap the consuming loop in ``stage`` to measure the iteration.
+
+    Args:
+        func (Callable): Function to wrap.
+        name (str, optional): Stage name; defaults to the qualified name.
+    """
+    if func is None:
+        return functools.partial(instrumented, name=name)
+    stage_name = name or func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _settings.enabled:
+            return func(*args, **kwargs)
+        with stage(stage_name) as record:
+            result = func(*args, **kwargs)
+            record['rows'] = _row_count(result, args, kwargs)
+        return result
+
+    return wrapper
+
+
+def _row_count(result, args, kwargs) -> Optional[int]:
+    for value in (*args, *kwargs.values()):
+        if hasattr(value, 'columns') and hasattr(value, 'shape'):
+            return int(value.shape[0])
+    if hasattr(result, 'shape') and getattr(result, 'ndim', 0) >= 1:
+        return int(result.shape[0])
+    return None
+
+
+def _dump_profile(name: str, profiler: cProfile.Profile) -> str:
+    os.makedirs(_settings.profile_dir, exist_ok=True)
+    stem = os.path.join(_settings.profile_dir,
+                        f"{name}-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}")
+    profiler.dump_stats(stem + '.prof')
+    if _settings.memory and tracemalloc.is_tracing():
+        tracemalloc.take_snapshot().dump(stem + '.tracemalloc')
+    return stem + '.prof'
+
+
+def _emit(record: dict) -> None:
+    _records.append(record)
+    fields = ' '.join(f"{k}={_format(v)}" for k, v in record.items()
+                      if k != 'stage' and v is not None)
+    logger.info(f"stage={record['stage']} {fields}",
+                extra={'metrics': record})
+    if _settings.metrics_file:
+        with open(_settings.metrics_file, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record) + '\n')
+
+
+def _format(value) -> str:
+    return f"{value:.4f}" if isinstance(value, float) else str(value)
+
+
+def _configure_from_env() -> None:
+    flags = {f.strip().lower()
+             for f in os.environ.get(INSTRUMENT_ENV, '').split(',') if f.strip()}
+    flags -= {'0', 'false', 'off'}
+    if flags:
+        enable(memory='memory' in flags, profile='profile' in flags,
+               profile_dir=os.environ.get(PROFILE_DIR_ENV),
+               metrics_file=os.environ.get(METRICS_FILE_ENV))
+
+
+_configure_from_env()
@@ -0,0 +1,63 @@
+import importlib
+import importlib.util
+import sys
+import types
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    """
+    Return a module object that is only imported on first attribute access.
+
+    Lets modules keep their ``plt = ...`` / ``pn = ...`` style globals
+    while heavy packages such as matplotlib, TextBlob or PyNance load only
+    when a function actually uses them. If the module is already imported
+    it is returned as is.
+
+    Top-level packages go through ``importlib.util.LazyLoader``. For
+    submodules (``matplotlib.pyplot``), finding the spec would import the
+    parent package, so a small proxy defers the whole import instead.
+
+    Args:
+        name (str): Absolute module name.
+
+    Returns:
+        types.ModuleType: The module or a lazy stand-in for it.
+
+    Raises:
+        ModuleNotFoundError: If a top-level package is not installed.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    if '.' in name:
+        return _LazyModule(name)
+
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+class _LazyModule(types.ModuleType):
+    """Proxy that imports ``name`` and forwards attribute access to it."""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__['_lazy_module'] = None
+
+    def _load(self):
+        module = self.__dict__['_lazy_module']
+        if module is None:
+            module = importlib.import_module(self.__name__)
+            self.__dict__['_lazy_module'] = module
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
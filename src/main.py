@@ -1,44 +1,199 @@
-from data.news_loader import load_news_data
-from data.stock_loader import load_stock_data
-from analysis.descriptive_stats import compute_descriptive_stats
-from analysis.text_analysis import extract_topics
-from analysis.publisher_analysis import analyze_publishers
-from analysis.technical_analysis import calculate_technical_indicators, calculate_financial_metrics
-from visualization.plot_utils import plot_publication_trend, plot_publisher_domains, plot_technical_indicators
-
-
-def run_eda(file_path):
-    """Run Exploratory Data Analysis."""
-    df = load_news_data(file_path)
-    stats = compute_descriptive_stats(df)
-    print("Headline Length Statistics:")
-    print(stats['headline_stats'])
-    print("\nTop Publishers:")
-    print(stats['publisher_counts'].head(10))
-    plot_publication_trend(stats['daily_counts'])
-
-    df = extract_topics(df)
-    print("\nTop Terms per Headline (Sample):")
-    print(df[['headline', 'top_terms']].head())
-
-    domain_counts = analyze_publishers(df)
-    print("\nTop Publisher Domains:")
-    print(domain_counts.head(10))
-    plot_publisher_domains(domain_counts)
-
-
-def run_technical_analysis(file_path):
-    """Run technical analysis."""
-    df = load_stock_data(file_path)
-    df = calculate_technical_indicators(df)
-    returns, volatility = calculate_financial_metrics(df)
-    print(f"Annualized Volatility: {volatility:.4f}")
-    plot_technical_indicators(df)
+"""
+Run the news EDA and the technical analysis from the command line.
+
+    python -m src.main --news news_data.csv --stock stock_data.csv
+    python -m src.main --rsi-window 21 --workers 3
+    python -m src.main --skip-eda
+
+Both analyses run as one ``src.pipeline`` DAG: the news branch, the price
+branch and the plots run concurrently with ``--workers``, and each stage is
+cached on disk, so a re-run only recomputes stages whose inputs, params or
+code changed. The analysis modules (and through them matplotlib, seaborn,
+TextBlob and SciPy) are imported inside the functions that use them, so
+``--help`` and importing this module stay fast.
+"""
+import argparse
+import os
+
+# Modules each stage delegates to; editing one invalidates its cached
+# results (see ``src.pipeline.Stage``).
+PLOT_CODE = ['visualization.plot_utils', 'visualization.decimation']
+
+
+def build_pipeline(news_file, stock_file, output_dir='.', rsi_window=14,
+                   cache_dir=None, use_cache=True):
+    """
+    Declare the EDA and technical-analysis stages.
+
+    Args:
+        news_file (str): Analyst-ratings news CSV.
+        stock_file (str): Daily OHLCV CSV.
+        output_dir (str): Directory for the plot images.
+        rsi_window (int): RSI look-back passed to the indicator stage.
+        cache_dir (str, optional): Cache root for stage results.
+        use_cache (bool): Reuse results of unchanged stages.
+
+    Returns:
+        Pipeline: The stage graph.
+    """
+    from src.pipeline import Pipeline
+
+    def image(name):
+        return os.path.join(output_dir, name)
+
+    p = Pipeline(cache_dir=cache_dir, use_cache=use_cache)
+    # News branch
+    p.add('news', _load_news, params={'file_path': news_file},
+          files=[news_file], code=['src.data.news_loader', 'src.data_loader'])
+    p.add('stats', _descriptive_stats, inputs=['news'],
+          code=['src.analysis.descriptive_stats', 'src.data_analyzer'])
+    p.add('topics', _topics, inputs=['news'],
+          code=['src.analysis.text_analysis'])
+    p.add('domains', _publisher_domains, inputs=['news'],
+          code=['src.analysis.publisher_analysis', 'src.data_analyzer'])
+    p.add('trend_plot', _plot_publication_trend, inputs=['stats'],
+          params={'save_path': image('publication_trend.png')},
+          products=[image('publication_trend.png')], code=PLOT_CODE)
+    p.add('domains_plot', _plot_publisher_domains, inputs=['domains'],
+          params={'save_path': image('publisher_domains.png')},
+          products=[image('publisher_domains.png')], code=PLOT_CODE)
+    # Price branch
+    p.add('prices', _load_prices, params={'file_path': stock_file},
+          files=[stock_file], code=['src.data.stock_loader'])
+    p.add('indicators', _technical_indicators, inputs=['prices'],
+          params={'rsi_window': rsi_window},
+          code=['src.analysis.technical_analysis', 'scripts.indicators'])
+    p.add('metrics', _financial_metrics, inputs=['indicators'],
+          outputs=['returns', 'volatility'],
+          code=['src.analysis.technical_analysis', 'scripts.metrics'])
+    p.add('indicators_plot', _plot_technical_indicators,
+          inputs=['indicators'],
+          params={'save_path': image('technical_indicators.png')},
+          products=[image('technical_indicators.png')], code=PLOT_CODE)
+    return p
+
+
+def run_pipeline(news_file, stock_file, output_dir='.', rsi_window=14,
+                 max_workers=1, use_cache=True, cache_dir=None,
+                 skip_eda=False, skip_technical=False):
+    """
+    Run both analyses through the cached pipeline and print the results.
+
+    ``skip_eda``/``skip_technical`` drop the news or price targets; stages
+    only the skipped branch needs are neither run nor loaded.
+    """
+    from visualization.batch import use_headless_backend
+
+    targets = []
+    if not skip_eda:
+        targets += ['stats', 'topics', 'domains', 'trend_plot', 'domains_plot']
+    if not skip_technical:
+        targets += ['volatility', 'indicators_plot']
+    if not targets:
+        return {}
+
+    os.makedirs(output_dir, exist_ok=True)
+    pipeline = build_pipeline(news_file, stock_file, output_dir, rsi_window,
+                              cache_dir=cache_dir, use_cache=use_cache)
+    results = pipeline.run(targets, max_workers=max_workers,
+                           initializer=use_headless_backend)
+
+    if not skip_eda:
+        stats = results['stats']
+        print("Headline Length Statistics:")
+        print(stats['headline_stats'])
+        print("\nTop Publishers:")
+        print(stats['publisher_counts'].head(10))
+        print("\nTop Terms per Headline (Sample):")
+        print(results['topics'][['headline', 'top_terms']].head())
+        print("\nTop Publisher Domains:")
+        print(results['domains'].head(10))
+    if not skip_technical:
+        print(f"\nAnnualized Volatility: {results['volatility']:.4f}")
+    return results
+
+
+# Stage functions. They live at module level so that process workers can
+# unpickle them, and import their dependencies when called.
+
+def _load_news(file_path):
+    from src.data.news_loader import load_news_data
+    return load_news_data(file_path)
+
+
+def _descriptive_stats(news):
+    from src.analysis.descriptive_stats import compute_descriptive_stats
+    return compute_descriptive_stats(news)
+
+
+def _topics(news):
+    from src.analysis.text_analysis import extract_topics
+    return extract_topics(news.copy())
+
+
+def _publisher_domains(news):
+    from src.analysis.publisher_analysis import analyze_publishers
+    return analyze_publishers(news)
+
+
+def _load_prices(file_path):
+    from src.data.stock_loader import load_stock_data
+    return load_stock_data(file_path)
+
+
+def _technical_indicators(prices, rsi_window=14):
+    from src.analysis.technical_analysis import calculate_technical_indicators
+    return calculate_technical_indicators(prices.copy(), rsi_window=rsi_window)
+
+
+def _financial_metrics(indicators):
+    from src.analysis.technical_analysis import calculate_financial_metrics
+    return calculate_financial_metrics(indicators)
+
+
+def _plot_publication_trend(stats, save_path):
+    from visualization.plot_utils import plot_publication_trend
+    plot_publication_trend(stats['daily_counts'], save_path=save_path,
+                           show=False)
+    return save_path
+
+
+def _plot_publisher_domains(domains, save_path):
+    from visualization.plot_utils import plot_publisher_domains
+    plot_publisher_domains(domains, save_path=save_path, show=False)
+    return save_path
+
+
+def _plot_technical_indicators(indicators, save_path):
+    from visualization.plot_utils import plot_technical_indicators
+    plot_technical_indicators(indicators, save_path=save_path, show=False)
+    return save_path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--news', default='news_data.csv',
+                        help='analyst-ratings news CSV')
+    parser.add_argument('--stock', default='stock_data.csv',
+                        help='daily OHLCV CSV')
+    parser.add_argument('--output-dir', default='.',
+                        help='directory for the plot images')
+    parser.add_argument('--rsi-window', type=int, default=14)
+    parser.add_argument('--workers', type=int, default=1,
+                        help='processes running independent stages')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='recompute every stage')
+    parser.add_argument('--skip-eda', action='store_true',
+                        help='only run the technical-analysis branch')
+    parser.add_argument('--skip-technical', action='store_true',
+                        help='only run the news EDA branch')
+    args = parser.parse_args(argv)
+
+    run_pipeline(args.news, args.stock, output_dir=args.output_dir,
+                 rsi_window=args.rsi_window, max_workers=args.workers,
+                 use_cache=not args.no_cache, skip_eda=args.skip_eda,
+                 skip_technical=args.skip_technical)
 
 
 if __name__ == "__main__":
-    # Replace with actual data paths
-    news_file = 'news_data.csv'
-    stock_file = 'stock_data.csv'
-    run_eda(news_file)
-    run_technical_analysis(stock_file)
+    main()
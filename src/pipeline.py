@@ -0,0 +1,358 @@
+import hashlib
+import importlib.util
+import inspect
+import json
+import logging
+import os
+import pickle
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+# Configure logging
+logging.basicConfig(level=logging.INFO,
+                    format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Stage results are pickled to <cache dir>/pipeline, keyed by a fingerprint
+# of the stage's code (its function and the modules listed in ``code``),
+# params, input files (path, mtime, size) and the fingerprints of its
+# upstream stages. Override the location with KAIM_CACHE_DIR, as for the
+# CSV cache.
+CACHE_DIR_ENV = 'KAIM_CACHE_DIR'
+CACHE_DIR_NAME = '.cache'
+PIPELINE_CACHE_NAME = 'pipeline'
+
+
+class Stage:
+    """
+    One step of a ``Pipeline``.
+
+    ``func`` is called as ``func(*inputs, **params)`` with the values of
+    the named inputs. With several ``outputs`` it must return a tuple of
+    the same length.
+
+    Args:
+        name (str): Unique stage name.
+        func (Callable): Module-level function (must be picklable when the
+            pipeline runs on a process pool).
+        inputs (sequence): Outputs of other stages passed positionally.
+        outputs (sequence, optional): Names of the values produced;
+            defaults to the stage name.
+        params (dict, optional): Keyword arguments; part of the fingerprint.
+        files (sequence, optional): Files read by the stage. A changed
+            mtime or size invalidates the cached result.
+        products (sequence, optional): Files written by the stage. A cached
+            result is only reused while they all exist.
+        code (sequence, optional): Dotted names of the modules ``func``
+            delegates to. Their source files are hashed, so editing one
+            invalidates the cached result; only ``func``'s own source is
+            hashed otherwise.
+        cache (bool): Store and reuse the result on disk.
+    """
+
+    def __init__(self, name: str, func: Callable, inputs: Sequence[str] = (),
+                 outputs: Optional[Sequence[str]] = None,
+                 params: Optional[dict] = None, files: Sequence[str] = (),
+                 products: Sequence[str] = (), code: Sequence[str] = (),
+                 cache: bool = True):
+        self.name = name
+        self.func = func
+        self.inputs = tuple(inputs)
+        self.outputs = tuple(outputs) if outputs else (name,)
+        self.params = dict(params or {})
+        self.files = tuple(files)
+        self.products = tuple(products)
+        self.code = tuple(code)
+        self.cache = cache
+
+    def __repr__(self):
+        return (f"Stage({self.name!r}, inputs={list(self.inputs)}, "
+                f"outputs={list(self.outputs)})")
+
+
+class Pipeline:
+    """
+    DAG of memoized stages whose independent branches run concurrently.
+
+    A stage's fingerprint covers its function source, the source files of
+    its ``code`` modules, params, input files
+    and the fingerprints of the stages it depends on, so changing one
+    parameter re-runs that stage and everything downstream of it while the
+    other branches are read from the cache. Cached results are only loaded
+    when a stage that has to run, or the caller, needs them.
+
+    Args:
+        cache_dir (str, optional): Cache root. Defaults to
+            ``$KAIM_CACHE_DIR`` or ``.cache`` in the working directory.
+        use_cache (bool): Read and write cached results.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, use_cache: bool = True):
+        root = cache_dir or os.environ.get(CACHE_DIR_ENV) or CACHE_DIR_NAME
+        self.cache_dir = os.path.join(root, PIPELINE_CACHE_NAME)
+        self.use_cache = use_cache
+        self.stages: Dict[str, Stage] = {}
+        self._producers: Dict[str, str] = {}
+        # Stage name -> 'cached' or 'ran' for the last run().
+        self.report: Dict[str, str] = {}
+
+    def add(self, name: str, func: Callable, **kwargs) -> Stage:
+        """Declare a stage; see ``Stage`` for the keyword arguments."""
+        return self.add_stage(Stage(name, func, **kwargs))
+
+    def add_stage(self, stage: Stage) -> Stage:
+        if stage.name in self.stages:
+            raise ValueError(f"Duplicate stage '{stage.name}'")
+        for output in stage.outputs:
+            if output in self._producers:
+                raise ValueError(f"Output '{output}' is already produced by "
+                                 f"stage '{self._producers[output]}'")
+        self.stages[stage.name] = stage
+        for output in stage.outputs:
+            self._producers[output] = stage.name
+        return stage
+
+    def order(self) -> List[str]:
+        """
+        Stage names in dependency order.
+
+        Raises:
+            KeyError: If an input is not produced by any stage.
+            ValueError: If the stages form a cycle.
+        """
+        order, state = [], {}
+
+        def visit(name, path):
+            if state.get(name) == 'done':
+                return
+            if state.get(name) == 'active':
+                raise ValueError(f"Cycle in pipeline: {' -> '.join(path + [name])}")
+            state[name] = 'active'
+            for dep in self._dependencies(name):
+                visit(dep, path + [name])
+            state[name] = 'done'
+            order.append(name)
+
+        for name in self.stages:
+            visit(name, [])
+        return order
+
+    def fingerprints(self) -> Dict[str, str]:
+        """Fingerprint of every stage, computed without running anything."""
+        prints = {}
+        for name in self.order():
+            stage = self.stages[name]
+            key = json.dumps({
+                'stage': name,
+                'func': _function_key(stage.func),
+                'code': [_module_key(module) for module in stage.code],
+                'params': stage.params,
+                'outputs': stage.outputs,
+                'files': [_file_key(path) for path in stage.files],
+                'inputs': [[i, prints[self._producers[i]]]
+                           for i in stage.inputs],
+            }, sort_keys=True, default=repr)
+            prints[name] = hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+        return prints
+
+    def run(self, targets: Optional[Iterable[str]] = None,
+            max_workers: Optional[int] = 1,
+            initializer: Optional[Callable] = None) -> Dict[str, Any]:
+        """
+        Run (or load from the cache) what is needed to produce ``targets``.
+
+        Args:
+            targets (iterable, optional): Output names to return. Defaults to
+                the outputs no other stage consumes.
+            max_workers (int, optional): Process pool size; ``None`` uses the
+                CPU count and ``1`` runs every stage in-process.
+            initializer (callable, optional): Run once in each worker
+                process, e.g. to select a headless matplotlib backend.
+
+        Returns:
+            dict: Output name -> value for every target.
+        """
+        order = self.order()
+        if targets is None:
+            consumed = {i for s in self.stages.values() for i in s.inputs}
+            targets = [o for name in order
+                       for o in self.stages[name].outputs if o not in consumed]
+        targets = list(targets)
+        for target in targets:
+            if target not in self._producers:
+                raise KeyError(f"No stage produces '{target}'")
+
+        prints = self.fingerprints()
+        needed = self._needed_stages(targets)
+        to_run = {name for name in needed if not self._is_cached(name, prints)}
+        # Values are only loaded for stages that produce a target or feed a
+        # stage that has to run.
+        wanted = {self._producers[t] for t in targets}
+        for name in to_run:
+            wanted.update(self._dependencies(name))
+
+        start = time.perf_counter()
+        values: Dict[str, Any] = {}
+        self.report = {}
+        for name in order:
+            if name in wanted and name not in to_run:
+                values.update(self._load(name, prints[name]))
+                self.report[name] = 'cached'
+
+        workers = max_workers or os.cpu_count() or 1
+        if to_run and workers == 1:
+            if initializer is not None:
+                initializer()
+            for name in order:
+                if name in to_run:
+                    values.update(self._finish(
+                        name, prints[name],
+                        _call_stage(self.stages[name],
+                                    self._arguments(name, values))))
+        elif to_run:
+            self._run_pool(order, to_run, prints, values, workers, initializer)
+
+        logger.info(f"Pipeline ran {len(to_run)} stage(s) and reused "
+                    f"{sum(v == 'cached' for v in self.report.values())} in "
+                    f"{time.perf_counter() - start:.3f}s")
+        return {target: values[target] for target in targets}
+
+    def _run_pool(self, order, to_run, prints, values, workers, initializer):
+        pending = [name for name in order if name in to_run]
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=initializer) as pool:
+            running = {}
+            while pending or running:
+                ready = [name for name in pending
+                         if all(dep not in to_run or dep in self.report
+                                for dep in self._dependencies(name))]
+                for name in ready[:max(workers - len(running), 0)]:
+                    pending.remove(name)
+                    future = pool.submit(_call_stage, self.stages[name],
+                                         self._arguments(name, values))
+                    running[future] = name
+                if not running:
+                    raise RuntimeError(f"Pipeline stalled on {pending}")
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    values.update(self._finish(name, prints[name],
+                                               future.result()))
+
+    def _dependencies(self, name: str) -> List[str]:
+        deps = []
+        for i in self.stages[name].inputs:
+            if i not in self._producers:
+                raise KeyError(f"Stage '{name}' needs '{i}', which no stage "
+                               f"produces")
+            if self._producers[i] not in deps:
+                deps.append(self._producers[i])
+        return deps
+
+    def _needed_stages(self, targets) -> set:
+        needed, stack = set(), [self._producers[t] for t in targets]
+        while stack:
+            name = stack.pop()
+            if name not in needed:
+                needed.add(name)
+                stack.extend(self._dependencies(name))
+        return needed
+
+    def _arguments(self, name, values) -> list:
+        return [values[i] for i in self.stages[name].inputs]
+
+    def _finish(self, name, fingerprint, result) -> dict:
+        stage = self.stages[name]
+        named = dict(zip(stage.outputs, result))
+        if self.use_cache and stage.cache:
+            self._store(name, fingerprint, named)
+        self.report[name] = 'ran'
+        return named
+
+    def _cache_path(self, name, fingerprint) -> str:
+        return os.path.join(self.cache_dir, f"{name}.{fingerprint}.pkl")
+
+    def _is_cached(self, name, prints) -> bool:
+        stage = self.stages[name]
+        return (self.use_cache and stage.cache
+                and os.path.exists(self._cache_path(name, prints[name]))
+                and all(os.path.exists(p) for p in stage.products))
+
+    def _load(self, name, fingerprint) -> dict:
+        with open(self._cache_path(name, fingerprint), 'rb') as f:
+            return pickle.load(f)
+
+    def _store(self, name, fingerprint, named) -> None:
+        path = self._cache_path(name, fingerprint)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(named, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            # Caching is an optimisation; the run itself succeeded.
+            logger.warning(f"Could not cache stage {name}: {str(e)}")
+            _remove(tmp_path)
+            return
+        # Older results of the same stage are stale.
+        for entry in os.listdir(self.cache_dir):
+            if entry.startswith(f"{name}.") and entry.endswith('.pkl') \
+                    and entry != os.path.basename(path) \
+                    and entry.count('.') == 2:
+                _remove(os.path.join(self.cache_dir, entry))
+
+
+def _call_stage(stage: Stage, args: list) -> tuple:
+    """Run one stage; module-level so process workers can unpickle it."""
+    start = time.perf_counter()
+    result = stage.func(*args, **stage.params)
+    logger.info(f"Stage {stage.name} took {time.perf_counter() - start:.3f}s")
+    if len(stage.outputs) == 1:
+        return (result,)
+    if not isinstance(result, tuple) or len(result) != len(stage.outputs):
+        raise ValueError(f"Stage '{stage.name}' must return "
+                         f"{len(stage.outputs)} values")
+    return result
+
+
+def _function_key(func: Callable) -> list:
+    # Only the stage function's own source is hashed; the modules it calls
+    # into are covered by ``Stage.code``.
+    func = inspect.unwrap(func)
+    name = f"{getattr(func, '__module__', '')}.{getattr(func, '__qualname__', repr(func))}"
+    try:
+        source = inspect.getsource(func)
+    except (OSError, TypeError):
+        source = ''
+    return [name, hashlib.sha1(source.encode('utf-8')).hexdigest()[:12]]
+
+
+def _module_key(name: str) -> list:
+    # Located without importing it, so fingerprinting stays cheap.
+    try:
+        spec = importlib.util.find_spec(name)
+    except (ImportError, ValueError):
+        spec = None
+    origin = getattr(spec, 'origin', None)
+    if not origin or not os.path.isfile(origin):
+        return [name, None]
+    with open(origin, 'rb') as f:
+        return [name, hashlib.sha1(f.read()).hexdigest()[:12]]
+
+
+def _file_key(path: str) -> list:
+    source = os.path.abspath(path)
+    try:
+        stat = os.stat(source)
+    except OSError:
+        return [source, None, None]
+    return [source, stat.st_mtime_ns, stat.st_size]
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
@@ -0,0 +1,32 @@
+import os
+import tempfile
+import unittest
+from benchmarks.synthetic import write_ticker_csvs
+
+try:
+    import matplotlib
+except ImportError:
+    matplotlib = None
+
+
+@unittest.skipUnless(matplotlib, "matplotlib is required")
+class TestRenderTickerReports(unittest.TestCase):
+    def test_renders_one_file_per_ticker(self):
+        from visualization.batch import render_ticker_reports
+
+        with tempfile.TemporaryDirectory() as tmp:
+            data = os.path.join(tmp, 'data')
+            os.makedirs(data)
+            write_ticker_csvs(data, 3, 300)
+            for workers in (1, 2):
+                out = os.path.join(tmp, f'charts{workers}')
+                paths = render_ticker_reports(data, out, max_workers=workers)
+                self.assertEqual(len(paths), 3)
+                for path in paths.values():
+                    self.assertTrue(path.startswith(out))
+                    self.assertGreater(os.path.getsize(path), 0)
+            self.assertEqual(matplotlib.get_backend().lower(), 'agg')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+from benchmarks import run
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+    def test_writes_and_compares_results(self):
+        args = ['--tickers', '2', '--days', '300', '--rows', '500',
+                '--repeat', '1', '--only',
+                'calculate_technical_indicators,descriptive_stats']
+        with tempfile.TemporaryDirectory() as tmp:
+            first = os.path.join(tmp, 'first.json')
+            with contextlib.redirect_stdout(io.StringIO()):
+                run.main(args + ['--output', first])
+            with open(first) as f:
+                report = json.load(f)
+            self.assertEqual(set(report['results']),
+                             {'calculate_technical_indicators',
+                              'descriptive_stats'})
+            self.assertEqual(report['parameters']['rows'], 500)
+
+            out = io.StringIO()
+            with contextlib.redirect_stdout(out):
+                # A huge threshold keeps timing noise from failing the test.
+                run.main(args + ['--compare', first, '--threshold', '1e9'])
+            self.assertIn('ratio', out.getvalue())
+
+    def test_regression_exits_non_zero(self):
+        results = {'sentiment': {'min_s': 2.0}}
+        baseline = {'results': {'sentiment': {'min_s': 1.0}}}
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(run.compare(results, baseline, 1.2),
+                             ['sentiment'])
+
+
+if __name__ == '__main__':
+    unittest.main()
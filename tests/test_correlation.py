@@ -0,0 +1,77 @@
+import unittest
+import numpy as np
+import pandas as pd
+from src.analysis.correlation import (lagged_correlation,
+                                      rolling_lagged_correlation,
+                                      sentiment_return_panels)
+
+
+def brute_corr(x, y, lag, start, stop):
+    """Pearson correlation of x[t] and y[t + lag] for t in [start, stop)."""
+    pairs = [(x[t], y[t + lag]) for t in range(start, stop)
+             if 0 <= t + lag < len(y)
+             and not np.isnan(x[t]) and not np.isnan(y[t + lag])]
+    a, b = np.array(pairs).T
+    return np.corrcoef(a, b)[0, 1], len(pairs)
+
+
+class TestCorrelation(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        dates = pd.bdate_range('2020-01-01', periods=250)
+        prices, daily = [], []
+        for ticker in ['AAPL', 'TSLA']:
+            close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, len(dates))))
+            prices.append(pd.DataFrame({'ticker': ticker, 'Date': dates,
+                                        'Close': close}))
+            news_days = np.sort(rng.choice(len(dates), 150, replace=False))
+            daily.append(pd.DataFrame({
+                'stock': ticker, 'Date': dates[news_days],
+                'sentiment': rng.normal(size=len(news_days)),
+                'headlines': 1}))
+        self.sentiment, self.returns = sentiment_return_panels(
+            pd.concat(daily), pd.concat(prices))
+
+    def test_lagged_matches_brute_force(self):
+        result = lagged_correlation(self.sentiment, self.returns)
+        self.assertEqual(len(result), 2 * 11)
+        for row in result.itertuples():
+            x = self.sentiment[row.stock].to_numpy()
+            y = self.returns[row.stock].to_numpy()
+            expected, n = brute_corr(x, y, row.lag, 0, len(x))
+            self.assertEqual(row.n, n)
+            self.assertAlmostEqual(row.correlation, expected, places=10)
+
+    def test_rolling_matches_brute_force(self):
+        window = 40
+        result = rolling_lagged_correlation(self.sentiment, self.returns,
+                                            window=window, lags=[-2, 0, 3])
+        dates = self.sentiment.index
+        for row in result.sample(50, random_state=0).itertuples():
+            end = dates.get_loc(row.Date) + 1
+            x = self.sentiment[row.stock].to_numpy()
+            y = self.returns[row.stock].to_numpy()
+            expected, n = brute_corr(x, y, row.lag, max(0, end - window), end)
+            self.assertEqual(row.n, n)
+            self.assertAlmostEqual(row.correlation, expected, places=10)
+
+    def test_constant_window_is_nan(self):
+        # fill_value=0 with a long news gap leaves constant windows.
+        sentiment = self.sentiment.fillna(0.0)
+        sentiment.iloc[100:180] = 0.3
+        window = 40
+        result = rolling_lagged_correlation(sentiment, self.returns,
+                                            window=window, lags=[0])
+        for stock in sentiment.columns:
+            got = result[result['stock'] == stock].set_index('Date')
+            expected = sentiment[stock].rolling(
+                window, min_periods=window // 2).corr(self.returns[stock])
+            constant = sentiment.index[140:180]
+            self.assertTrue(got['correlation'].reindex(constant).isna().all())
+            varying = got.index[got.index < sentiment.index[100]]
+            np.testing.assert_allclose(got.loc[varying, 'correlation'],
+                                       expected[varying], atol=1e-10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import unittest
+import numpy as np
+import pandas as pd
+from src.data_analyzer import (SESSIONS, _parse_fixed_layout, convert_timestamp,
+                               parse_timestamps)
+
+
+class TestConvertTimestamp(unittest.TestCase):
+    def setUp(self):
+        self.df = pd.DataFrame({'date': [
+            '2020-06-05 10:30:54-04:00',  # Friday, regular session
+            '2020-06-05 10:30:54-04:00',
+            '2020-06-05 07:15:00-04:00',  # pre-market
+            '2020-12-07 17:00:00-05:00',  # Monday, after hours (EST)
+            '2020-05-22 00:00:00',        # no offset: exchange time
+            '2020-06-06 12:00:00Z',       # Saturday
+            '2020-06-08 13:45:00.250-04:00',  # fractional seconds
+        ]})
+
+    def test_matches_per_row_iso8601_parsing(self):
+        out = convert_timestamp(self.df.copy())
+        expected = pd.to_datetime(self.df['date'].iloc[:4], format='ISO8601',
+                                  utc=True)
+        self.assertEqual(str(out['date'].dtype), 'datetime64[ns, UTC]')
+        self.assertTrue((out['date'].iloc[:4] == expected).all())
+        self.assertEqual(out['date'].iloc[4],
+                         pd.Timestamp('2020-05-22 04:00', tz='UTC'))
+        self.assertEqual(out['date'].iloc[6],
+                         pd.Timestamp('2020-06-08 17:45:00.250', tz='UTC'))
+
+    def test_fast_path_covers_mixed_layouts(self):
+        text = pd.Series(['2020-06-05 10:30:54', '2020-06-05T10:30:54Z',
+                          '2020-06-05 10:30:54-04:00',
+                          '2020-06-05 10:30:54+05:30'])
+        ok, seconds, aware = _parse_fixed_layout(text)
+        self.assertTrue(ok.all())
+        np.testing.assert_array_equal(aware, [False, True, True, True])
+        expected = pd.to_datetime(
+            ['2020-06-05 10:30:54', '2020-06-05 10:30:54',
+             '2020-06-05 14:30:54', '2020-06-05 05:00:54'])
+        np.testing.assert_array_equal(
+            seconds, expected.as_unit('s').asi8)
+        bad, _, _ = _parse_fixed_layout(
+            pd.Series(['2020-06-05 10:30:54', '2020-06-05 10:30:54-0x:00']))
+        np.testing.assert_array_equal(bad, [True, False])
+
+    def test_exchange_time_features(self):
+        out = convert_timestamp(self.df.copy())
+        self.assertEqual(str(out['ExchangeTime'].dt.tz), 'America/New_York')
+        self.assertEqual(out['Hour'].tolist(), [10, 10, 7, 17, 0, 8, 13])
+        self.assertEqual(out['Weekday'].tolist(), [4, 4, 4, 0, 4, 5, 0])
+        self.assertEqual(list(out['Session'].cat.categories), list(SESSIONS))
+        self.assertEqual(out['Session'].tolist(),
+                         ['regular', 'regular', 'pre_market', 'after_hours',
+                          'closed', 'closed', 'regular'])
+
+    def test_missing_and_invalid_values(self):
+        out = convert_timestamp(pd.DataFrame({'date': [
+            '2020-06-05 10:30:54-04:00', None]}))
+        self.assertTrue(pd.isna(out['date'].iloc[1]))
+        self.assertTrue(pd.isna(out['Hour'].iloc[1]))
+        self.assertTrue(pd.isna(out['Session'].iloc[1]))
+        with self.assertRaises(ValueError):
+            parse_timestamps(pd.Series(['2020-02-30 00:00:00-05:00']))
+
+    def test_all_missing_column(self):
+        for values in ([None, None], [np.nan, np.nan],
+                       pd.to_datetime([None, None])):
+            with self.subTest(values=values):
+                out = convert_timestamp(pd.DataFrame({'date': values}))
+                self.assertEqual(str(out['date'].dt.tz), 'UTC')
+                self.assertTrue(out['date'].isna().all())
+                self.assertEqual(str(out['Hour'].dtype), 'Int8')
+                self.assertTrue(out['Hour'].isna().all())
+                self.assertTrue(out['Session'].isna().all())
+        parsed = parse_timestamps(pd.Series([None], index=[7]))
+        self.assertEqual(parsed.index.tolist(), [7])
+        self.assertTrue(parsed.isna().all())
+
+    def test_fall_back_hour_is_not_dropped(self):
+        wall = ['2020-11-01 01:30:00', '2020-11-01 01:30:00.500']
+        inputs = [wall, pd.to_datetime(wall, format='ISO8601')]
+        for values in inputs:
+            with self.subTest(values=values):
+                out = convert_timestamp(pd.DataFrame({'date': values}))
+                self.assertEqual(out['date'].dt.floor('s').tolist(),
+                                 [pd.Timestamp('2020-11-01 05:30', tz='UTC')] * 2)
+                self.assertEqual(out['Hour'].tolist(), [1, 1])
+                self.assertEqual(out['Weekday'].tolist(), [6, 6])
+                self.assertEqual(str(out['Hour'].dtype), 'int8')
+
+    def test_datetime_input(self):
+        naive = pd.Series(pd.to_datetime(['2020-06-05 10:30:00']))
+        self.assertEqual(parse_timestamps(naive).iloc[0],
+                         pd.Timestamp('2020-06-05 14:30', tz='UTC'))
+        aware = naive.dt.tz_localize('UTC')
+        self.assertEqual(parse_timestamps(aware).iloc[0],
+                         pd.Timestamp('2020-06-05 10:30', tz='UTC'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import os
+import tempfile
+import unittest
+import pandas as pd
+from src.data_loader import NEWS_DTYPES, iter_news_chunks, load_data
+
+try:
+    import pyarrow  # noqa: F401
+    HAVE_PYARROW = True
+except ImportError:
+    HAVE_PYARROW = False
+
+
+class TestDataLoader(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'news.csv')
+        pd.DataFrame({
+            'headline': ['Up', 'Down', 'Flat', 'Up again'],
+            'publisher': ['a@x.com', 'B', 'a@x.com', 'B'],
+            'date': ['2020-06-05 10:30:54-04:00', '2020-01-05 10:30:54-05:00',
+                     '2020-06-06 00:00:00', '2020-06-07 09:00:00-04:00'],
+            'stock': ['A', 'A', 'B', 'C'],
+        }).to_csv(self.path, index=False)
+        self.cache_dir = os.path.join(self.tmp.name, 'cache')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_streaming_chunks_are_typed(self):
+        chunks = list(iter_news_chunks(self.path, chunksize=3))
+        self.assertEqual([len(c) for c in chunks], [3, 1])
+        for chunk in chunks:
+            self.assertIsInstance(chunk['publisher'].dtype, pd.CategoricalDtype)
+            self.assertEqual(str(chunk['date'].dt.tz), 'UTC')
+        counts = pd.concat(chunks)['publisher'].astype(str).value_counts()
+        self.assertEqual(counts['a@x.com'], 2)
+
+    def test_missing_file_raises_at_call_time(self):
+        with self.assertRaises(FileNotFoundError):
+            iter_news_chunks(os.path.join(self.tmp.name, 'missing.csv'))
+
+    @unittest.skipUnless(HAVE_PYARROW, 'pyarrow not installed')
+    def test_cache_roundtrip_and_invalidation(self):
+        kwargs = dict(dtype=NEWS_DTYPES, date_column='date',
+                      cache_dir=self.cache_dir)
+        cold = load_data(self.path, **kwargs)
+        warm = load_data(self.path, **kwargs)
+        pd.testing.assert_frame_equal(cold, warm)
+        subset = load_data(self.path, columns=['stock'], **kwargs)
+        self.assertEqual(subset.columns.tolist(), ['stock'])
+
+        # Corrupt cache files are rebuilt silently.
+        (entry,) = os.listdir(self.cache_dir)
+        with open(os.path.join(self.cache_dir, entry), 'wb') as f:
+            f.write(b'not feather')
+        pd.testing.assert_frame_equal(cold, load_data(self.path, **kwargs))
+
+        # Touching the source invalidates and replaces the old copy.
+        with open(self.path, 'a') as f:
+            f.write('Late,C,2020-06-08 09:00:00-04:00,D\n')
+        self.assertEqual(len(load_data(self.path, **kwargs)), 5)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+import numpy as np
+from visualization.decimation import (decimate, decimate_indices,
+                                      lttb_indices, minmax_indices)
+
+
+class TestDecimation(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.y = np.cumsum(rng.normal(size=100_000))
+        self.y[5000] = 1e6  # a one-bar spike must survive
+        self.y[:30] = np.nan
+        self.x = np.datetime64('2000-01-01') + np.arange(100_000)
+
+    def test_minmax_keeps_every_bucket_extreme(self):
+        idx = minmax_indices(self.y, 500)
+        self.assertLessEqual(len(idx), 2 * 500 + 2)
+        self.assertTrue(np.all(np.diff(idx) > 0))
+        self.assertIn(5000, idx)
+        self.assertIn(int(np.nanargmin(self.y)), idx)
+        self.assertEqual((idx[0], idx[-1]), (0, len(self.y) - 1))
+
+    def test_lttb_point_count_and_ends(self):
+        idx = lttb_indices(self.x, self.y, 1000)
+        self.assertEqual(len(idx), 1000)
+        self.assertEqual((idx[0], idx[-1]), (30, len(self.y) - 1))
+        self.assertIn(5000, idx)
+        self.assertFalse(np.isnan(self.y[idx]).any())
+
+    def test_short_series_unchanged(self):
+        x, y = decimate(self.x[:100], self.y[:100], max_points=1000)
+        np.testing.assert_array_equal(y, self.y[:100])
+        np.testing.assert_array_equal(x, self.x[:100])
+
+    def test_unknown_method(self):
+        with self.assertRaises(ValueError):
+            decimate_indices(self.x, self.y, 10, method='mean')
+
+    def test_time_series_markers_follow_decimation(self):
+        import matplotlib
+        matplotlib.use('Agg', force=True)
+        import matplotlib.pyplot as plt
+        import pandas as pd
+        from scripts.plots import Plot
+
+        lines = []
+        original = plt.plot
+        plt.plot = lambda *a, **k: lines.append(original(*a, **k)[0])
+        try:
+            for n in (1000, 100_000):
+                df = pd.DataFrame({'Date': self.x[:n], 'Close': self.y[:n]})
+                Plot().time_series(df, 'Date', 'Close', show=False)
+        finally:
+            plt.plot = original
+        short, long = lines
+        self.assertEqual(len(short.get_ydata()), 1000)
+        self.assertEqual(short.get_marker(), 'o')
+        self.assertLess(len(long.get_ydata()), 100_000)
+        self.assertEqual(long.get_marker(), 'None')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+import numpy as np
+import pandas as pd
+from benchmarks.synthetic import make_news_frame
+from src.analysis.descriptive_stats import (NewsStatsAccumulator,
+                                            compute_descriptive_stats)
+
+
+class TestDescriptiveStats(unittest.TestCase):
+    def setUp(self):
+        self.df = make_news_frame(5000, n_stocks=20, seed=3)
+        self.df.loc[7, 'headline'] = None
+        self.df['date'] = pd.to_datetime(self.df['date'], format='ISO8601',
+                                         utc=True)
+
+    def expected(self):
+        return {
+            'headline_stats': self.df['headline'].str.len().describe(),
+            'publisher_counts': self.df['publisher'].value_counts(),
+            'daily_counts': self.df.groupby(
+                self.df['date'].dt.tz_convert('America/New_York')
+                .dt.tz_localize(None).dt.normalize()).size(),
+        }
+
+    def check(self, stats):
+        expected = self.expected()
+        np.testing.assert_allclose(stats['headline_stats'].to_numpy(),
+                                   expected['headline_stats'].to_numpy())
+        pd.testing.assert_series_equal(
+            stats['publisher_counts'].sort_index(),
+            expected['publisher_counts'].sort_index(), check_names=False,
+            check_index_type=False)
+        self.assertTrue(stats['publisher_counts'].is_monotonic_decreasing)
+        np.testing.assert_array_equal(stats['daily_counts'].to_numpy(),
+                                      expected['daily_counts'].to_numpy())
+        np.testing.assert_array_equal(stats['daily_counts'].index,
+                                      expected['daily_counts'].index)
+
+    def test_days_are_exchange_calendar_days(self):
+        df = pd.DataFrame({
+            'headline': ['a', 'b', 'c'], 'publisher': ['x', 'x', 'y'],
+            'date': ['2020-06-05 20:00:00-04:00', '2020-06-05 09:00:00-04:00',
+                     '2020-06-06 01:00:00Z']})
+        days = compute_descriptive_stats(df)['daily_counts']
+        self.assertEqual(days.to_dict(), {pd.Timestamp('2020-06-05'): 3})
+
+    def test_single_frame_matches_pandas(self):
+        self.check(compute_descriptive_stats(self.df))
+
+    def test_chunks_match_single_frame(self):
+        chunks = (self.df.iloc[i:i + 700] for i in range(0, len(self.df), 700))
+        self.check(compute_descriptive_stats(chunks))
+
+    def test_merge_of_partial_results(self):
+        halves = [NewsStatsAccumulator().update(self.df.iloc[:2000]),
+                  NewsStatsAccumulator().update(self.df.iloc[2000:])]
+        total = halves[1].merge(halves[0])
+        self.check(total.result())
+        self.assertEqual(total.rows, len(self.df))
+
+
+if __name__ == '__main__':
+    unittest.main()
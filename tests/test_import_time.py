@@ -0,0 +1,60 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+from src.lazy import lazy_import
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Entry points that must import without pulling in the plotting or NLP
+# stacks. pandas/numpy are imported first so only our own cost is timed.
+ENTRY_POINTS = [
+    'src.main',
+    'scripts.quantitative_analysis',
+    'scripts.technical_analysis',
+    'scripts.plots',
+    'scripts.viz',
+    'visualization.plot_utils',
+]
+# Budget per entry point; matplotlib.pyplot alone takes longer than this.
+BUDGET_SECONDS = 0.5
+# Submodules that only appear once a lazy package has really been loaded
+# (LazyLoader registers the top-level name up front).
+HEAVY_MODULES = ['matplotlib.pyplot', 'seaborn.palettes', 'textblob.blob',
+                 'scipy.sparse']
+
+PROBE = """
+import json, sys, time
+import numpy, pandas
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{'seconds': elapsed,
+                   'loaded': [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def probe(module):
+    out = subprocess.run(
+        [sys.executable, '-c', PROBE.format(module=module, heavy=HEAVY_MODULES)],
+        cwd=ROOT, capture_output=True, text=True, check=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+class TestImportTime(unittest.TestCase):
+    def test_entry_points_import_within_budget(self):
+        for module in ENTRY_POINTS:
+            with self.subTest(module=module):
+                result = probe(module)
+                self.assertEqual(result['loaded'], [])
+                self.assertLess(result['seconds'], BUDGET_SECONDS)
+
+    def test_lazy_module_loads_on_attribute_access(self):
+        module = lazy_import('json.decoder')
+        self.assertIs(module.JSONDecoder, json.decoder.JSONDecoder)
+        self.assertIs(lazy_import('json'), json)
+
+
+if __name__ == '__main__':
+    unittest.main()
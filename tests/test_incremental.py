@@ -0,0 +1,45 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from scripts.incremental import IncrementalIndicators
+from scripts.indicators import available_backends
+from scripts.technical_analysis import calculate_technical_indicators
+
+COLUMNS = ['SMA_20', 'RSI', 'MACD', 'MACD_Signal', 'MACD_Hist']
+
+
+def random_walk(n, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+    return pd.Series(close, index=pd.bdate_range('2020-01-01', periods=n))
+
+
+class TestIncrementalIndicators(unittest.TestCase):
+    @unittest.skipUnless('talib' in available_backends(), 'TA-Lib not installed')
+    def test_matches_full_recomputation(self):
+        close = random_walk(500)
+        expected = calculate_technical_indicators(
+            pd.DataFrame({'Close': close}))
+        result = IncrementalIndicators().extend(close)
+        pd.testing.assert_frame_equal(result[COLUMNS], expected[COLUMNS],
+                                      check_exact=False, rtol=1e-10,
+                                      atol=1e-10)
+
+    def test_resume_from_saved_state(self):
+        close = random_walk(300, seed=1)
+        uninterrupted = IncrementalIndicators().extend(close)
+
+        first = IncrementalIndicators()
+        head = first.extend(close.iloc[:100])
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'state.json')
+            first.save(path)
+            tail = IncrementalIndicators.load(path).extend(close.iloc[100:])
+
+        pd.testing.assert_frame_equal(pd.concat([head, tail]), uninterrupted)
+
+
+if __name__ == '__main__':
+    unittest.main()
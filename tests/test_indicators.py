@@ -0,0 +1,56 @@
+import unittest
+import numpy as np
+from scripts.incremental import IncrementalIndicators
+from scripts.indicators import available_backends, get_backend
+
+
+def random_walk(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+
+
+def indicators(backend, close):
+    macd, signal, hist = backend.macd(close, 12, 26, 9)
+    return {'SMA_20': backend.sma(close, 20), 'RSI': backend.rsi(close, 14),
+            'MACD': macd, 'MACD_Signal': signal, 'MACD_Hist': hist}
+
+
+class TestNumpyBackend(unittest.TestCase):
+    def setUp(self):
+        self.numpy = get_backend('numpy')
+        self.close = random_walk(1000)
+
+    def assertArraysClose(self, actual, expected):
+        np.testing.assert_allclose(actual, expected, rtol=1e-10, atol=1e-10)
+
+    @unittest.skipUnless('talib' in available_backends(), 'TA-Lib not installed')
+    def test_matches_talib(self):
+        expected = indicators(get_backend('talib'), self.close)
+        for name, values in indicators(self.numpy, self.close).items():
+            self.assertArraysClose(values, expected[name])
+        self.assertArraysClose(self.numpy.ema(self.close, 20),
+                               get_backend('talib').ema(self.close, 20))
+
+    def test_matches_incremental(self):
+        expected = IncrementalIndicators().extend(self.close)
+        for name, values in indicators(self.numpy, self.close).items():
+            self.assertArraysClose(values, expected[name].to_numpy())
+
+    def test_ragged_panel_matches_single_columns(self):
+        panel = np.full((400, 3), np.nan)
+        panel[:, 0] = self.close[:400]
+        panel[150:, 1] = self.close[:250]
+        panel[390:, 2] = self.close[:10]
+        result = indicators(self.numpy, panel)
+        for j in range(panel.shape[1]):
+            for name, values in indicators(self.numpy, panel[:, j]).items():
+                self.assertArraysClose(result[name][:, j], values)
+        self.assertTrue(np.isnan(result['RSI'][:, 2]).all())
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            get_backend('excel')
+
+
+if __name__ == '__main__':
+    unittest.main()
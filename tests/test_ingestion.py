@@ -0,0 +1,200 @@
+import asyncio
+import os
+import sys
+import tempfile
+import time
+import types
+import unittest
+import numpy as np
+import pandas as pd
+from benchmarks.synthetic import make_ohlcv, make_tickers
+from src.data.ingestion import (CSVDirectorySource, PriceStore, RateLimiter,
+                                YFinanceSource, ingest, load_prices)
+
+
+class RecordingSource(CSVDirectorySource):
+    """Fixture source that logs requests, fails on demand and tracks overlap."""
+
+    def __init__(self, sources, failures=0, delay=0.0):
+        super().__init__(sources)
+        self.requests = []
+        self.failures = failures
+        self.delay = delay
+        self.active = self.peak = 0
+
+    async def fetch(self, ticker, start, end):
+        self.requests.append((ticker, start, end))
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.failures:
+                self.failures -= 1
+                raise ConnectionError('simulated outage')
+            return self.download(ticker, start, end)
+        finally:
+            self.active -= 1
+
+
+class TestIngestion(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        fixtures = os.path.join(self.tmp.name, 'fixtures')
+        os.makedirs(fixtures)
+        self.tickers = make_tickers(3)
+        for i, ticker in enumerate(self.tickers):
+            # 800 business days, 2019-01-01 to early 2022.
+            make_ohlcv(800, seed=i, start='2019-01-01').to_csv(
+                os.path.join(fixtures, f"{ticker}_historical_data.csv"),
+                index=False)
+        self.fixtures = fixtures
+        self.store = PriceStore(os.path.join(self.tmp.name, 'store'))
+        self.expected = CSVDirectorySource(fixtures)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_reruns_fetch_only_missing_ranges(self):
+        source = RecordingSource(self.fixtures)
+        counts = ingest(self.tickers, '2019-01-01', '2020-07-01', source,
+                        self.store)
+        self.assertEqual(len(source.requests), 3)
+        self.assertTrue(all(n > 0 for n in counts.values()))
+
+        source.requests.clear()
+        counts = ingest(self.tickers, '2019-03-01', '2020-01-01', source,
+                        self.store)
+        self.assertEqual(source.requests, [])
+        self.assertEqual(set(counts.values()), {0})
+
+        ingest(self.tickers, '2018-06-01', '2021-01-01', source, self.store)
+        ranges = sorted({(s, e) for _, s, e in source.requests})
+        self.assertEqual(ranges, [
+            (pd.Timestamp('2018-06-01'), pd.Timestamp('2019-01-01')),
+            (pd.Timestamp('2020-07-01'), pd.Timestamp('2021-01-01'))])
+        self.assertEqual(self.store.coverage(self.tickers[0]),
+                         [(pd.Timestamp('2018-06-01'),
+                           pd.Timestamp('2021-01-01'))])
+
+    def test_store_is_partitioned_by_year_and_round_trips(self):
+        ticker = self.tickers[0]
+        ingest([ticker], '2019-01-01', '2022-01-01',
+               RecordingSource(self.fixtures), self.store)
+        files = sorted(os.listdir(os.path.join(self.store.root, ticker)))
+        self.assertEqual([f.split('.')[0] for f in files],
+                         ['2019', '2020', '2021', '_coverage'])
+
+        stored = self.store.read(ticker, '2019-06-01', '2021-06-01')
+        expected = self.expected.download(ticker, pd.Timestamp('2019-06-01'),
+                                          pd.Timestamp('2021-06-01'))
+        self.assertEqual(len(stored), len(expected))
+        np.testing.assert_allclose(stored['Close'].to_numpy(),
+                                   expected['Close'].to_numpy())
+        wide = self.store.read_field(self.tickers, 'Close', '2020-01-01',
+                                     '2020-02-01')
+        self.assertEqual(list(wide.columns), [ticker])
+
+    def test_concurrency_is_bounded(self):
+        source = RecordingSource(self.fixtures, delay=0.02)
+        ingest(self.tickers, '2019-01-01', '2019-02-01', source, self.store,
+               max_concurrency=2)
+        self.assertEqual(len(source.requests), 3)
+        self.assertEqual(source.peak, 2)
+
+    def test_failed_requests_are_retried(self):
+        source = RecordingSource(self.fixtures, failures=2)
+        counts = ingest(self.tickers[:1], '2019-01-01', '2019-02-01', source,
+                        self.store, retries=2, backoff=0)
+        self.assertEqual(len(source.requests), 3)
+        self.assertGreater(counts[self.tickers[0]], 0)
+
+    def test_exhausted_retries_raise_after_storing_the_rest(self):
+        source = RecordingSource(self.fixtures)
+        with self.assertRaises(RuntimeError):
+            ingest(self.tickers + ['MISSING'], '2019-01-01', '2019-02-01',
+                   source, self.store, retries=1, backoff=0)
+        self.assertEqual(self.store.tickers(), self.tickers)
+        self.assertEqual(self.store.coverage('MISSING'), [])
+
+    def test_load_prices_returns_frames_per_ticker(self):
+        prices = load_prices(self.tickers, '2019-01-01', '2019-04-01',
+                             RecordingSource(self.fixtures), self.store)
+        self.assertEqual(sorted(prices), self.tickers)
+        self.assertEqual(prices[self.tickers[0]].index.max(),
+                         pd.Timestamp('2019-03-29'))
+
+    def test_load_prices_inside_running_loop(self):
+        # As in a notebook cell, where ipykernel's loop is already running.
+        async def cell():
+            return load_prices(self.tickers, '2019-01-01', '2019-04-01',
+                               RecordingSource(self.fixtures), self.store)
+
+        prices = asyncio.run(cell())
+        self.assertEqual(sorted(prices), self.tickers)
+        self.assertGreater(len(prices[self.tickers[0]]), 0)
+
+    def test_empty_answers_are_not_covered_for_unreliable_sources(self):
+        source = RecordingSource(self.fixtures)
+        source.empty_is_covered = False
+        ingest(self.tickers[:1], '2019-01-01', '2019-02-01', source,
+               self.store)
+        # The range before the fixtures comes back empty and stays missing.
+        ingest(self.tickers[:1], '2010-01-01', '2019-02-01', source,
+               self.store)
+        self.assertEqual(len(source.requests), 2)
+        self.assertEqual(self.store.coverage(self.tickers[0]),
+                         [(pd.Timestamp('2019-01-01'),
+                           pd.Timestamp('2019-02-01'))])
+        self.assertEqual(self.store.missing(self.tickers[0], '2010-01-01',
+                                            '2019-02-01'),
+                         [(pd.Timestamp('2010-01-01'),
+                           pd.Timestamp('2019-01-01'))])
+
+    def test_yfinance_errors_are_raised(self):
+        yf = types.ModuleType('yfinance')
+        yf.shared = types.SimpleNamespace(_ERRORS={})
+
+        def download(ticker, **kwargs):
+            yf.shared._ERRORS = {ticker: yf.error} if yf.error else {}
+            return pd.DataFrame(columns=['Open', 'High', 'Low', 'Close',
+                                         'Volume'])
+
+        yf.download = download
+        saved = sys.modules.get('yfinance')
+        sys.modules['yfinance'] = yf
+        try:
+            source = YFinanceSource()
+            start, end = pd.Timestamp('2020-01-01'), pd.Timestamp('2020-02-01')
+            yf.error = "YFRateLimitError('Too Many Requests. Rate limited.')"
+            with self.assertRaises(RuntimeError):
+                source.download('AAPL', start, end)
+            yf.error = "YFPricesMissingError('possibly delisted; no price data found')"
+            self.assertEqual(len(source.download('AAPL', start, end)), 0)
+            ingest(['AAPL'], start, end, source, self.store)
+            self.assertEqual(self.store.coverage('AAPL'), [])
+            yf.error = "YFRateLimitError('Too Many Requests. Rate limited.')"
+            with self.assertRaises(RuntimeError):
+                ingest(['AAPL'], start, end, source, self.store, retries=1,
+                       backoff=0)
+            self.assertEqual(self.store.coverage('AAPL'), [])
+        finally:
+            if saved is None:
+                sys.modules.pop('yfinance')
+            else:
+                sys.modules['yfinance'] = saved
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_calls_are_spaced(self):
+        async def run():
+            limiter = RateLimiter(50)
+            start = time.monotonic()
+            await asyncio.gather(*(limiter.acquire() for _ in range(6)))
+            return time.monotonic() - start
+
+        # Five intervals of 20 ms after the first call.
+        self.assertGreaterEqual(asyncio.run(run()), 0.09)
+
+
+if __name__ == '__main__':
+    unittest.main()
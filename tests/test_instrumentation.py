@@ -0,0 +1,82 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from src import instrumentation
+from src.data_analyzer import get_summary_statistics
+from src.data_loader import load_data
+
+
+@instrumentation.instrumented(name='allocate')
+def allocate(n):
+    return np.ones(n)
+
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        instrumentation.reset_metrics()
+
+    def tearDown(self):
+        instrumentation.disable()
+        instrumentation.reset_metrics()
+
+    def test_disabled_records_nothing(self):
+        instrumentation.disable()
+        get_summary_statistics(pd.DataFrame({'a': range(10)}))
+        self.assertEqual(instrumentation.get_metrics(), [])
+
+    def test_records_time_and_rows(self):
+        instrumentation.enable()
+        df = pd.DataFrame({'a': range(50)})
+        get_summary_statistics(df)
+        record, = instrumentation.get_metrics()
+        self.assertEqual(record['stage'], 'get_summary_statistics')
+        self.assertEqual(record['rows'], 50)
+        self.assertGreaterEqual(record['seconds'], 0)
+        self.assertNotIn('peak_bytes', record)
+
+    def test_loader_rows_come_from_result(self):
+        instrumentation.enable()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'data.csv')
+            pd.DataFrame({'a': range(30)}).to_csv(path, index=False)
+            load_data(path, use_cache=False)
+            chunks = load_data(path, chunksize=10, use_cache=False)
+            with instrumentation.stage('consume') as record:
+                record['rows'] = sum(len(chunk) for chunk in chunks)
+        eager, lazy, consume = instrumentation.get_metrics()
+        self.assertEqual(eager['rows'], 30)
+        self.assertIsNone(lazy['rows'])
+        self.assertEqual(consume['rows'], 30)
+
+    def test_nested_memory_peaks(self):
+        instrumentation.enable(memory=True)
+        with instrumentation.stage('outer') as outer:
+            allocate(1_000_000)
+            with instrumentation.stage('inner'):
+                allocate(10)
+            outer['rows'] = 1
+        records = instrumentation.get_metrics()
+        self.assertEqual([r['stage'] for r in records],
+                         ['allocate', 'allocate', 'inner', 'outer'])
+        big, small, inner, outer = records
+        self.assertGreaterEqual(big['peak_bytes'], 8_000_000)
+        self.assertLess(inner['peak_bytes'], 8_000_000)
+        # The outer peak survives the inner stage resetting tracemalloc.
+        self.assertGreaterEqual(outer['peak_bytes'], 8_000_000)
+        self.assertEqual(outer['rows'], 1)
+
+    def test_profile_dump(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            instrumentation.enable(profile=True, profile_dir=tmp,
+                                   metrics_file=os.path.join(tmp, 'm.jsonl'))
+            allocate(100)
+            record, = instrumentation.get_metrics()
+            self.assertTrue(os.path.exists(record['profile']))
+            with open(os.path.join(tmp, 'm.jsonl')) as f:
+                self.assertEqual(len(f.readlines()), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+import numpy as np
+import pandas as pd
+from scripts import metrics
+from scripts.panel import PricePanel
+from scripts.technical_analysis import calculate_financial_metrics
+
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        dates = pd.bdate_range('2020-01-01', periods=300)
+        self.prices = pd.DataFrame(
+            100 * np.exp(np.cumsum(rng.normal(0, 0.01, (300, 4)), axis=0)),
+            index=dates, columns=['AAPL', 'AMZN', 'GOOG', 'TSLA'])
+        self.prices.iloc[:40, 2] = np.nan  # late listing
+        self.prices.iloc[100, 3] = np.nan  # gap
+        self.reference = self.prices.pct_change(fill_method=None)
+
+    def test_returns_match_pandas(self):
+        pd.testing.assert_frame_equal(metrics.returns(self.prices),
+                                      self.reference)
+        expected = np.log(self.prices / self.prices.shift())
+        pd.testing.assert_frame_equal(metrics.returns(self.prices, 'log'),
+                                      expected)
+
+    def test_volatility_matches_single_ticker_path(self):
+        vol = metrics.annualized_volatility(metrics.returns(self.prices))
+        for ticker in self.prices:
+            df = self.prices[[ticker]].rename(columns={ticker: 'Close'})
+            _, single = calculate_financial_metrics(df)
+            expected = self.reference[ticker].std() * np.sqrt(252)
+            self.assertAlmostEqual(single, expected, places=12)
+            self.assertAlmostEqual(vol[ticker], expected, places=12)
+
+    def test_rolling_volatility_and_drawdown(self):
+        rolling = metrics.rolling_volatility(self.reference, window=20)
+        expected = self.reference.rolling(20).std() * np.sqrt(252)
+        np.testing.assert_allclose(rolling, expected, atol=1e-10)
+        pd.testing.assert_frame_equal(
+            metrics.drawdown(self.prices),
+            self.prices / self.prices.cummax() - 1)
+
+    def test_sharpe_and_beta(self):
+        sharpe = metrics.sharpe_ratio(self.reference, risk_free=0.02)
+        excess = self.reference - 0.02 / 252
+        np.testing.assert_allclose(
+            sharpe, excess.mean() / excess.std() * np.sqrt(252))
+        bench = self.reference['AAPL']
+        beta = metrics.beta(self.reference, bench)
+        for ticker in self.prices:
+            rows = self.reference[ticker].notna() & bench.notna()
+            expected = (self.reference.loc[rows, ticker].cov(bench[rows])
+                        / bench[rows].var())
+            self.assertAlmostEqual(beta[ticker], expected, places=12)
+
+    def test_compute_metrics_on_panel(self):
+        panel = PricePanel.from_frames(
+            {t: self.prices[[t]].dropna().rename(columns={t: 'Close'})
+             for t in self.prices}, fields=['Close'])
+        table = metrics.compute_metrics(panel, benchmark=self.prices['AAPL'])
+        self.assertEqual(list(table.index), list(self.prices.columns))
+        self.assertAlmostEqual(table.loc['AAPL', 'beta'], 1.0)
+        close = self.prices['GOOG'].dropna()
+        self.assertAlmostEqual(table.loc['GOOG', 'total_return'],
+                               close.iloc[-1] / close.iloc[0] - 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+import pandas as pd
+from src.analysis.news_alignment import (aggregate_daily_sentiment,
+                                         align_to_sessions, join_daily_returns)
+
+
+class TestAlignToSessions(unittest.TestCase):
+    def setUp(self):
+        self.news = pd.DataFrame({
+            'date': ['2020-06-03 10:30:00-04:00',  # Wed, market hours
+                     '2020-06-05 16:30:00-04:00',  # Fri, after the close
+                     '2020-06-06 09:00:00-04:00',  # Saturday
+                     '2020-06-05 00:00:00',        # naive, exchange-local
+                     None],
+            'stock': ['AAPL', 'AAPL', 'AAPL', 'TSLA', 'TSLA'],
+            'sentiment': [0.5, -0.5, 0.25, 0.1, 0.0],
+        })
+        self.calendar = pd.bdate_range('2020-06-01', '2020-06-12')
+
+    def test_shared_calendar_rollover(self):
+        aligned = align_to_sessions(self.news, self.calendar)
+        expected = pd.to_datetime(['2020-06-03', '2020-06-08', '2020-06-08',
+                                   '2020-06-05', None])
+        self.assertTrue(
+            pd.Series(expected).equals(aligned['session'].astype(expected.dtype)))
+
+    def test_all_dates_missing(self):
+        news = self.news.assign(date=None)
+        aligned = align_to_sessions(news, self.calendar)
+        self.assertTrue(aligned['session'].isna().all())
+
+    def test_per_stock_calendar_matches_shared(self):
+        per_stock = {'AAPL': self.calendar, 'TSLA': self.calendar}
+        shared = align_to_sessions(self.news, self.calendar)['session']
+        by_stock = align_to_sessions(self.news, per_stock)['session']
+        pd.testing.assert_series_equal(shared, by_stock)
+
+    def test_per_stock_calendar_skips_missing_days(self):
+        per_stock = {'AAPL': self.calendar.drop(pd.Timestamp('2020-06-03')),
+                     'TSLA': self.calendar}
+        aligned = align_to_sessions(self.news, per_stock)
+        self.assertEqual(aligned['session'].iloc[0], pd.Timestamp('2020-06-04'))
+
+    def test_daily_join(self):
+        aligned = align_to_sessions(self.news, self.calendar)
+        daily = aggregate_daily_sentiment(aligned)
+        aapl = daily[daily['stock'] == 'AAPL'].set_index('Date')
+        self.assertAlmostEqual(aapl.loc['2020-06-08', 'sentiment'], -0.125)
+        self.assertEqual(aapl.loc['2020-06-08', 'headlines'], 2)
+
+        prices = pd.DataFrame({'ticker': 'AAPL', 'Date': self.calendar,
+                               'Close': range(100, 100 + len(self.calendar))})
+        joined = join_daily_returns(daily, prices)
+        self.assertEqual(list(joined['stock']), ['AAPL', 'AAPL'])
+        self.assertAlmostEqual(joined['return'].iloc[0], 1 / 101)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+import numpy as np
+import pandas as pd
+from scripts.indicators import get_backend
+from scripts.panel import PricePanel
+
+
+def ohlcv(n, start, seed):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+    return pd.DataFrame({
+        'Date': pd.bdate_range(start, periods=n).strftime('%Y-%m-%d'),
+        'Open': close, 'High': close * 1.01, 'Low': close * 0.99,
+        'Close': close, 'Volume': rng.integers(1000, 5000, n),
+    })
+
+
+class TestPricePanel(unittest.TestCase):
+    def setUp(self):
+        self.frames = {'AAPL': ohlcv(200, '2020-01-01', 0),
+                       'TSLA': ohlcv(120, '2020-04-01', 1)}
+        self.frames['AAPL'].loc[10, 'Close'] = np.nan
+        self.panel = PricePanel.from_frames(self.frames)
+
+    def test_missing_counts_ignore_dates_before_listing(self):
+        counts = self.panel.missing_counts()
+        for ticker, df in self.frames.items():
+            expected = df.drop(columns='Date').isnull().sum()
+            pd.testing.assert_series_equal(counts[ticker], expected,
+                                           check_names=False)
+
+    def test_describe_matches_pandas(self):
+        stats = self.panel.describe('Close')
+        for ticker, df in self.frames.items():
+            pd.testing.assert_series_equal(stats[ticker], df['Close'].describe(),
+                                           check_names=False)
+
+    def test_indicators_match_per_ticker(self):
+        panel = self.panel.with_indicators('numpy')
+        numpy = get_backend('numpy')
+        close = self.frames['TSLA']['Close'].to_numpy()
+        tsla = panel.ticker('TSLA')
+        self.assertEqual(len(tsla), 120)
+        np.testing.assert_allclose(tsla['RSI'].to_numpy(), numpy.rsi(close, 14))
+        np.testing.assert_allclose(tsla['MACD_Hist'].to_numpy(),
+                                   numpy.macd(close)[2])
+
+    def test_indicators_ignore_other_tickers_calendars(self):
+        # B skips one session that A traded; the panel's union grid must not
+        # turn that into a gap in B's history.
+        a = ohlcv(200, '2020-01-01', 2)
+        b = ohlcv(200, '2020-01-01', 3).drop(index=20).reset_index(drop=True)
+        panel = PricePanel.from_frames({'A': a, 'B': b}).with_indicators(
+            'numpy')
+        numpy = get_backend('numpy')
+        for ticker, df in (('A', a), ('B', b)):
+            close = df['Close'].to_numpy()
+            result = panel.ticker(ticker)
+            self.assertEqual(len(result), len(df))
+            np.testing.assert_allclose(result['RSI'].to_numpy(),
+                                       numpy.rsi(close, 14))
+            np.testing.assert_allclose(result['SMA_20'].to_numpy(),
+                                       numpy.sma(close, 20))
+            np.testing.assert_allclose(result['MACD'].to_numpy(),
+                                       numpy.macd(close)[0])
+        self.assertEqual(panel.ticker('B')['RSI'].iloc[20:].isna().sum(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+import os
+import sys
+import tempfile
+import unittest
+import pandas as pd
+from src.pipeline import Pipeline
+
+CALLS = []
+
+
+def load(file_path):
+    CALLS.append('load')
+    return pd.read_csv(file_path)['x']
+
+
+def scale(values, factor=1):
+    CALLS.append('scale')
+    return values * factor
+
+
+def total(values):
+    CALLS.append('total')
+    return float(values.sum())
+
+
+def count(values):
+    CALLS.append('count')
+    return len(values)
+
+
+def split(values):
+    CALLS.append('split')
+    return values.min(), values.max()
+
+
+class TestPipeline(unittest.TestCase):
+    def setUp(self):
+        CALLS.clear()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.csv = os.path.join(self.tmp.name, 'x.csv')
+        pd.DataFrame({'x': [1, 2, 3, 4]}).to_csv(self.csv, index=False)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def build(self, factor=2):
+        p = Pipeline(cache_dir=os.path.join(self.tmp.name, 'cache'))
+        p.add('load', load, params={'file_path': self.csv}, files=[self.csv])
+        p.add('scale', scale, inputs=['load'], params={'factor': factor})
+        p.add('total', total, inputs=['scale'])
+        p.add('count', count, inputs=['load'])
+        p.add('split', split, inputs=['load'], outputs=['low', 'high'])
+        return p
+
+    def test_rerun_is_served_from_cache(self):
+        first = self.build().run()
+        self.assertEqual(first, {'total': 20.0, 'count': 4, 'low': 1,
+                                 'high': 4})
+        CALLS.clear()
+        p = self.build()
+        self.assertEqual(p.run(), first)
+        self.assertEqual(CALLS, [])
+        self.assertEqual(set(p.report.values()), {'cached'})
+
+    def test_param_change_recomputes_downstream_only(self):
+        self.build(factor=2).run()
+        CALLS.clear()
+        p = self.build(factor=3)
+        result = p.run()
+        self.assertEqual(result['total'], 30.0)
+        self.assertEqual(CALLS, ['scale', 'total'])
+        self.assertEqual(p.report, {'load': 'cached', 'scale': 'ran',
+                                    'total': 'ran', 'count': 'cached',
+                                    'split': 'cached'})
+
+    def test_input_file_change_invalidates(self):
+        self.build().run(['count'])
+        pd.DataFrame({'x': [1, 2, 3, 4, 5]}).to_csv(self.csv, index=False)
+        CALLS.clear()
+        self.assertEqual(self.build().run(['count']), {'count': 5})
+        self.assertEqual(CALLS, ['load', 'count'])
+
+    def test_code_module_change_invalidates(self):
+        helper = os.path.join(self.tmp.name, 'pipeline_helper_mod.py')
+        with open(helper, 'w') as f:
+            f.write('FACTOR = 2\n')
+        sys.path.insert(0, self.tmp.name)
+        try:
+            def build():
+                p = self.build()
+                p.stages['scale'].code = ('pipeline_helper_mod',)
+                return p
+
+            build().run()
+            CALLS.clear()
+            build().run()
+            self.assertEqual(CALLS, [])
+            with open(helper, 'w') as f:
+                f.write('FACTOR = 3\n')
+            p = build()
+            p.run()
+            self.assertEqual(CALLS, ['scale', 'total'])
+            self.assertEqual(p.report['count'], 'cached')
+        finally:
+            sys.path.remove(self.tmp.name)
+
+    def test_process_pool_matches_in_process(self):
+        expected = self.build().run(max_workers=1)
+        p = self.build()
+        p.use_cache = False
+        self.assertEqual(p.run(max_workers=2), expected)
+
+    def test_cycle_and_missing_input_are_rejected(self):
+        p = Pipeline(use_cache=False)
+        p.add('a', count, inputs=['b'])
+        p.add('b', count, inputs=['a'])
+        with self.assertRaises(ValueError):
+            p.run()
+        p = Pipeline(use_cache=False)
+        p.add('a', count, inputs=['missing'])
+        with self.assertRaises(KeyError):
+            p.run()
+
+
+class TestMainStageSelection(unittest.TestCase):
+    def test_skip_eda_runs_only_the_price_branch(self):
+        from benchmarks.synthetic import make_ohlcv
+        from src.main import build_pipeline, main
+
+        with tempfile.TemporaryDirectory() as tmp:
+            stock = os.path.join(tmp, 'stock.csv')
+            make_ohlcv(300).to_csv(stock, index=False)
+            cache = os.path.join(tmp, 'cache')
+            os.environ['KAIM_CACHE_DIR'] = cache
+            try:
+                # The news file does not exist; skipping EDA must not touch it.
+                main(['--news', os.path.join(tmp, 'missing.csv'),
+                      '--stock', stock, '--output-dir', tmp, '--skip-eda'])
+            finally:
+                del os.environ['KAIM_CACHE_DIR']
+            self.assertTrue(os.path.exists(
+                os.path.join(tmp, 'technical_indicators.png')))
+            self.assertFalse(os.path.exists(
+                os.path.join(tmp, 'publication_trend.png')))
+            p = build_pipeline('missing.csv', stock, tmp, cache_dir=cache)
+            prints = p.fingerprints()
+            cached = set(os.listdir(os.path.join(cache, 'pipeline')))
+            self.assertIn(f"indicators.{prints['indicators']}.pkl", cached)
+            self.assertFalse(any(name.startswith('news.') for name in cached))
+            for stage in p.stages.values():
+                self.assertTrue(stage.code, stage.name)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import os
+import pickle
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from benchmarks.synthetic import make_ohlcv, write_ticker_csvs
+from scripts import metrics
+from scripts.universe import compute_universe_indicators
+from src.data.price_arrays import (MappedPrices, open_mapped_prices,
+                                   write_mapped_prices)
+from src.data.stock_loader import load_stock_data
+
+
+class TestMappedPrices(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.csv_dir = os.path.join(self.tmp.name, 'csv')
+        os.makedirs(self.csv_dir)
+        self.paths = write_ticker_csvs(self.csv_dir, 4, 600)
+        self.store = write_mapped_prices(self.csv_dir,
+                                         os.path.join(self.tmp.name, 'mapped'))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_views_match_source_without_copying(self):
+        for path in self.paths:
+            ticker = os.path.basename(path).split('_')[0]
+            expected = load_stock_data(path, price_dtype=None)
+            close = self.store.array(ticker, 'Close')
+            self.assertTrue(np.shares_memory(close, self.store.values))
+            self.assertFalse(close.flags.writeable)
+            np.testing.assert_array_equal(close, expected['Close'].to_numpy())
+
+            frame = self.store.frame(ticker)
+            self.assertTrue(np.shares_memory(frame['Close'].to_numpy(),
+                                             self.store.values))
+            pd.testing.assert_index_equal(frame.index,
+                                          expected.index.as_unit('ns'))
+            np.testing.assert_array_equal(frame['Volume'].to_numpy(),
+                                          expected['Volume'].to_numpy())
+
+    def test_pickles_as_path(self):
+        payload = pickle.dumps(self.store)
+        self.assertLess(len(payload), 512)
+        self.assertIs(pickle.loads(payload), self.store)
+
+    def test_rewrite_is_picked_up(self):
+        frames = {'NEW': make_ohlcv(50, seed=9)}
+        rewritten = write_mapped_prices(frames, self.store.path)
+        self.assertEqual(rewritten.tickers, ['NEW'])
+        self.assertIs(open_mapped_prices(self.store.path), rewritten)
+        self.assertEqual(len(rewritten.series('NEW')), 50)
+
+    def test_metrics_accept_views(self):
+        ticker = self.store.tickers[0]
+        rets = metrics.returns(self.store.series(ticker))
+        expected = metrics.returns(load_stock_data(
+            self.paths[0], price_dtype=None)['Close'])
+        np.testing.assert_array_equal(rets.to_numpy(), expected.to_numpy())
+        wide = self.store.field('Close')
+        self.assertEqual(list(wide.columns), self.store.tickers)
+
+    def test_universe_workers_share_the_store(self):
+        from_store = compute_universe_indicators(self.store, max_workers=2)
+        from_files = compute_universe_indicators(self.csv_dir, max_workers=1)
+        self.assertEqual(len(from_store), len(from_files))
+        np.testing.assert_allclose(from_store['RSI'].to_numpy(),
+                                   from_files['RSI'].to_numpy(), atol=1e-3,
+                                   equal_nan=True)
+
+    def test_missing_store_raises(self):
+        with self.assertRaises(FileNotFoundError):
+            MappedPrices(os.path.join(self.tmp.name, 'nowhere'))
+
+
+if __name__ == '__main__':
+    unittest.main()
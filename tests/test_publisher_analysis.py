@@ -0,0 +1,59 @@
+import unittest
+import pandas as pd
+from src.analysis.publisher_analysis import (DOMAIN_PATTERN,
+                                             analyze_publishers,
+                                             publisher_domains,
+                                             top_domains_by_period)
+
+
+class TestPublisherAnalysis(unittest.TestCase):
+    def setUp(self):
+        self.df = pd.DataFrame({
+            'publisher': ['a@zacks.com', 'Lisa Levin', 'b@benzinga.com',
+                          'a@zacks.com', None, 'c@zacks.com',
+                          'b@benzinga.com'],
+            'date': pd.to_datetime(['2020-01-05', '2020-01-06', '2020-01-07',
+                                    '2020-02-01', '2020-02-02', '2020-02-03',
+                                    '2020-02-04']),
+        })
+
+    def test_domains_match_regex_per_row(self):
+        for publishers in (self.df['publisher'],
+                           self.df['publisher'].astype('category')):
+            domains = publisher_domains(publishers)
+            expected = self.df['publisher'].str.extract(DOMAIN_PATTERN)[0]
+            self.assertEqual(domains.astype(object).tolist(),
+                             expected.astype(object).tolist())
+
+    def test_counts_match_value_counts(self):
+        counts = analyze_publishers(self.df)
+        self.assertEqual(counts.to_dict(), {'zacks.com': 3, 'benzinga.com': 2})
+        self.assertEqual(list(counts.index), ['zacks.com', 'benzinga.com'])
+
+    def test_top_domains_by_month(self):
+        top = top_domains_by_period(self.df, freq='M', n=1)
+        self.assertEqual(top['period'].astype(str).tolist(),
+                         ['2020-01', '2020-02'])
+        self.assertEqual(top['domain'].astype(str).tolist(),
+                         ['benzinga.com', 'zacks.com'])
+        self.assertEqual(top['count'].tolist(), [1, 2])
+
+    def test_periods_follow_exchange_calendar(self):
+        df = pd.DataFrame({
+            'publisher': ['a@zacks.com', 'b@benzinga.com', 'c@zacks.com'],
+            'date': pd.to_datetime(['2020-06-30 21:00:00-04:00',
+                                    '2020-06-30 23:59:00-04:00',
+                                    '2020-07-01 00:30:00-04:00'], utc=True),
+        })
+        top = top_domains_by_period(df, freq='M', n=5)
+        self.assertEqual(top['period'].astype(str).tolist(),
+                         ['2020-06', '2020-06', '2020-07'])
+        self.assertEqual(top['domain'].astype(str).tolist(),
+                         ['benzinga.com', 'zacks.com', 'zacks.com'])
+        daily = top_domains_by_period(df.astype({'date': str}), freq='D')
+        self.assertEqual(daily['period'].astype(str).tolist(),
+                         ['2020-06-30', '2020-06-30', '2020-07-01'])
+
+
+if __name__ == '__main__':
+    unittest.main()
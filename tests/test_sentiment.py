@@ -0,0 +1,37 @@
+import unittest
+import numpy as np
+import pandas as pd
+
+try:
+    from textblob import TextBlob
+    from scripts.sentiment import score_headlines
+    HAVE_TEXTBLOB = True
+except ImportError:
+    HAVE_TEXTBLOB = False
+
+
+@unittest.skipUnless(HAVE_TEXTBLOB, 'textblob not installed')
+class TestSentiment(unittest.TestCase):
+    def test_matches_textblob(self):
+        headlines = pd.Series([
+            'Apple hits record high',
+            'Concerns over future growth',
+            "Apple's earnings aren't great",
+            'Not a good quarter for Tesla',
+            'Very good results, really strong guidance',
+            'Stocks That Hit 52-Week Highs On Friday',
+            'Ok. Analysts see U.S. demand as "excellent"',
+            'Great quarter! :)',
+            'Apple hits record high',
+            '',
+            None,
+        ])
+        expected = [TextBlob(h).sentiment.polarity if isinstance(h, str)
+                    else np.nan for h in headlines]
+        result = score_headlines(headlines)
+        np.testing.assert_allclose(result.to_numpy(), expected, atol=1e-12)
+        self.assertTrue(result.index.equals(headlines.index))
+
+
+if __name__ == '__main__':
+    unittest.main()
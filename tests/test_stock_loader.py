@@ -0,0 +1,69 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from benchmarks.synthetic import make_ohlcv
+from scripts.quantitative_analysis import add_technical_indicators
+from src.analysis.technical_analysis import calculate_technical_indicators
+from src.data.stock_loader import (apply_ohlcv_schema, compact_volume,
+                                   frame_nbytes, load_stock_data)
+
+# Largest acceptable float32 vs float64 deviation, in indicator units.
+TOLERANCE = {'SMA_20': 1e-3, 'RSI': 1e-3, 'MACD': 1e-3, 'MACD_Signal': 1e-3,
+             'MACD_Hist': 1e-3}
+
+
+class TestStockLoader(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'AAPL_historical_data.csv')
+        make_ohlcv(1500, seed=3).to_csv(self.path, index=False)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_schema_is_applied_at_load(self):
+        df = load_stock_data(self.path)
+        self.assertIsInstance(df.index, pd.DatetimeIndex)
+        self.assertEqual(df['Close'].dtype, np.float32)
+        self.assertEqual(df['Volume'].dtype, np.int32)
+        wide = load_stock_data(self.path, price_dtype=None)
+        self.assertEqual(wide['Close'].dtype, np.float64)
+        self.assertLess(frame_nbytes(df), frame_nbytes(wide))
+
+    def test_apply_schema_to_raw_frame(self):
+        raw = pd.read_csv(self.path)
+        typed = apply_ohlcv_schema(raw)
+        self.assertEqual(typed.index.name, 'Date')
+        self.assertNotIn('Date', typed.columns)
+        self.assertEqual(typed['Open'].dtype, np.float32)
+        self.assertEqual(raw['Open'].dtype, np.float64)  # input untouched
+        self.assertLess(frame_nbytes(typed), frame_nbytes(raw))
+
+    def test_volume_too_large_or_gappy_is_kept(self):
+        big = pd.Series([1, 2**40])
+        self.assertEqual(compact_volume(big).dtype, np.int64)
+        gappy = pd.Series([1.0, np.nan])
+        self.assertEqual(compact_volume(gappy).dtype, np.float64)
+
+    def test_float32_indicators_within_tolerance(self):
+        narrow = calculate_technical_indicators(load_stock_data(self.path),
+                                                backend='numpy')
+        wide = calculate_technical_indicators(
+            load_stock_data(self.path, price_dtype=None), backend='numpy')
+        for column, tol in TOLERANCE.items():
+            self.assertEqual(narrow[column].dtype, np.float32)
+            np.testing.assert_allclose(narrow[column], wide[column],
+                                       atol=tol, rtol=0, equal_nan=True)
+
+    def test_indicators_do_not_copy_close(self):
+        df = load_stock_data(self.path)
+        before = df['Close'].to_numpy()
+        add_technical_indicators(df, backend='numpy')
+        self.assertTrue(np.shares_memory(before, df['Close'].to_numpy()))
+        self.assertEqual(df['SMA'].dtype, np.float32)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+import asyncio
+import os
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from benchmarks.synthetic import make_ohlcv, make_tickers
+from scripts.indicators import available_backends
+from scripts.streaming import (Bar, StreamingEngine, queue_source,
+                               replay_bars, replay_source, socket_source)
+from scripts.technical_analysis import calculate_technical_indicators
+from src.data.stock_loader import apply_ohlcv_schema
+
+
+def make_frames(n_tickers, n_days):
+    return {t: apply_ohlcv_schema(make_ohlcv(n_days, seed=i), price_dtype=None)
+            for i, t in enumerate(make_tickers(n_tickers))}
+
+
+def batch_alerts(ticker, df):
+    """The same crossings, found on full-history indicator columns."""
+    df = calculate_technical_indicators(df.copy())
+    found = set()
+    for column, rules in (
+            ('RSI', [('rsi_overbought', lambda p, c: (p <= 70) & (c > 70)),
+                     ('rsi_exit_overbought', lambda p, c: (p > 70) & (c <= 70)),
+                     ('rsi_oversold', lambda p, c: (p >= 30) & (c < 30)),
+                     ('rsi_exit_oversold', lambda p, c: (p < 30) & (c >= 30))]),
+            ('MACD_Hist', [('macd_bullish', lambda p, c: (p <= 0) & (c > 0)),
+                           ('macd_bearish', lambda p, c: (p >= 0) & (c < 0))])):
+        cur = df[column].to_numpy()
+        prev = np.concatenate([[np.nan], cur[:-1]])
+        for kind, rule in rules:
+            for t in df.index[rule(prev, cur)]:
+                found.add((ticker, t, kind))
+    return found
+
+
+class TestStreamingEngine(unittest.TestCase):
+    @unittest.skipUnless('talib' in available_backends(), 'TA-Lib not installed')
+    def test_replay_alerts_match_batch_indicators(self):
+        frames = make_frames(3, 600)
+        engine = StreamingEngine()
+        sink = asyncio.Queue()
+        asyncio.run(engine.run(replay_source(frames), sink))
+        streamed = set()
+        while not sink.empty():
+            alert = sink.get_nowait()
+            streamed.add((alert.ticker, alert.time, alert.kind))
+        expected = set()
+        for ticker, df in frames.items():
+            expected |= batch_alerts(ticker, df)
+        self.assertTrue(expected)
+        self.assertEqual(streamed, expected)
+        self.assertEqual(engine.bars, 1800)
+
+        last = calculate_technical_indicators(frames['A'].copy()).iloc[-1]
+        self.assertAlmostEqual(engine.snapshot('A')['RSI'], last['RSI'],
+                               places=8)
+
+    def test_queue_source(self):
+        frames = make_frames(2, 200)
+        expected = StreamingEngine()
+        expected_alerts = [a for bar in replay_bars(frames)
+                           for a in expected.update(bar)]
+
+        async def run():
+            queue, alerts = asyncio.Queue(), []
+            engine = StreamingEngine(on_alert=alerts.append)
+            consumer = asyncio.create_task(engine.run(queue_source(queue)))
+            for bar in replay_bars(frames):
+                await queue.put(bar)
+            await queue.put(None)
+            await consumer
+            return alerts
+
+        self.assertEqual(asyncio.run(run()), expected_alerts)
+
+    def test_socket_source(self):
+        frames = make_frames(2, 150)
+        bars = list(replay_bars(frames))
+
+        async def serve(reader, writer):
+            for bar in bars:
+                writer.write((bar.to_json() + '\n').encode())
+            await writer.drain()
+            writer.close()
+
+        async def run():
+            server = await asyncio.start_server(serve, '127.0.0.1', 0)
+            port = server.sockets[0].getsockname()[1]
+            engine = StreamingEngine()
+            async with server:
+                await engine.run(socket_source('127.0.0.1', port))
+            return engine
+
+        engine = asyncio.run(run())
+        self.assertEqual(engine.bars, len(bars))
+        reference = StreamingEngine()
+        for bar in bars:
+            reference.update(bar)
+        for ticker in frames:
+            self.assertEqual(engine.snapshot(ticker),
+                             reference.snapshot(ticker))
+
+    def test_replay_from_csv_directory(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            for ticker, df in make_frames(2, 50).items():
+                df.to_csv(os.path.join(tmp, f"{ticker}_historical_data.csv"))
+            bars = list(replay_bars(tmp))
+        self.assertEqual(len(bars), 100)
+        self.assertTrue(all(a.time <= b.time for a, b in zip(bars, bars[1:])))
+        self.assertIsInstance(bars[0], Bar)
+
+    def test_per_bar_latency_is_sub_millisecond(self):
+        tickers = make_tickers(1000)
+        rng = np.random.default_rng(0)
+        closes = 50 * np.exp(np.cumsum(rng.normal(0, 0.02, (40, 1000)), axis=0))
+        dates = pd.bdate_range('2024-01-01', periods=40)
+
+        async def feed():
+            for i, day in enumerate(dates):
+                for j, ticker in enumerate(tickers):
+                    c = closes[i, j]
+                    yield Bar(ticker, day, c, c, c, c, 1000.0)
+                await asyncio.sleep(0)
+
+        engine = StreamingEngine()
+        stats = asyncio.run(engine.run(feed()))
+        self.assertEqual(stats['bars'], 40_000)
+        self.assertEqual(len(engine.tickers), 1000)
+        self.assertLess(stats['p99_us'], 1000.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
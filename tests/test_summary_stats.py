@@ -0,0 +1,99 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from src.analysis.summary_stats import QuantileSketch, summarize
+from src.data_analyzer import get_summary_statistics
+
+ACCURACY = 0.01
+
+
+def within_bound(estimate, exact, lo, hi, accuracy=ACCURACY):
+    # The documented bound: relative to the exact percentile, or to the
+    # larger neighbouring order statistic when they straddle zero.
+    scale = abs(exact) if lo * hi >= 0 else max(abs(lo), abs(hi))
+    return abs(estimate - exact) <= accuracy * scale + 1e-12
+
+
+class TestQuantileSketch(unittest.TestCase):
+    def test_quantiles_within_relative_accuracy(self):
+        rng = np.random.default_rng(1)
+        x = np.concatenate([rng.lognormal(2, 2, 5000),
+                            -rng.lognormal(0, 1, 2000), np.zeros(300)])
+        sketch = QuantileSketch(ACCURACY).update(x)
+        ordered = np.sort(x)
+        for q in (0.0, 0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99, 1.0):
+            rank = q * (len(x) - 1)
+            lo, hi = ordered[int(np.floor(rank))], ordered[int(np.ceil(rank))]
+            exact = np.quantile(x, q)
+            self.assertTrue(within_bound(sketch.quantile(q), exact, lo, hi),
+                            (q, sketch.quantile(q), exact))
+
+    def test_merge_equals_single_pass(self):
+        rng = np.random.default_rng(2)
+        x = rng.normal(10, 3, 4000)
+        whole = QuantileSketch().update(x)
+        merged = QuantileSketch().update(x[:1000]).merge(
+            QuantileSketch().update(x[1000:]))
+        for q in (0.25, 0.5, 0.75):
+            self.assertEqual(whole.quantile(q), merged.quantile(q))
+
+
+class TestSummarize(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(3)
+        self.df = pd.DataFrame({
+            'Close': rng.lognormal(4, 1, 20_000),
+            'Return': rng.normal(0.001, 0.02, 20_000),
+            'Volume': rng.integers(1_000, 1_000_000, 20_000),
+            'Ticker': 'AAPL',
+        })
+        self.df.loc[::11, 'Return'] = np.nan
+
+    def assert_matches_describe(self, out):
+        exact = self.df.describe()
+        self.assertEqual(list(out.index), list(exact.index))
+        self.assertEqual(list(out.columns), list(exact.columns))
+        moments = ['count', 'mean', 'std', 'min', 'max']
+        np.testing.assert_allclose(out.loc[moments], exact.loc[moments],
+                                   rtol=1e-10)
+        for column in exact:
+            ordered = np.sort(self.df[column].dropna().to_numpy(float))
+            for label, q in (('25%', 0.25), ('50%', 0.5), ('75%', 0.75)):
+                rank = q * (len(ordered) - 1)
+                lo = ordered[int(np.floor(rank))]
+                hi = ordered[int(np.ceil(rank))]
+                self.assertTrue(within_bound(out.loc[label, column],
+                                             exact.loc[label, column], lo, hi),
+                                (column, label))
+        self.assertEqual(out.attrs['relative_accuracy'], ACCURACY)
+
+    def test_chunk_iterator(self):
+        chunks = (self.df.iloc[i:i + 3000] for i in range(0, len(self.df), 3000))
+        self.assert_matches_describe(get_summary_statistics(chunks))
+
+    def test_thread_and_process_pools(self):
+        for executor in ('thread', 'process'):
+            with self.subTest(executor=executor):
+                self.assert_matches_describe(summarize(
+                    self.df, chunksize=4000, max_workers=2,
+                    executor=executor))
+
+    def test_columnar_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            parquet = os.path.join(tmp, 'prices.parquet')
+            self.df.to_parquet(parquet, row_group_size=5000)
+            self.assert_matches_describe(summarize(parquet, chunksize=2500))
+            feather = os.path.join(tmp, 'prices.feather')
+            self.df.to_feather(feather)
+            out = summarize(feather, columns=['Close'], chunksize=2500)
+            self.assertEqual(list(out.columns), ['Close'])
+
+    def test_dataframe_keeps_exact_describe(self):
+        pd.testing.assert_frame_equal(get_summary_statistics(self.df),
+                                      self.df.describe())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from src.analysis.text_analysis import TopicIndex, extract_topics
+
+
+class TestExtractTopics(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.df = pd.DataFrame({'headline': [
+            'Apple stock rises on strong earnings',
+            'Tesla shares fall after recall',
+            'Apple stock rises on strong earnings',
+            'Earnings season: banks report strong quarter',
+            None,
+        ]})
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_top_terms_match_dense_tfidf(self):
+        out = extract_topics(self.df, top_k=2, cache_dir=self.tmp.name)
+        index = TopicIndex.load(self.tmp.name)
+        dense = index.tfidf().toarray()
+        terms = np.asarray(index.terms)
+        for headline, top in zip(out['headline'], out['top_terms']):
+            if headline is None:
+                self.assertEqual(top, [])
+                continue
+            row = index.update(pd.Series([headline]))[0]
+            scores = dense[row]
+            best = sorted(np.nonzero(scores)[0],
+                          key=lambda j: (-scores[j], j))[:2]
+            self.assertEqual(top, list(terms[best]))
+
+    def test_only_new_headlines_are_indexed(self):
+        extract_topics(self.df, cache_dir=self.tmp.name)
+        before = TopicIndex.load(self.tmp.name)
+        more = pd.concat([self.df, pd.DataFrame(
+            {'headline': ['Apple earnings preview']})], ignore_index=True)
+        out = extract_topics(more, cache_dir=self.tmp.name)
+        after = TopicIndex.load(self.tmp.name)
+
+        self.assertEqual(after.n_docs, before.n_docs + 1)
+        self.assertIn('preview', after.terms)
+        self.assertEqual(after.terms[:len(before.terms)], before.terms)
+        self.assertEqual(len(out), len(more))
+
+    def test_without_cache(self):
+        out = extract_topics(self.df, use_cache=False)
+        self.assertEqual(out['top_terms'].iloc[0], out['top_terms'].iloc[2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import glob
+import os
+import tempfile
+import unittest
+import numpy as np
+from benchmarks.synthetic import make_ohlcv
+from scripts.technical_analysis import (calculate_technical_indicators,
+                                        load_stock_data)
+from scripts.universe import (INDICATOR_COLUMNS, compute_universe_indicators,
+                              ticker_files)
+
+TICKERS = ['TSLA', 'AAPL', 'MSFT']
+
+
+class TestUniverse(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.paths = {}
+        for i, ticker in enumerate(TICKERS):
+            path = os.path.join(self.tmp.name, f"{ticker}_historical_data.csv")
+            make_ohlcv(150 + 25 * i, seed=i).to_csv(path, index=False)
+            self.paths[ticker] = path
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_ticker_files_inputs(self):
+        expected = dict(sorted(self.paths.items()))
+        self.assertEqual(ticker_files(self.tmp.name).keys(), expected.keys())
+        self.assertEqual(ticker_files(list(self.paths.values())), expected)
+        self.assertEqual(list(ticker_files(self.paths)), sorted(TICKERS))
+        other = os.path.join(self.tmp.name, 'prices.csv')
+        self.assertEqual(list(ticker_files([other])), ['prices'])
+        with self.assertRaises(NotADirectoryError):
+            ticker_files(os.path.join(self.tmp.name, 'missing'))
+
+    def test_layout_and_sort_order(self):
+        result = compute_universe_indicators(self.tmp.name, max_workers=1)
+        # calculate_technical_indicators adds no SMA/EMA columns.
+        columns = [c for c in INDICATOR_COLUMNS if c not in ('SMA', 'EMA')]
+        self.assertEqual(list(result.columns), ['ticker', 'Date'] + columns)
+        self.assertEqual(list(result['ticker'].cat.categories),
+                         sorted(TICKERS))
+        self.assertEqual(list(result['ticker'].unique()), sorted(TICKERS))
+        for _, group in result.groupby('ticker', observed=True):
+            self.assertTrue(group['Date'].is_monotonic_increasing)
+        self.assertEqual(result.index.tolist(), list(range(len(result))))
+
+    def test_pool_matches_serial_per_ticker(self):
+        inputs = [self.tmp.name, list(self.paths.values()), self.paths]
+        for sources in inputs:
+            with self.subTest(sources=type(sources).__name__):
+                result = compute_universe_indicators(sources, max_workers=2,
+                                                     max_in_flight=2)
+                for ticker, path in self.paths.items():
+                    expected = calculate_technical_indicators(
+                        load_stock_data(path))
+                    got = result[result['ticker'] == ticker]
+                    self.assertEqual(len(got), len(expected))
+                    np.testing.assert_array_equal(
+                        got['Date'].to_numpy(), expected.index.to_numpy())
+                    for column in got.columns[2:]:
+                        np.testing.assert_array_equal(
+                            got[column].to_numpy(),
+                            expected[column].to_numpy())
+
+    def test_empty_directory_raises(self):
+        for path in glob.glob(os.path.join(self.tmp.name, '*.csv')):
+            os.remove(path)
+        with self.assertRaises(FileNotFoundError):
+            compute_universe_indicators(self.tmp.name, max_workers=1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,202 @@
+"""
+Headless batch rendering of per-ticker indicator charts.
+
+Interactive plotting builds a new figure for every chart and waits on
+``plt.show()``. Here each worker process switches matplotlib to the Agg
+backend, builds one figure template, and for every ticker only swaps the
+line data, rescales the axes and writes the image to disk. Workers get
+file paths and load their own ticker, so no DataFrames or figures cross
+process boundaries.
+"""
+import logging
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Callable, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from visualization.decimation import axes_point_budget, decimate
+from src.instrumentation import instrumented
+
+logger = logging.getLogger(__name__)
+
+HEADLESS_BACKEND = 'Agg'
+
+# One template per worker process, created on first use.
+_TEMPLATE = None
+
+
+def use_headless_backend() -> None:
+    """Switch matplotlib to the non-interactive Agg backend."""
+    import matplotlib
+    matplotlib.use(HEADLESS_BACKEND, force=True)
+
+
+class IndicatorChartTemplate:
+    """
+    Reusable price/SMA, RSI and MACD figure (the ``plot_technical_indicators``
+    layout) whose artists are updated in place for each ticker.
+
+    Lines are min/max decimated to the axes' pixel width unless
+    ``full_fidelity`` is set.
+
+    Args:
+        figsize (tuple): Figure size in inches.
+        dpi (int): Output resolution.
+        full_fidelity (bool): Draw every point.
+    """
+
+    def __init__(self, figsize=(12, 8), dpi: int = 100,
+                 full_fidelity: bool = False):
+        import matplotlib.pyplot as plt
+
+        self.full_fidelity = full_fidelity
+        self.fig, (self.ax_price, self.ax_rsi, self.ax_macd) = plt.subplots(
+            3, 1, figsize=figsize, dpi=dpi, sharex=True)
+        ax = self.ax_price
+        self.close, = ax.plot([], [], label='Close Price')
+        self.sma, = ax.plot([], [], label='20-day SMA')
+        ax.set_title('Stock Price and SMA')  # reserves room for the title
+        ax.legend(loc='upper left')
+
+        ax = self.ax_rsi
+        self.rsi, = ax.plot([], [], label='RSI', color='purple')
+        ax.axhline(70, linestyle='--', alpha=0.5, color='red')
+        ax.axhline(30, linestyle='--', alpha=0.5, color='green')
+        ax.set_ylim(0, 100)
+        ax.set_title('Relative Strength Index (RSI)')
+        ax.legend(loc='upper left')
+
+        ax = self.ax_macd
+        self.macd, = ax.plot([], [], label='MACD', color='blue')
+        self.signal, = ax.plot([], [], label='Signal Line', color='orange')
+        self.hist = None
+        ax.set_title('MACD')
+        ax.legend(loc='upper left')
+        self.fig.tight_layout()
+
+    def render(self, df: pd.DataFrame, title: str, path: str) -> str:
+        """
+        Draw one ticker's indicators and save the figure to ``path``.
+
+        Args:
+            df (pd.DataFrame): Date-indexed frame with ``Close``, ``SMA_20``,
+                ``RSI``, ``MACD``, ``MACD_Signal`` and ``MACD_Hist``.
+            title (str): Title of the price panel.
+            path (str): Output file; the format follows the extension.
+
+        Returns:
+            str: ``path``.
+        """
+        x = df.index.to_numpy()
+        budget = None if self.full_fidelity else axes_point_budget(
+            self.ax_price)
+        for line, column in ((self.close, 'Close'), (self.sma, 'SMA_20'),
+                             (self.rsi, 'RSI'), (self.macd, 'MACD'),
+                             (self.signal, 'MACD_Signal')):
+            line.set_data(*self._points(x, df[column], budget))
+
+        # A filled area replaces one bar artist per day.
+        if self.hist is not None:
+            self.hist.remove()
+        hx, hist = self._points(x, df['MACD_Hist'], budget)
+        self.hist = self.ax_macd.fill_between(hx, np.nan_to_num(hist), 0.0,
+                                              color='grey', alpha=0.3,
+                                              linewidth=0)
+
+        for ax in (self.ax_price, self.ax_macd):
+            ax.relim()
+            ax.autoscale_view()
+        if len(x):
+            self.ax_rsi.set_xlim(x[0], x[-1])
+        self.ax_price.set_title(title)
+        self.fig.savefig(path)
+        return path
+
+    @staticmethod
+    def _points(x, values, budget):
+        y = values.to_numpy(dtype=float)
+        if budget is None:
+            return x, y
+        return decimate(x, y, budget)
+
+    def close_figure(self) -> None:
+        import matplotlib.pyplot as plt
+        plt.close(self.fig)
+
+
+@instrumented
+def render_ticker_reports(sources, output_dir: str, fmt: str = 'png',
+                          indicator_func: Optional[Callable] = None,
+                          max_workers: Optional[int] = None,
+                          max_in_flight: Optional[int] = None,
+                          dpi: int = 100) -> Dict[str, str]:
+    """
+    Render one indicator chart per ticker file into ``output_dir``.
+
+    Args:
+        sources: Directory of ``<TICKER>_historical_data.csv`` files, list
+            of paths or ticker->path mapping.
+        output_dir (str): Directory for the images (created if missing).
+        fmt (str): Image format / file extension.
+        indicator_func (callable, optional): Adds the indicator columns to a
+            price DataFrame; defaults to ``calculate_technical_indicators``.
+            Must be picklable.
+        max_workers (int, optional): Pool size; defaults to the CPU count.
+            ``1`` renders in-process.
+        max_in_flight (int, optional): Tickers submitted but not finished.
+            Defaults to twice the pool size.
+        dpi (int): Output resolution.
+
+    Returns:
+        dict: Ticker -> image path.
+    """
+    from scripts.universe import ticker_files
+
+    files = ticker_files(sources)
+    os.makedirs(output_dir, exist_ok=True)
+    jobs = [(ticker, path, os.path.join(output_dir, f"{ticker}.{fmt}"))
+            for ticker, path in files.items()]
+    workers = max_workers or os.cpu_count() or 1
+
+    outputs = {}
+    if workers == 1:
+        use_headless_backend()
+        for ticker, path, out in jobs:
+            outputs[ticker] = _render_ticker(ticker, path, out,
+                                             indicator_func, dpi)
+    else:
+        limit = max_in_flight or 2 * workers
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=use_headless_backend) as pool:
+            running = {}
+            for ticker, path, out in jobs:
+                future = pool.submit(_render_ticker, ticker, path, out,
+                                     indicator_func, dpi)
+                running[future] = ticker
+                if len(running) >= limit:
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for f in done:
+                        outputs[running.pop(f)] = f.result()
+            for f in list(running):
+                outputs[running.pop(f)] = f.result()
+
+    logger.info(f"Rendered {len(outputs)} ticker charts to {output_dir} "
+                f"with {workers} worker(s)")
+    return dict(sorted(outputs.items()))
+
+
+def _render_ticker(ticker: str, path: str, out: str,
+                   indicator_func: Optional[Callable], dpi: int) -> str:
+    global _TEMPLATE
+    from scripts.technical_analysis import (calculate_technical_indicators,
+                                            load_stock_data)
+
+    df = (indicator_func or calculate_technical_indicators)(
+        load_stock_data(path))
+    if _TEMPLATE is None or _TEMPLATE.fig.dpi != dpi:
+        if _TEMPLATE is not None:
+            _TEMPLATE.close_figure()
+        _TEMPLATE = IndicatorChartTemplate(dpi=dpi)
+    return _TEMPLATE.render(df, f'{ticker} Price and SMA', out)
@@ -0,0 +1,139 @@
+"""
+Shape-preserving downsampling of long series before they are drawn.
+
+A line plot cannot show more detail than its width in pixels. Min/max
+decimation keeps the lowest and highest point of every pixel-wide bucket,
+so spikes and the visual envelope survive exactly; LTTB (largest triangle
+three buckets) keeps one visually significant point per bucket and suits
+smooth series. Both return indices into the input, so dates, categorical
+x values and several y columns can be sliced consistently.
+"""
+import math
+from typing import Optional, Tuple
+
+import numpy as np
+
+METHODS = ('minmax', 'lttb')
+# Fallback when the axes size is unknown: a 12 inch wide figure at 100 dpi.
+DEFAULT_PIXELS = 1200
+
+
+def minmax_indices(y, n_buckets: int) -> np.ndarray:
+    """
+    Indices of the first, last, minimum and maximum point of each bucket.
+
+    NaNs are ignored when picking extremes; a bucket that is entirely NaN
+    keeps its first point so gaps still break the line.
+
+    Args:
+        y (array-like): Values, 1-D.
+        n_buckets (int): Number of equal-width buckets.
+
+    Returns:
+        np.ndarray: Sorted unique indices (at most ``2 * n_buckets + 2``).
+    """
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n_buckets <= 0 or n <= 2 * n_buckets + 2:
+        return np.arange(n)
+    size = math.ceil(n / n_buckets)
+    rows = math.ceil(n / size)
+    padded = np.full(rows * size, np.nan)
+    padded[:n] = y
+    blocks = padded.reshape(rows, size)
+    missing = np.isnan(blocks)
+    low = np.where(missing, np.inf, blocks).argmin(axis=1)
+    high = np.where(missing, -np.inf, blocks).argmax(axis=1)
+    starts = np.arange(rows) * size
+    picks = np.concatenate([[0, n - 1], starts + low, starts + high])
+    return np.unique(picks[picks < n])
+
+
+def lttb_indices(x, y, n_out: int) -> np.ndarray:
+    """
+    Largest-triangle-three-buckets selection of ``n_out`` points.
+
+    Args:
+        x (array-like): Positions (numeric or datetime64), 1-D, increasing.
+        y (array-like): Values; NaN points are skipped.
+        n_out (int): Number of points to keep, including both ends.
+
+    Returns:
+        np.ndarray: Sorted indices into the input.
+    """
+    x = _as_float(x)
+    y = np.asarray(y, dtype=np.float64)
+    valid = np.flatnonzero(~np.isnan(y))
+    if n_out >= len(valid) or n_out < 3:
+        return valid
+    xv, yv = x[valid], y[valid]
+    edges = np.linspace(1, len(valid) - 1, n_out - 1).astype(np.int64)
+    chosen = np.empty(n_out, dtype=np.int64)
+    chosen[0], chosen[-1] = 0, len(valid) - 1
+    prev = 0
+    for b in range(n_out - 2):
+        lo, hi = edges[b], max(edges[b + 1], edges[b] + 1)
+        nxt_lo, nxt_hi = hi, edges[b + 2] if b + 2 < len(edges) else len(valid)
+        avg_x = xv[nxt_lo:nxt_hi].mean()
+        avg_y = yv[nxt_lo:nxt_hi].mean()
+        area = np.abs((xv[prev] - avg_x) * (yv[lo:hi] - yv[prev])
+                      - (xv[prev] - xv[lo:hi]) * (avg_y - yv[prev]))
+        prev = lo + int(area.argmax())
+        chosen[b + 1] = prev
+    return valid[np.unique(chosen)]
+
+
+def decimate(x, y, max_points: Optional[int] = None,
+             method: str = 'minmax') -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Downsample ``(x, y)`` to at most about ``max_points`` points.
+
+    Args:
+        x (array-like): Positions.
+        y (array-like): Values.
+        max_points (int, optional): Point budget; defaults to two points per
+            pixel of ``DEFAULT_PIXELS``. Series within the budget are
+            returned unchanged.
+        method (str): ``'minmax'`` or ``'lttb'``.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The kept x and y values.
+    """
+    x, y = np.asarray(x), np.asarray(y)
+    idx = decimate_indices(x, y, max_points, method)
+    return x[idx], y[idx]
+
+
+def decimate_indices(x, y, max_points: Optional[int] = None,
+                     method: str = 'minmax') -> np.ndarray:
+    """Indices kept by ``decimate``."""
+    if method not in METHODS:
+        raise ValueError(f"Unknown decimation method '{method}', expected "
+                         f"one of {METHODS}")
+    max_points = max_points or 2 * DEFAULT_PIXELS
+    if len(y) <= max_points:
+        return np.arange(len(y))
+    if method == 'lttb':
+        return lttb_indices(x, y, max_points)
+    return minmax_indices(y, max(1, (max_points - 2) // 2))
+
+
+def axes_point_budget(ax=None) -> int:
+    """Two points per horizontal pixel of ``ax`` (or the current axes)."""
+    try:
+        if ax is None:
+            import matplotlib.pyplot as plt
+            ax = plt.gca()
+        width = ax.get_window_extent().width
+    except Exception:
+        width = DEFAULT_PIXELS
+    return 2 * max(int(width), 1)
+
+
+def _as_float(x) -> np.ndarray:
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64):
+        return x.astype('datetime64[ns]').astype(np.int64).astype(np.float64)
+    if x.dtype == object:
+        return np.arange(len(x), dtype=np.float64)
+    return x.astype(np.float64)
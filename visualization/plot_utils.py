@@ -1,41 +1,52 @@
-import matplotlib.pyplot as plt
-import seaborn as sns
+import numpy as np
+from visualization.decimation import axes_point_budget, decimate
+from src.instrumentation import instrumented
+from src.lazy import lazy_import
 
-def plot_publication_trend(daily_counts):
+plt = lazy_import('matplotlib.pyplot')
+sns = lazy_import('seaborn')
+
+@instrumented
+def plot_publication_trend(daily_counts, save_path='publication_trend.png', show=True):
     """Plot article publication frequency over time."""
     plt.figure(figsize=(10, 6))
     daily_counts.plot()
     plt.title('Article Publication Frequency Over Time')
     plt.xlabel('Date')
     plt.ylabel('Number of Articles')
-    plt.savefig('publication_trend.png')
-    plt.show()
-    plt.close()
+    finish_figure(save_path, show)
 
-def plot_publisher_domains(domain_counts):
+@instrumented
+def plot_publisher_domains(domain_counts, save_path='publisher_domains.png', show=True):
     """Plot top publisher domains."""
     plt.figure(figsize=(10, 6))
     sns.barplot(x=domain_counts.head(10).values, y=domain_counts.head(10).index)
     plt.title('Top 10 Publisher Domains')
     plt.xlabel('Number of Articles')
-    plt.savefig('publisher_domains.png')
-    plt.show()
-    plt.close()
+    finish_figure(save_path, show)
+
+@instrumented
+def plot_technical_indicators(df, save_path='technical_indicators.png', show=True,
+                              full_fidelity=False):
+    """
+    Visualize stock price and technical indicators.
 
-def plot_technical_indicators(df):
-    """Visualize stock price and technical indicators."""
+    Lines are min/max decimated to the figure's pixel width and the MACD
+    histogram is a filled area. ``full_fidelity=True`` draws every point
+    and one bar per day instead.
+    """
     plt.figure(figsize=(12, 8))
     
     # Plot Close Price and SMA
     plt.subplot(3, 1, 1)
-    plt.plot(df.index, df['Close'], label='Close Price')
-    plt.plot(df.index, df['SMA_20'], label='20-day SMA')
+    _plot(df.index, df['Close'], full_fidelity, label='Close Price')
+    _plot(df.index, df['SMA_20'], full_fidelity, label='20-day SMA')
     plt.title('Stock Price and SMA')
     plt.legend()
     
     # Plot RSI
     plt.subplot(3, 1, 2)
-    plt.plot(df.index, df['RSI'], label='RSI', color='purple')
+    _plot(df.index, df['RSI'], full_fidelity, label='RSI', color='purple')
     plt.axhline(70, linestyle='--', alpha=0.5, color='red')
     plt.axhline(30, linestyle='--', alpha=0.5, color='green')
     plt.title('Relative Strength Index (RSI)')
@@ -43,13 +54,33 @@ def plot_technical_indicators(df):
     
     # Plot MACD
     plt.subplot(3, 1, 3)
-    plt.plot(df.index, df['MACD'], label='MACD', color='blue')
-    plt.plot(df.index, df['MACD_Signal'], label='Signal Line', color='orange')
-    plt.bar(df.index, df['MACD_Hist'], label='MACD Histogram', color='grey', alpha=0.3)
+    _plot(df.index, df['MACD'], full_fidelity, label='MACD', color='blue')
+    _plot(df.index, df['MACD_Signal'], full_fidelity, label='Signal Line', color='orange')
+    if full_fidelity:
+        plt.bar(df.index, df['MACD_Hist'], label='MACD Histogram', color='grey', alpha=0.3)
+    else:
+        x, hist = _decimated(df.index, df['MACD_Hist'])
+        plt.fill_between(x, np.nan_to_num(hist.astype(float)), 0, label='MACD Histogram',
+                         color='grey', alpha=0.3, linewidth=0)
     plt.title('MACD')
     plt.legend()
     
     plt.tight_layout()
-    plt.savefig('technical_indicators.png')
-    plt.show()
-    plt.close()
\ No newline at end of file
+    finish_figure(save_path, show)
+
+def _decimated(x, y):
+    """Min/max decimate a series to the current axes' pixel width."""
+    return decimate(np.asarray(x), np.asarray(y), axes_point_budget())
+
+def _plot(x, y, full_fidelity, **kwargs):
+    if not full_fidelity:
+        x, y = _decimated(x, y)
+    plt.plot(x, y, **kwargs)
+
+def finish_figure(save_path=None, show=True):
+    """Save and/or show the current figure, then release it."""
+    if save_path:
+        plt.savefig(save_path)
+    if show:
+        plt.show()
+    plt.close()